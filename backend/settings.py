@@ -3,6 +3,7 @@ from dotenv import load_dotenv
 import os
 import sys
 import dj_database_url
+from celery.schedules import crontab
 from corsheaders.defaults import default_headers
 
 load_dotenv()
@@ -267,6 +268,12 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Europe/Dublin"
+CELERY_BEAT_SCHEDULE = {
+    "growth-evidence-compaction": {
+        "task": "growth_ops.tasks.compact_evidence_task",
+        "schedule": crontab(hour=3, minute=30, day_of_week="sun"),
+    },
+}
 
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -6,11 +6,14 @@ from django.utils import timezone
 from .models import (
     Contact,
     ContentItem,
+    EvidenceChangeLog,
     InboxMessage,
     Lead,
+    LeadFeatures,
     LeadScore,
     OutboundDraft,
     OutboundSend,
+    PageSpeedCacheEntry,
     PromptLog,
     Sequence,
     WebsiteEvidence,
@@ -78,6 +81,31 @@ class DraftReadinessFilter(admin.SimpleListFilter):
         return queryset
 
 
+class MobilePerformanceFilter(admin.SimpleListFilter):
+    title = "Mobile Performance"
+    parameter_name = "mobile_perf"
+
+    def lookups(self, request, model_admin):
+        return (
+            ("low", "Low (< 70)"),
+            ("needs_improvement", "Needs improvement (70-89)"),
+            ("good", "Good (90+)"),
+            ("unknown", "Unknown"),
+        )
+
+    def queryset(self, request, queryset):
+        field = "features__perf_score" if queryset.model is Lead else "perf_score"
+        if self.value() == "low":
+            return queryset.filter(**{f"{field}__lt": 70})
+        if self.value() == "needs_improvement":
+            return queryset.filter(**{f"{field}__gte": 70, f"{field}__lt": 90})
+        if self.value() == "good":
+            return queryset.filter(**{f"{field}__gte": 90})
+        if self.value() == "unknown":
+            return queryset.filter(**{f"{field}__isnull": True})
+        return queryset
+
+
 class ContactInline(admin.TabularInline):
     model = Contact
     extra = 0
@@ -90,7 +118,16 @@ class ContactInline(admin.TabularInline):
 class LeadAdmin(admin.ModelAdmin):
     list_display = ("company_name", "market", "industry", "status", "website_url", "created_at")
     search_fields = ("company_name", "website_url", "google_place_id", "location", "industry")
-    list_filter = ("market", "status", "industry", "source")
+    list_filter = (
+        "market",
+        "status",
+        "industry",
+        "source",
+        "features__site_type",
+        "features__cta_clarity",
+        "features__trust_rating",
+        MobilePerformanceFilter,
+    )
     readonly_fields = ("created_at", "updated_at")
     inlines = [ContactInline]
 
@@ -113,6 +150,24 @@ class WebsiteEvidenceAdmin(admin.ModelAdmin):
     readonly_fields = ("created_at",)
 
 
+@admin.register(EvidenceChangeLog)
+class EvidenceChangeLogAdmin(admin.ModelAdmin):
+    list_display = ("id", "lead", "evidence_type", "fingerprint_changed", "evidence", "created_at")
+    search_fields = ("lead__company_name", "evidence_type", "fingerprint")
+    list_filter = ("evidence_type", "fingerprint_changed", "created_at")
+    autocomplete_fields = ("lead",)
+    raw_id_fields = ("evidence",)
+    readonly_fields = ("created_at",)
+
+
+@admin.register(PageSpeedCacheEntry)
+class PageSpeedCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ("id", "normalized_url", "strategy", "fetched_at", "created_at")
+    search_fields = ("normalized_url",)
+    list_filter = ("strategy", "fetched_at")
+    readonly_fields = ("created_at",)
+
+
 @admin.register(WebsiteReport)
 class WebsiteReportAdmin(admin.ModelAdmin):
     list_display = ("id", "lead", "model", "prompt_version", "created_at")
@@ -122,6 +177,32 @@ class WebsiteReportAdmin(admin.ModelAdmin):
     autocomplete_fields = ("lead",)
 
 
+@admin.register(LeadFeatures)
+class LeadFeaturesAdmin(admin.ModelAdmin):
+    list_display = (
+        "lead",
+        "site_type",
+        "perf_score",
+        "lcp_ms",
+        "cta_clarity",
+        "trust_rating",
+        "cms_value",
+        "updated_at",
+    )
+    search_fields = ("lead__company_name", "cms_value")
+    list_filter = (
+        "site_type",
+        "cta_clarity",
+        "trust_rating",
+        "sitemap_marked_missing",
+        "has_contact_method",
+        MobilePerformanceFilter,
+    )
+    readonly_fields = ("updated_at",)
+    autocomplete_fields = ("lead",)
+    raw_id_fields = ("report",)
+
+
 @admin.register(LeadScore)
 class LeadScoreAdmin(admin.ModelAdmin):
     list_display = ("id", "lead", "score", "bucket", "created_at")
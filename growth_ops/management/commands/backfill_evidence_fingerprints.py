@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from growth_ops.models import WebsiteEvidence
+from growth_ops.services.evidence_ingest import evidence_fingerprint
+
+
+class Command(BaseCommand):
+    help = "Fill WebsiteEvidence.fingerprint for rows written before the column existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows updated per query (default: 500).")
+        parser.add_argument(
+            "--recompute",
+            action="store_true",
+            help="Recompute every row, e.g. after evidence canonicalization rules change.",
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        batch_size = int(options["batch_size"])
+        if batch_size < 1:
+            raise CommandError("--batch-size must be >= 1.")
+
+        queryset = WebsiteEvidence.objects.order_by("pk")
+        if not options["recompute"]:
+            queryset = queryset.filter(fingerprint="")
+
+        scanned = 0
+        updated = 0
+        last_pk = 0
+        while True:
+            # Keyset pagination: rows leave the blank-fingerprint filter as they are updated.
+            batch = list(
+                queryset.filter(pk__gt=last_pk).only("pk", "evidence_type", "payload", "fingerprint")[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            changed = []
+            for record in batch:
+                fingerprint = evidence_fingerprint(record.evidence_type, record.payload)
+                if record.fingerprint != fingerprint:
+                    record.fingerprint = fingerprint
+                    changed.append(record)
+            if changed:
+                WebsiteEvidence.objects.bulk_update(changed, ["fingerprint"])
+            scanned += len(batch)
+            updated += len(changed)
+            self.stdout.write(f"batch through id={last_pk}: scanned={len(batch)} updated={len(changed)}")
+
+        self.stdout.write("")
+        self.stdout.write(self.style.SUCCESS("Evidence fingerprint backfill complete."))
+        self.stdout.write(f"rows_scanned: {scanned}")
+        self.stdout.write(f"rows_updated: {updated}")
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError
+
+from growth_ops.services.html_signals import build_depth_index, dom_depth_until, parse_homepage_signals
+
+
+def synthetic_link_heavy_page(*, chars: int, anchors: int) -> str:
+    """Nested navigation markup with `anchors` CTA-like links, padded to `chars` characters."""
+    head = "<html><head><title>Benchmark Gym Galway</title></head><body><header><nav><ul>"
+    links = "".join(
+        f'<li><div><a href="/p{index}" class="btn">Book</a></div></li>'
+        for index in range(anchors)
+    )
+    tail = "</ul></nav></header><main><section><h1>Benchmark</h1></section></main></body></html>"
+    padding = max(0, chars - len(head) - len(links) - len(tail))
+    return head + links + f"<p>{'x' * max(0, padding - 7)}</p>" + tail
+
+
+def _best_of(repeat: int, run: Callable[[], list[int]]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark CTA depth lookups: per-CTA re-tokenization (reference) against the "
+        "precomputed depth index, verifying identical depths."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chars", type=int, default=20000, help="Synthetic page size (default: 20000).")
+        parser.add_argument("--anchors", type=int, default=300, help="CTA anchors on the synthetic page (default: 300).")
+        parser.add_argument("--path", help="Benchmark this HTML file instead of the synthetic page.")
+        parser.add_argument("--repeat", type=int, default=5, help="Timing rounds; the best round is reported.")
+        parser.add_argument(
+            "--min-speedup",
+            type=float,
+            default=0.0,
+            help="Fail when the depth index speedup falls below this factor (regression gate).",
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        repeat = int(options["repeat"])
+        if repeat < 1:
+            raise CommandError("--repeat must be >= 1.")
+
+        if options.get("path"):
+            try:
+                html = Path(options["path"]).read_text(encoding="utf-8", errors="replace")
+            except OSError as exc:
+                raise CommandError(f"Could not read {options['path']}: {exc}") from exc
+        else:
+            html = synthetic_link_heavy_page(chars=int(options["chars"]), anchors=int(options["anchors"]))
+
+        positions = [start for start, _attrs, _body in parse_homepage_signals(html).action_blocks]
+        if not positions:
+            raise CommandError("The document has no <a>/<button> blocks to look up.")
+
+        def reference() -> list[int]:
+            return [dom_depth_until(html, position) for position in positions]
+
+        def indexed() -> list[int]:
+            # Includes building the index, as the report does once per document.
+            index = build_depth_index(html)
+            return [index.depth_at(position) for position in positions]
+
+        if reference() != indexed():
+            raise CommandError("Depth index results differ from the reference lookups.")
+
+        reference_seconds = _best_of(repeat, reference)
+        indexed_seconds = _best_of(repeat, indexed)
+        speedup = reference_seconds / indexed_seconds if indexed_seconds else float("inf")
+
+        self.stdout.write(self.style.SUCCESS("CTA depth benchmark complete."))
+        self.stdout.write(f"document_chars: {len(html)}")
+        self.stdout.write(f"cta_lookups: {len(positions)}")
+        self.stdout.write(f"reference_seconds: {reference_seconds:.6f}")
+        self.stdout.write(f"indexed_seconds: {indexed_seconds:.6f}")
+        self.stdout.write(f"speedup: {speedup:.2f}x")
+        if speedup < float(options["min_speedup"]):
+            raise CommandError(f"Speedup {speedup:.2f}x is below --min-speedup {options['min_speedup']}.")
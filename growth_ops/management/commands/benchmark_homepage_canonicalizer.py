@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError
+
+from growth_ops.models import WebsiteEvidence
+from growth_ops.services.evidence_ingest import (
+    _normalize_homepage_html_for_dedupe,
+    _normalize_homepage_html_sequential,
+    _strip_homepage_html_single_pass,
+)
+
+
+def _best_of(repeat: int, corpus: list[str], normalize: Callable[[str], tuple[str, str]]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for html in corpus:
+            normalize(html)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the single-pass homepage canonicalizer against the multi-pass reference "
+        "over stored homepage snippets (and/or HTML files), verifying identical output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=500, help="Stored homepage snippets to load (default: 500).")
+        parser.add_argument(
+            "--path",
+            action="append",
+            default=[],
+            help="HTML file or directory of *.html files to add to the corpus (repeatable).",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Timing rounds; the best round is reported.")
+        parser.add_argument(
+            "--min-speedup",
+            type=float,
+            default=0.0,
+            help="Fail when the single-pass speedup falls below this factor (regression gate).",
+        )
+
+    def _load_corpus(self, limit: int, paths: list[str]) -> list[str]:
+        corpus = [
+            str(payload.get("body") or "")
+            for payload in WebsiteEvidence.objects.filter(evidence_type="homepage_html_snippet")
+            .order_by("-created_at")
+            .values_list("payload", flat=True)[:limit]
+            if isinstance(payload, dict) and payload.get("body")
+        ]
+        for raw_path in paths:
+            path = Path(raw_path)
+            files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+            for file_path in files:
+                try:
+                    corpus.append(file_path.read_text(encoding="utf-8", errors="replace"))
+                except OSError as exc:
+                    raise CommandError(f"Could not read {file_path}: {exc}") from exc
+        return corpus
+
+    def handle(self, *args: Any, **options: Any):
+        repeat = int(options["repeat"])
+        if repeat < 1:
+            raise CommandError("--repeat must be >= 1.")
+
+        corpus = self._load_corpus(int(options["limit"]), list(options["path"]))
+        if not corpus:
+            raise CommandError("No homepage snippets found; collect evidence first or pass --path.")
+
+        mismatches = [
+            index
+            for index, html in enumerate(corpus)
+            if _normalize_homepage_html_for_dedupe(html) != _normalize_homepage_html_sequential(html)
+        ]
+        if mismatches:
+            raise CommandError(f"Single-pass output differs from the reference for documents {mismatches[:10]}.")
+        fallbacks = sum(1 for html in corpus if _strip_homepage_html_single_pass(html) is None)
+
+        sequential_seconds = _best_of(repeat, corpus, _normalize_homepage_html_sequential)
+        single_pass_seconds = _best_of(repeat, corpus, _normalize_homepage_html_for_dedupe)
+        speedup = sequential_seconds / single_pass_seconds if single_pass_seconds else float("inf")
+
+        self.stdout.write(self.style.SUCCESS("Homepage canonicalizer benchmark complete."))
+        self.stdout.write(f"documents: {len(corpus)}")
+        self.stdout.write(f"corpus_chars: {sum(len(html) for html in corpus)}")
+        self.stdout.write(f"sequential_fallbacks: {fallbacks}")
+        self.stdout.write(f"sequential_seconds: {sequential_seconds:.6f}")
+        self.stdout.write(f"single_pass_seconds: {single_pass_seconds:.6f}")
+        self.stdout.write(f"speedup: {speedup:.2f}x")
+        if speedup < float(options["min_speedup"]):
+            raise CommandError(f"Speedup {speedup:.2f}x is below --min-speedup {options['min_speedup']}.")
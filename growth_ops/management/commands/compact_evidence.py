@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from growth_ops.models import Lead
+from growth_ops.services.evidence_retention import DEFAULT_BATCH_SIZE, compact_evidence, keep_latest_default
+
+
+class Command(BaseCommand):
+    help = (
+        "Compact WebsiteEvidence history: keep the latest N rows per (type, url, tool) group and any row "
+        "referenced by a report or draft proof point; replace other payloads with a fingerprint stub."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-latest",
+            type=int,
+            default=None,
+            help="Rows kept intact per evidence group (default: GROWTH_EVIDENCE_KEEP_LATEST or 3).",
+        )
+        parser.add_argument("--lead-id", type=int, action="append", default=[], help="Limit to these lead ids.")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows updated per query.")
+        parser.add_argument("--dry-run", action="store_true", help="Report what would be reclaimed without writing.")
+
+    def handle(self, *args: Any, **options: Any):
+        keep_latest = options["keep_latest"]
+        if keep_latest is not None and keep_latest < 1:
+            raise CommandError("--keep-latest must be >= 1.")
+        batch_size = int(options["batch_size"])
+        if batch_size < 1:
+            raise CommandError("--batch-size must be >= 1.")
+        dry_run = bool(options["dry_run"])
+
+        self.stdout.write(
+            self.style.NOTICE(
+                f"Compacting evidence: keep_latest={keep_latest or keep_latest_default()} dry_run={dry_run}"
+            )
+        )
+
+        def report_lead(lead: Lead, summary: dict[str, int]) -> None:
+            if summary["rows_compacted"]:
+                self.stdout.write(
+                    f"lead_id={lead.id} {lead.company_name}: compacted={summary['rows_compacted']} "
+                    f"bytes_reclaimed={summary['bytes_reclaimed']}"
+                )
+
+        totals = compact_evidence(
+            keep_latest=keep_latest,
+            lead_ids=options["lead_id"] or None,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            on_lead=report_lead,
+        )
+
+        self.stdout.write("")
+        self.stdout.write(self.style.SUCCESS("Evidence compaction complete."))
+        self.stdout.write(f"leads_scanned: {totals['leads_scanned']}")
+        self.stdout.write(f"rows_compacted: {totals['rows_compacted']}")
+        self.stdout.write(f"bytes_reclaimed: {totals['bytes_reclaimed']}")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from growth_ops.models import Lead
+from growth_ops.services.lead_features import build_lead_features
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild LeadFeatures rows from stored evidence and reports, e.g. for leads "
+        "created before the table existed or after scoring extraction rules change."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lead-id",
+            type=int,
+            action="append",
+            dest="lead_ids",
+            help="Only rebuild this lead (repeatable).",
+        )
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only build leads that have no features row yet.",
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        leads = Lead.objects.order_by("pk")
+        if options.get("lead_ids"):
+            leads = leads.filter(pk__in=options["lead_ids"])
+        if options["missing_only"]:
+            leads = leads.filter(features__isnull=True)
+
+        rebuilt = 0
+        for lead in leads.iterator():
+            build_lead_features(lead)
+            rebuilt += 1
+
+        self.stdout.write(self.style.SUCCESS("Lead features refresh complete."))
+        self.stdout.write(f"leads_rebuilt: {rebuilt}")
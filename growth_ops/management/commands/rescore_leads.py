@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from growth_ops.models import Lead
+from growth_ops.services.scoring_pipeline import bulk_upsert_lead_scores
+from growth_ops.services.stage_timing import stage_timing_lines, stage_timings, timing_scope
+
+
+class Command(BaseCommand):
+    help = "Rescore leads against their current report in bulk, reusing equivalent stored scores."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lead-id",
+            type=int,
+            action="append",
+            dest="lead_ids",
+            help="Only rescore this lead (repeatable).",
+        )
+        parser.add_argument("--status", help="Only rescore leads with this status.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Leads scored per bulk pass (default: 1000).",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Write a new score even when an equivalent one already exists.",
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        chunk_size = int(options["chunk_size"])
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be >= 1.")
+
+        leads = Lead.objects.order_by("pk")
+        if options.get("lead_ids"):
+            leads = leads.filter(pk__in=options["lead_ids"])
+        if options.get("status"):
+            leads = leads.filter(status=options["status"])
+
+        scored = 0
+        created = 0
+        reused = 0
+        buckets: dict[str, int] = {}
+        last_pk = 0
+        stage_timings.reset()
+        while True:
+            # One timing sample per chunk: the bulk stages cover the whole chunk at once.
+            with timing_scope():
+                outcomes = bulk_upsert_lead_scores(leads.filter(pk__gt=last_pk)[:chunk_size], force=options["force"])
+            if not outcomes:
+                break
+            last_pk = outcomes[-1][0].pk
+            for _lead, score_record, score_created in outcomes:
+                scored += 1
+                created += int(score_created)
+                reused += int(not score_created)
+                buckets[score_record.bucket] = buckets.get(score_record.bucket, 0) + 1
+
+        self.stdout.write(self.style.SUCCESS("Lead rescore complete."))
+        self.stdout.write(f"leads_scored: {scored}")
+        self.stdout.write(f"scores_created: {created}")
+        self.stdout.write(f"scores_reused: {reused}")
+        for bucket, count in sorted(buckets.items()):
+            self.stdout.write(f"bucket[{bucket}]: {count}")
+        for line in stage_timing_lines():
+            self.stdout.write(line)
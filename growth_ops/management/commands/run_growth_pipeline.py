@@ -4,8 +4,18 @@ from typing import Any
 
 from django.core.management.base import BaseCommand, CommandError
 
-from growth_ops.services.evidence_fetcher import collect_basic_evidence, fetch_pagespeed
-from growth_ops.services.evidence_ingest import persist_evidence_items
+from growth_ops.models import Lead
+from growth_ops.services.evidence_fetcher import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_PER_HOST_CONCURRENCY,
+    collect_evidence_batch,
+    plan_evidence_batch,
+)
+from growth_ops.services.circuit_breaker import STATE_CLOSED, circuit_breaker
+from growth_ops.services.evidence_ingest import fetch_validators_for_lead, persist_evidence_items
+from growth_ops.services.http_session import pipeline_session_scope
+from growth_ops.services.pagespeed_cache import pagespeed_cache_stats
+from growth_ops.services.rate_limiter import quota_metrics
 from growth_ops.services.google_places import discover_place_candidates
 from growth_ops.services.lead_ingest import upsert_lead_from_candidate
 
@@ -22,11 +32,31 @@ class Command(BaseCommand):
             default=10,
             help="Maximum number of place candidates to process (default: 10).",
         )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=DEFAULT_BATCH_CONCURRENCY,
+            help=f"Maximum concurrent evidence fetches across all hosts (default: {DEFAULT_BATCH_CONCURRENCY}).",
+        )
+        parser.add_argument(
+            "--per-host-concurrency",
+            type=int,
+            default=DEFAULT_PER_HOST_CONCURRENCY,
+            help=f"Maximum concurrent evidence fetches per host (default: {DEFAULT_PER_HOST_CONCURRENCY}).",
+        )
+        parser.add_argument(
+            "--refresh-pagespeed",
+            action="store_true",
+            help="Bypass the PageSpeed cache and re-measure every website.",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         keyword: str = options["keyword"]
         location: str = options["location"]
         limit: int = max(1, options["limit"] or 10)
+        concurrency: int = max(1, options["concurrency"] or DEFAULT_BATCH_CONCURRENCY)
+        per_host_concurrency: int = max(1, options["per_host_concurrency"] or DEFAULT_PER_HOST_CONCURRENCY)
+        refresh_pagespeed: bool = bool(options.get("refresh_pagespeed"))
 
         try:
             candidates = discover_place_candidates(keyword=keyword, location=location, limit=limit)
@@ -38,6 +68,8 @@ class Command(BaseCommand):
         leads_skipped = 0
         evidence_created = 0
         evidence_reused = 0
+        evidence_not_modified = 0
+        evidence_revalidation_misses = 0
         failures = 0
 
         self.stdout.write(
@@ -46,6 +78,8 @@ class Command(BaseCommand):
             )
         )
 
+        # Upsert sequentially (DB writes), then fetch evidence for every lead concurrently.
+        upserted: list[tuple[str, Lead]] = []
         for index, candidate in enumerate(candidates, start=1):
             company_name = (candidate.get("company_name") or "").strip() or "unknown"
             website_url = (candidate.get("website_url") or "").strip()
@@ -61,26 +95,54 @@ class Command(BaseCommand):
 
             try:
                 lead, created = upsert_lead_from_candidate(candidate)
-                leads_processed += 1
-                self.stdout.write(
-                    f"{prefix}: lead_id={lead.id} {'created' if created else 'updated'}; website={lead.website_url}"
-                )
+            except Exception as exc:
+                failures += 1
+                self.stderr.write(self.style.ERROR(f"{prefix}: failed - {exc}"))
+                continue
+            leads_processed += 1
+            self.stdout.write(
+                f"{prefix}: lead_id={lead.id} {'created' if created else 'updated'}; website={lead.website_url}"
+            )
+            upserted.append((prefix, lead))
 
-                evidence_items = collect_basic_evidence(lead.website_url)
-                pagespeed_payload = fetch_pagespeed(lead.website_url)
-                evidence_items.append(
-                    {
-                        "evidence_type": "pagespeed_json",
-                        "url": lead.website_url,
-                        "tool": "pagespeed_api",
-                        "payload": pagespeed_payload,
-                    }
+        website_urls = [lead.website_url for _prefix, lead in upserted]
+        fetch_plan = plan_evidence_batch(website_urls)
+        if upserted:
+            self.stdout.write(
+                self.style.NOTICE(
+                    f"Collecting evidence for {len(upserted)} leads "
+                    f"(distinct_fetches={fetch_plan.fetches_planned}, saved={fetch_plan.fetches_saved}, "
+                    f"concurrency={concurrency}, per_host={per_host_concurrency})."
+                )
+            )
+        pagespeed_cache_stats.reset()
+        circuit_breaker.reset()
+        with pipeline_session_scope() as http_stats:
+            try:
+                evidence_batches = collect_evidence_batch(
+                    website_urls,
+                    max_concurrency=concurrency,
+                    per_host_limit=per_host_concurrency,
+                    validators=[fetch_validators_for_lead(lead) for _prefix, lead in upserted],
+                    refresh_pagespeed=refresh_pagespeed,
                 )
+            except Exception as exc:
+                raise CommandError(f"Evidence collection failed: {exc}") from exc
+            http_connections = http_stats.snapshot()
+        pagespeed_cache_counts = pagespeed_cache_stats.snapshot()
+        circuit_states = circuit_breaker.snapshot()
+
+        for (prefix, lead), evidence_items in zip(upserted, evidence_batches):
+            try:
                 summary = persist_evidence_items(lead=lead, items=evidence_items)
                 evidence_created += int(summary["created_count"])
                 evidence_reused += int(summary["reused_count"])
+                evidence_not_modified += int(summary["not_modified_count"])
+                evidence_revalidation_misses += int(summary["revalidation_miss_count"])
                 self.stdout.write(
-                    f"  evidence created={summary['created_count']} reused={summary['reused_count']}"
+                    f"{prefix}: evidence created={summary['created_count']} reused={summary['reused_count']} "
+                    f"not_modified={summary['not_modified_count']} "
+                    f"revalidation_miss={summary['revalidation_miss_count']}"
                 )
             except Exception as exc:
                 failures += 1
@@ -94,4 +156,27 @@ class Command(BaseCommand):
         self.stdout.write(f"leads_skipped: {leads_skipped}")
         self.stdout.write(f"evidence_created: {evidence_created}")
         self.stdout.write(f"evidence_reused: {evidence_reused}")
+        self.stdout.write(f"evidence_not_modified: {evidence_not_modified}")
+        self.stdout.write(f"evidence_revalidation_misses: {evidence_revalidation_misses}")
+        self.stdout.write(f"evidence_fetches_saved: {fetch_plan.fetches_saved}")
         self.stdout.write(f"failures: {failures}")
+        self.stdout.write(f"http_new_connections: {http_connections['new_connections']}")
+        self.stdout.write(f"http_reused_connections: {http_connections['reused_connections']}")
+        self.stdout.write(
+            f"pagespeed_cache_hits: {pagespeed_cache_counts['hits'] + pagespeed_cache_counts['stale_hits']}"
+        )
+        self.stdout.write(f"pagespeed_cache_misses: {pagespeed_cache_counts['misses']}")
+        self.stdout.write(
+            f"circuit_open_hosts: {sum(1 for state in circuit_states.values() if state['state'] != STATE_CLOSED)}"
+        )
+        for host, state in circuit_states.items():
+            self.stdout.write(
+                f"circuit[{host}]: state={state['state']} failures={state['consecutive_failures']} "
+                f"rejected={state['rejected']}"
+            )
+        for label, metrics in quota_metrics().items():
+            self.stdout.write(
+                f"quota[{label}]: requests={metrics['requests']} retries={metrics['retries']} "
+                f"throttled={metrics['throttled']} wait_seconds={metrics['total_wait_seconds']} "
+                f"max_queue_depth={metrics['max_queue_depth']}"
+            )
@@ -5,7 +5,9 @@ from typing import Any
 from django.core.management.base import BaseCommand, CommandError
 
 from growth_ops.models import Lead
-from growth_ops.services.scoring_pipeline import run_report_and_score_for_lead
+from growth_ops.services.evidence_changes import leads_changed_since
+from growth_ops.services.scoring_pipeline import run_report_and_score_batch
+from growth_ops.services.stage_timing import stage_timing_lines, stage_timings
 
 
 class Command(BaseCommand):
@@ -23,18 +25,52 @@ class Command(BaseCommand):
             type=int,
             help="Process a single lead by id (overrides default status selection).",
         )
+        parser.add_argument(
+            "--changed-since",
+            type=int,
+            help=(
+                "Process only leads whose evidence fingerprint changed after this change-feed cursor "
+                "(overrides default status selection); prints next_cursor to resume from."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Build reports in this many worker processes and overlap LLM gateway calls on as many "
+                "threads; DB writes stay in this process (default: 1, serial)."
+            ),
+        )
         parser.add_argument(
             "--force",
             action="store_true",
-            help="Regenerate report and score even when equivalent rows already exist.",
+            help=(
+                "Regenerate report and score even when equivalent rows already exist "
+                "(also bypasses the report memo, so the LLM gateway is called again)."
+            ),
         )
 
     def handle(self, *args: Any, **options: Any) -> None:
         limit: int = max(1, int(options.get("limit") or 20))
         lead_id: int | None = options.get("lead_id")
         force: bool = bool(options.get("force"))
+        changed_since: int | None = options.get("changed_since")
+        workers: int = int(options.get("workers") or 1)
+        next_cursor: int | None = None
+
+        if lead_id is not None and changed_since is not None:
+            raise CommandError("--lead-id and --changed-since cannot be combined.")
+        if changed_since is not None and changed_since < 0:
+            raise CommandError("--changed-since must be >= 0.")
+        if workers < 1:
+            raise CommandError("--workers must be >= 1.")
 
-        if lead_id is not None:
+        if changed_since is not None:
+            changed_lead_ids, next_cursor = leads_changed_since(changed_since, limit=limit)
+            leads_by_id = Lead.objects.in_bulk(changed_lead_ids)
+            queryset = [leads_by_id[pk] for pk in changed_lead_ids if pk in leads_by_id]
+        elif lead_id is not None:
             queryset = Lead.objects.filter(pk=lead_id).order_by("created_at")
             if not queryset.exists():
                 raise CommandError(f"Lead {lead_id} was not found.")
@@ -46,6 +82,7 @@ class Command(BaseCommand):
         leads_processed = 0
         reports_created = 0
         reports_reused = 0
+        reports_memoized = 0
         scores_created = 0
         scores_reused = 0
         failures = 0
@@ -56,36 +93,47 @@ class Command(BaseCommand):
             )
         )
 
-        for index, lead in enumerate(leads, start=1):
+        stage_timings.reset()
+        results = run_report_and_score_batch(leads, workers=workers, force=force)
+        for index, (lead, result, error) in enumerate(results, start=1):
             prefix = f"[{index}/{leads_considered}] lead_id={lead.id} {lead.company_name}"
-            try:
-                result = run_report_and_score_for_lead(lead, force=force)
-                leads_processed += 1
-                if result["report_created"]:
-                    reports_created += 1
-                else:
-                    reports_reused += 1
-                if result["score_created"]:
-                    scores_created += 1
-                else:
-                    scores_reused += 1
-                self.stdout.write(
-                    f"{prefix}: report_id={result['report_id']} "
-                    f"({'created' if result['report_created'] else 'reused'}), "
-                    f"score_id={result['score_id']} "
-                    f"({'created' if result['score_created'] else 'reused'})"
-                )
-            except Exception as exc:
+            if error is not None:
                 failures += 1
-                self.stderr.write(self.style.ERROR(f"{prefix}: failed - {exc}"))
+                self.stderr.write(self.style.ERROR(f"{prefix}: failed - {error}"))
                 continue
 
+            leads_processed += 1
+            if result["report_created"]:
+                reports_created += 1
+                report_state = "created"
+            else:
+                reports_reused += 1
+                report_state = "reused"
+            if result["report_memoized"]:
+                reports_memoized += 1
+                report_state = "memoized"
+            if result["score_created"]:
+                scores_created += 1
+            else:
+                scores_reused += 1
+            self.stdout.write(
+                f"{prefix}: report_id={result['report_id']} "
+                f"({report_state}), "
+                f"score_id={result['score_id']} "
+                f"({'created' if result['score_created'] else 'reused'})"
+            )
+
         self.stdout.write("")
         self.stdout.write(self.style.SUCCESS("Growth V2 pipeline complete."))
         self.stdout.write(f"leads_considered: {leads_considered}")
         self.stdout.write(f"leads_processed: {leads_processed}")
         self.stdout.write(f"reports_created: {reports_created}")
         self.stdout.write(f"reports_reused: {reports_reused}")
+        self.stdout.write(f"reports_memoized: {reports_memoized}")
         self.stdout.write(f"scores_created: {scores_created}")
         self.stdout.write(f"scores_reused: {scores_reused}")
         self.stdout.write(f"failures: {failures}")
+        if next_cursor is not None:
+            self.stdout.write(f"next_cursor: {next_cursor}")
+        for line in stage_timing_lines():
+            self.stdout.write(line)
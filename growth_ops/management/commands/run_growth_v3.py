@@ -5,8 +5,21 @@ from typing import Any
 from django.core.management.base import BaseCommand, CommandError
 from django.db.models import Max
 
-from growth_ops.models import Lead
+from growth_ops.models import Lead, LeadFeatures, WebsiteReport
+from growth_ops.services.circuit_breaker import STATE_CLOSED, circuit_breaker
+from growth_ops.services.http_session import pipeline_session_scope
 from growth_ops.services.scoring_pipeline import run_outreach_for_lead
+from growth_ops.services.stage_timing import stage_timing_lines, stage_timings, timing_scope
+
+
+def _features_report(lead: Lead) -> WebsiteReport | None:
+    """The report the lead's features point at, or its newest report when it has no features row yet."""
+    try:
+        if lead.features.report is not None:
+            return lead.features.report
+    except LeadFeatures.DoesNotExist:
+        pass
+    return lead.website_reports.order_by("-created_at", "-id").first()
 
 
 class Command(BaseCommand):
@@ -36,12 +49,14 @@ class Command(BaseCommand):
         force: bool = bool(options.get("force"))
 
         if lead_id is not None:
-            queryset = Lead.objects.filter(pk=lead_id)
+            queryset = Lead.objects.filter(pk=lead_id).select_related("features__report")
             if not queryset.exists():
                 raise CommandError(f"Lead {lead_id} was not found.")
         else:
+            # Leads reported before LeadFeatures existed stay eligible through their newest report.
             queryset = (
                 Lead.objects.filter(scores__isnull=False, website_reports__isnull=False)
+                .select_related("features__report")
                 .annotate(best_score=Max("scores__score"))
                 .order_by("-best_score", "created_at")
             )[:limit]
@@ -60,30 +75,37 @@ class Command(BaseCommand):
             )
         )
 
-        for index, lead in enumerate(leads, start=1):
-            prefix = f"[{index}/{leads_considered}] lead_id={lead.id} {lead.company_name}"
-            try:
-                result = run_outreach_for_lead(lead, force=force)
-                leads_processed += 1
-                decision = result.get("decision", {})
-                priority = str(decision.get("priority") or "low")
-                if result["draft_created"]:
-                    drafts_created += 1
-                    self.stdout.write(
-                        f"{prefix}: decision={priority}/contact, draft_id={result['draft_id']} (created)"
-                    )
-                elif result["draft_reused"]:
-                    drafts_reused += 1
-                    self.stdout.write(
-                        f"{prefix}: decision={priority}/contact, draft_id={result['draft_id']} (reused)"
-                    )
-                else:
-                    drafts_skipped += 1
-                    self.stdout.write(f"{prefix}: decision={priority}/skip, no draft")
-            except Exception as exc:
-                failures += 1
-                self.stderr.write(self.style.ERROR(f"{prefix}: failed - {exc}"))
-                continue
+        # Contact-page fetches for every lead share one pooled session set for the run.
+        circuit_breaker.reset()
+        stage_timings.reset()
+        with pipeline_session_scope() as http_stats:
+            for index, lead in enumerate(leads, start=1):
+                prefix = f"[{index}/{leads_considered}] lead_id={lead.id} {lead.company_name}"
+                try:
+                    with timing_scope():
+                        result = run_outreach_for_lead(lead, force=force, report_obj=_features_report(lead))
+                    leads_processed += 1
+                    decision = result.get("decision", {})
+                    priority = str(decision.get("priority") or "low")
+                    if result["draft_created"]:
+                        drafts_created += 1
+                        self.stdout.write(
+                            f"{prefix}: decision={priority}/contact, draft_id={result['draft_id']} (created)"
+                        )
+                    elif result["draft_reused"]:
+                        drafts_reused += 1
+                        self.stdout.write(
+                            f"{prefix}: decision={priority}/contact, draft_id={result['draft_id']} (reused)"
+                        )
+                    else:
+                        drafts_skipped += 1
+                        self.stdout.write(f"{prefix}: decision={priority}/skip, no draft")
+                except Exception as exc:
+                    failures += 1
+                    self.stderr.write(self.style.ERROR(f"{prefix}: failed - {exc}"))
+                    continue
+        http_connections = http_stats.snapshot()
+        circuit_states = circuit_breaker.snapshot()
 
         self.stdout.write("")
         self.stdout.write(self.style.SUCCESS("Growth V3 pipeline complete."))
@@ -93,3 +115,15 @@ class Command(BaseCommand):
         self.stdout.write(f"drafts_reused: {drafts_reused}")
         self.stdout.write(f"drafts_skipped: {drafts_skipped}")
         self.stdout.write(f"failures: {failures}")
+        self.stdout.write(f"http_new_connections: {http_connections['new_connections']}")
+        self.stdout.write(f"http_reused_connections: {http_connections['reused_connections']}")
+        self.stdout.write(
+            f"circuit_open_hosts: {sum(1 for state in circuit_states.values() if state['state'] != STATE_CLOSED)}"
+        )
+        for host, state in circuit_states.items():
+            self.stdout.write(
+                f"circuit[{host}]: state={state['state']} failures={state['consecutive_failures']} "
+                f"rejected={state['rejected']}"
+            )
+        for line in stage_timing_lines():
+            self.stdout.write(line)
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-18 02:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth_ops', '0002_harden_send_constraints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageSpeedCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('fetched_at', models.DateTimeField(db_index=True)),
+                ('normalized_url', models.CharField(max_length=512)),
+                ('strategy', models.CharField(default='mobile', max_length=16)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'ordering': ('-fetched_at',),
+                'constraints': [models.UniqueConstraint(fields=('normalized_url', 'strategy'), name='growth_pagespeed_cache_key_uniq')],
+            },
+        ),
+    ]
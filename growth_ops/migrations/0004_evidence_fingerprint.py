@@ -0,0 +1,22 @@
+# Generated by Django 5.2.3 on 2026-10-18 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth_ops', '0003_pagespeed_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='websiteevidence',
+            name='fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='websiteevidence',
+            index=models.Index(fields=['lead', 'evidence_type', 'tool', 'fingerprint'], name='growth_evidence_fp_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth_ops', '0004_evidence_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='websiteevidence',
+            name='compacted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def backfill_lead_domain_keys(apps, schema_editor):
+    # The key must equal what Lead.save() computes, so use the live helper rather than a copy.
+    from growth_ops.services.lead_ingest import lead_domain_key
+
+    Lead = apps.get_model("growth_ops", "Lead")
+
+    batch = []
+    for lead in Lead.objects.exclude(website_url="").only("id", "website_url").iterator():
+        lead.domain_key = lead_domain_key(lead.website_url)
+        batch.append(lead)
+        if len(batch) >= 500:
+            Lead.objects.bulk_update(batch, ["domain_key"])
+            batch = []
+    if batch:
+        Lead.objects.bulk_update(batch, ["domain_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("growth_ops", "0005_evidence_compaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lead",
+            name="domain_key",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="lead",
+            index=models.Index(Lower("company_name"), Lower("location"), name="growth_lead_name_loc_lower_idx"),
+        ),
+        migrations.RunPython(backfill_lead_domain_keys, migrations.RunPython.noop),
+    ]
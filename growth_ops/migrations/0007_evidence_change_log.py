@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth_ops', '0006_lead_domain_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvidenceChangeLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('evidence_type', models.CharField(db_index=True, max_length=64)),
+                ('fingerprint', models.CharField(blank=True, default='', max_length=64)),
+                ('previous_fingerprint', models.CharField(blank=True, default='', max_length=64)),
+                ('fingerprint_changed', models.BooleanField(default=True)),
+                ('evidence', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='growth_ops.websiteevidence')),
+                ('lead', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evidence_changes', to='growth_ops.lead')),
+            ],
+            options={
+                'ordering': ('id',),
+                'indexes': [models.Index(fields=['lead', 'id'], name='growth_evchange_lead_idx')],
+            },
+        ),
+    ]
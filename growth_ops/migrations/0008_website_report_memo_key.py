@@ -0,0 +1,22 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth_ops', '0007_evidence_change_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='websitereport',
+            name='memo_key',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='websitereport',
+            index=models.Index(fields=['lead', 'memo_key'], name='growth_report_lead_memo_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth_ops', '0008_website_report_memo_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadFeatures',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('last_evidence_id', models.PositiveBigIntegerField(default=0)),
+                ('perf_score', models.FloatField(blank=True, db_index=True, null=True)),
+                ('lcp_ms', models.FloatField(blank=True, db_index=True, null=True)),
+                ('cms_value', models.CharField(blank=True, db_index=True, default='', max_length=255)),
+                ('has_tech_fingerprint', models.BooleanField(default=False)),
+                ('has_sitemap_evidence', models.BooleanField(default=False)),
+                ('sitemap_marked_missing', models.BooleanField(default=False)),
+                ('site_type', models.CharField(choices=[('local', 'Local'), ('chain', 'Chain'), ('institutional', 'Institutional')], db_index=True, default='local', max_length=16)),
+                ('cta_clarity', models.CharField(blank=True, db_index=True, default='', max_length=16)),
+                ('trust_rating', models.CharField(choices=[('weak', 'Weak'), ('moderate', 'Moderate'), ('strong', 'Strong')], db_index=True, default='moderate', max_length=16)),
+                ('has_contact_method', models.BooleanField(blank=True, null=True)),
+                ('report_has_https', models.BooleanField(blank=True, null=True)),
+                ('report_perf_score', models.FloatField(blank=True, null=True)),
+                ('report_lcp_ms', models.FloatField(blank=True, null=True)),
+                ('lead', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='features', to='growth_ops.lead')),
+                ('report', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='growth_ops.websitereport')),
+            ],
+            options={
+                'verbose_name_plural': 'lead features',
+                'indexes': [models.Index(fields=['site_type', 'perf_score'], name='growth_features_site_perf_idx')],
+            },
+        ),
+    ]
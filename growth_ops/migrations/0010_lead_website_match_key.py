@@ -0,0 +1,36 @@
+# Generated by Django 5.2.3 on 2026-10-18 04:00
+
+from django.db import migrations, models
+
+
+def backfill_lead_website_match_keys(apps, schema_editor):
+    # The key must equal what Lead.save() computes, so use the live helper rather than a copy.
+    from growth_ops.services.lead_ingest import website_match_key
+
+    Lead = apps.get_model("growth_ops", "Lead")
+
+    batch = []
+    for lead in Lead.objects.exclude(website_url="").only("id", "website_url").iterator():
+        lead.website_match_key = website_match_key(lead.website_url)
+        batch.append(lead)
+        if len(batch) >= 500:
+            Lead.objects.bulk_update(batch, ["website_match_key"])
+            batch = []
+    if batch:
+        Lead.objects.bulk_update(batch, ["website_match_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth_ops', '0009_lead_features'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='website_match_key',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=255),
+        ),
+        migrations.RunPython(backfill_lead_website_match_keys, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class Lead(models.Model):
@@ -29,6 +30,10 @@ class Lead(models.Model):
     industry = models.CharField(max_length=120, blank=True, db_index=True)
     company_name = models.CharField(max_length=255, db_index=True)
     website_url = models.URLField(blank=True)
+    # Lowercased website host without scheme/www/path, maintained in save(); used for lead matching.
+    domain_key = models.CharField(max_length=255, blank=True, default="", db_index=True)
+    # Website URL with case, scheme, `www.` and trailing slashes folded away, maintained in save(); exact-match key.
+    website_match_key = models.CharField(max_length=255, blank=True, default="", db_index=True)
     google_place_id = models.CharField(max_length=128, blank=True, db_index=True)
     source = models.CharField(max_length=64, default="n8n", db_index=True)
     status = models.CharField(max_length=32, choices=STATUS_CHOICES, default="new", db_index=True)
@@ -39,11 +44,22 @@ class Lead(models.Model):
         indexes = [
             models.Index(fields=("status", "created_at"), name="growth_lead_status_created_idx"),
             models.Index(fields=("market", "industry"), name="gops_lead_mkt_ind_idx"),
+            models.Index(Lower("company_name"), Lower("location"), name="growth_lead_name_loc_lower_idx"),
         ]
 
     def __str__(self) -> str:
         return self.company_name
 
+    def save(self, *args, **kwargs):
+        from growth_ops.services.lead_ingest import lead_domain_key, website_match_key
+
+        self.domain_key = lead_domain_key(self.website_url)
+        self.website_match_key = website_match_key(self.website_url)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "website_url" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "domain_key", "website_match_key"}
+        super().save(*args, **kwargs)
+
 
 class Contact(models.Model):
     lead = models.ForeignKey(Lead, on_delete=models.CASCADE, related_name="contacts")
@@ -86,17 +102,67 @@ class WebsiteEvidence(models.Model):
     url = models.URLField(blank=True)
     tool = models.CharField(max_length=64, blank=True, db_index=True)
     payload = models.JSONField(default=dict, blank=True)
+    # sha256 of the canonicalized dedupe payload; blank on rows written before it existed.
+    fingerprint = models.CharField(max_length=64, blank=True, default="")
+    # Set when retention compaction replaced the payload with a fingerprint stub.
+    compacted_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ("-created_at",)
         indexes = [
             models.Index(fields=("lead", "evidence_type"), name="growth_evidence_lead_type_idx"),
+            models.Index(
+                fields=("lead", "evidence_type", "tool", "fingerprint"),
+                name="growth_evidence_fp_idx",
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.lead_id} {self.evidence_type}"
 
 
+class EvidenceChangeLog(models.Model):
+    """Append-only feed of new evidence rows; the primary key is the change-feed cursor."""
+
+    lead = models.ForeignKey(Lead, on_delete=models.CASCADE, related_name="evidence_changes")
+    evidence = models.ForeignKey(WebsiteEvidence, on_delete=models.CASCADE, related_name="changes")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    evidence_type = models.CharField(max_length=64, db_index=True)
+    fingerprint = models.CharField(max_length=64, blank=True, default="")
+    # Fingerprint of the newest earlier row for the same (lead, evidence_type, url, tool).
+    previous_fingerprint = models.CharField(max_length=64, blank=True, default="")
+    fingerprint_changed = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ("id",)
+        indexes = [
+            models.Index(fields=("lead", "id"), name="growth_evchange_lead_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.id} {self.lead_id} {self.evidence_type}"
+
+
+class PageSpeedCacheEntry(models.Model):
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    fetched_at = models.DateTimeField(db_index=True)
+    normalized_url = models.CharField(max_length=512)
+    strategy = models.CharField(max_length=16, default="mobile")
+    payload = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        ordering = ("-fetched_at",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=("normalized_url", "strategy"),
+                name="growth_pagespeed_cache_key_uniq",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.normalized_url} ({self.strategy})"
+
+
 class WebsiteReport(models.Model):
     lead = models.ForeignKey(Lead, on_delete=models.CASCADE, related_name="website_reports")
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
@@ -105,17 +171,79 @@ class WebsiteReport(models.Model):
     evidence_ids = models.JSONField(default=list, blank=True)
     report = models.JSONField(default=dict, blank=True)
     summary = models.TextField(blank=True)
+    # sha256 of the report inputs (see reporting.report_memo_key); empty when not memoizable.
+    memo_key = models.CharField(max_length=64, blank=True, default="")
 
     class Meta:
         ordering = ("-created_at",)
         indexes = [
             models.Index(fields=("lead", "created_at"), name="growth_report_lead_created_idx"),
+            models.Index(fields=("lead", "memo_key"), name="growth_report_lead_memo_idx"),
         ]
 
     def __str__(self) -> str:
         return f"Report {self.pk} ({self.model})"
 
 
+class LeadFeatures(models.Model):
+    """
+    Typed scoring inputs per lead, kept current as evidence and reports are
+    persisted (see services/lead_features.py) so scoring and filtering do not
+    re-parse the JSON payloads.
+    """
+
+    SITE_TYPE_CHOICES = (
+        ("local", "Local"),
+        ("chain", "Chain"),
+        ("institutional", "Institutional"),
+    )
+    TRUST_RATING_CHOICES = (
+        ("weak", "Weak"),
+        ("moderate", "Moderate"),
+        ("strong", "Strong"),
+    )
+
+    lead = models.OneToOneField(Lead, on_delete=models.CASCADE, related_name="features")
+    updated_at = models.DateTimeField(auto_now=True)
+    # Evidence columns: the newest row with a value wins; last_evidence_id is the newest row folded in.
+    last_evidence_id = models.PositiveBigIntegerField(default=0)
+    perf_score = models.FloatField(null=True, blank=True, db_index=True)
+    lcp_ms = models.FloatField(null=True, blank=True, db_index=True)
+    cms_value = models.CharField(max_length=255, blank=True, default="", db_index=True)
+    has_tech_fingerprint = models.BooleanField(default=False)
+    has_sitemap_evidence = models.BooleanField(default=False)
+    sitemap_marked_missing = models.BooleanField(default=False)
+    # Report columns, read from `report` (the lead's most recently persisted or reused report).
+    report = models.ForeignKey(
+        WebsiteReport,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    site_type = models.CharField(max_length=16, choices=SITE_TYPE_CHOICES, default="local", db_index=True)
+    cta_clarity = models.CharField(max_length=16, blank=True, default="", db_index=True)
+    trust_rating = models.CharField(
+        max_length=16,
+        choices=TRUST_RATING_CHOICES,
+        default="moderate",
+        db_index=True,
+    )
+    has_contact_method = models.BooleanField(null=True, blank=True)
+    report_has_https = models.BooleanField(null=True, blank=True)
+    report_perf_score = models.FloatField(null=True, blank=True)
+    report_lcp_ms = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = "lead features"
+        indexes = [
+            models.Index(fields=("site_type", "perf_score"), name="growth_features_site_perf_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Features for lead {self.lead_id}"
+
+
 class LeadScore(models.Model):
     BUCKET_CHOICES = (
         ("A", "A"),
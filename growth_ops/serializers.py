@@ -7,6 +7,7 @@ from rest_framework import serializers
 from .models import (
     Contact,
     ContentItem,
+    EvidenceChangeLog,
     InboxMessage,
     Lead,
     LeadScore,
@@ -15,6 +16,8 @@ from .models import (
     WebsiteReport,
 )
 
+MAX_BULK_EVIDENCE_GROUPS = 500
+
 
 class ContactInputSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255, required=False, allow_blank=True)
@@ -100,6 +103,35 @@ class EvidenceIngestRequestSerializer(serializers.Serializer):
         return attrs
 
 
+class EvidenceBulkIngestRequestSerializer(serializers.Serializer):
+    # Groups are validated one by one (EvidenceIngestRequestSerializer) so a bad group
+    # is reported in its own result instead of rejecting the whole batch.
+    groups = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_BULK_EVIDENCE_GROUPS,
+    )
+
+
+class EvidenceChangeLogSerializer(serializers.ModelSerializer):
+    cursor = serializers.IntegerField(source="id", read_only=True)
+    lead_id = serializers.IntegerField(read_only=True)
+    evidence_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = EvidenceChangeLog
+        fields = [
+            "cursor",
+            "lead_id",
+            "evidence_id",
+            "evidence_type",
+            "fingerprint_changed",
+            "fingerprint",
+            "previous_fingerprint",
+            "created_at",
+        ]
+
+
 class ReportPersistRequestSerializer(serializers.Serializer):
     lead_id = serializers.IntegerField()
     model = serializers.CharField(max_length=128)
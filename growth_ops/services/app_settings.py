@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+
+from django.conf import settings
+
+
+def int_setting(name: str, default: int) -> int:
+    """Django setting `name`, else the environment variable, else `default`; unparsable values fall back too."""
+    raw = str(getattr(settings, name, os.getenv(name, default))).strip()
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+def float_setting(name: str, default: float) -> float:
+    """Float counterpart of `int_setting`."""
+    raw = str(getattr(settings, name, os.getenv(name, default))).strip()
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return default
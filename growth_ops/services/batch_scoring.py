@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Sequence
+
+import numpy as np
+
+from growth_ops.models import Contact, Lead, LeadFeatures, WebsiteEvidence, WebsiteReport
+from growth_ops.services.scoring import (
+    REASON_CONTACT_EMAIL,
+    REASON_CTA_MODERATE,
+    REASON_CTA_POOR,
+    REASON_FAST_LCP,
+    REASON_HAS_WEBSITE,
+    REASON_HIGH_LCP,
+    REASON_HIGH_MOBILE_PERF,
+    REASON_INDUSTRY_FIT,
+    REASON_LOW_MOBILE_PERF,
+    REASON_MOBILE_PERF_NEEDS_IMPROVEMENT,
+    REASON_NO_HTTPS,
+    REASON_NO_VISIBLE_CONTACT_METHOD,
+    REASON_SITEMAP_MISSING,
+    REASON_TEMPLATE_LIMIT,
+    REASON_TRUST_LOW,
+    REASON_TRUST_STRONG,
+    LeadScoreFeatures,
+    ScoreResult,
+    ScoringConfig,
+    _cta_weight_for_site_type,
+    _trust_weight_for_site_type,
+    extract_score_features,
+    recommendation_for_score,
+    score_features_from_row,
+    scoring_config,
+)
+
+# Row order of the site-type weight tables; anything else scores like "local".
+SITE_TYPES = ("local", "chain", "institutional")
+# CTA column 0 is "no CTA signal" (no weight, no reason).
+CTA_CLASSES = {"poor": 1, "missing": 1, "unclear": 1, "moderate": 2, "weak": 3, "clear": 4}
+# Trust column 3 is an unknown rating (no weight, no reason).
+TRUST_CLASSES = {"weak": 0, "moderate": 1, "strong": 2}
+TRISTATE = {None: -1, False: 0, True: 1}
+
+CTA_WEIGHTS = np.array(
+    [
+        [0, weights["missing"], weights["moderate"], weights["weak"], weights["clear"]]
+        for weights in map(_cta_weight_for_site_type, SITE_TYPES)
+    ],
+    dtype=np.int64,
+)
+TRUST_WEIGHTS = np.array(
+    [
+        [weights["weak"], weights["moderate"], weights["strong"], 0]
+        for weights in map(_trust_weight_for_site_type, SITE_TYPES)
+    ],
+    dtype=np.int64,
+)
+NO_CONTACT_METHOD_WEIGHTS = np.array([-8, -7, -6], dtype=np.int64)
+NO_HTTPS_WEIGHTS = np.array([-10, -9, -8], dtype=np.int64)
+
+# Reason columns in the order compute_lead_score appends them, with their fixed
+# weight; CTA, contact, HTTPS and trust weights depend on the site type instead.
+REASON_COLUMNS = (
+    (REASON_HAS_WEBSITE, 5),
+    (REASON_CONTACT_EMAIL, 3),
+    (REASON_INDUSTRY_FIT, 2),
+    (REASON_LOW_MOBILE_PERF, -16),
+    (REASON_MOBILE_PERF_NEEDS_IMPROVEMENT, -5),
+    (REASON_HIGH_MOBILE_PERF, 6),
+    (REASON_HIGH_LCP, -10),
+    (REASON_FAST_LCP, 3),
+    (REASON_CTA_POOR, 0),
+    (REASON_CTA_MODERATE, 0),
+    (REASON_NO_VISIBLE_CONTACT_METHOD, 0),
+    (REASON_NO_HTTPS, 0),
+    (REASON_SITEMAP_MISSING, -8),
+    (REASON_TEMPLATE_LIMIT, -5),
+    (REASON_TRUST_LOW, 0),
+    (REASON_TRUST_STRONG, 0),
+)
+REASON_CODES = tuple(code for code, _weight in REASON_COLUMNS)
+FIXED_REASON_WEIGHTS = np.array([weight for _code, weight in REASON_COLUMNS], dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class FeatureMatrix:
+    """Columnar `LeadScoreFeatures`: one array per feature, one row per lead."""
+
+    has_website: np.ndarray
+    has_contact_email: np.ndarray
+    industry_fit: np.ndarray
+    site_type: np.ndarray
+    perf_present: np.ndarray
+    perf_score: np.ndarray
+    lcp_present: np.ndarray
+    lcp_ms: np.ndarray
+    template_cms: np.ndarray
+    sitemap_missing: np.ndarray
+    cta_clarity: np.ndarray
+    has_contact_method: np.ndarray
+    has_https: np.ndarray
+    trust_rating: np.ndarray
+
+    @classmethod
+    def from_features(
+        cls,
+        features: Sequence[LeadScoreFeatures],
+        *,
+        fit_industries: Sequence[str],
+        template_cms: Sequence[str],
+    ) -> FeatureMatrix:
+        def column(values, dtype) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=len(features))
+
+        site_index = {site_type: index for index, site_type in enumerate(SITE_TYPES)}
+        return cls(
+            has_website=column((item.has_website for item in features), bool),
+            has_contact_email=column((item.has_contact_email for item in features), bool),
+            industry_fit=column(
+                (
+                    bool(item.industry) and any(keyword in item.industry for keyword in fit_industries)
+                    for item in features
+                ),
+                bool,
+            ),
+            site_type=column((site_index.get(item.site_type, 0) for item in features), np.int64),
+            perf_present=column((item.perf_score is not None for item in features), bool),
+            perf_score=column(
+                (np.nan if item.perf_score is None else item.perf_score for item in features),
+                np.float64,
+            ),
+            lcp_present=column((item.lcp_ms is not None for item in features), bool),
+            lcp_ms=column((np.nan if item.lcp_ms is None else item.lcp_ms for item in features), np.float64),
+            template_cms=column(
+                (bool(item.cms_value) and any(cms in item.cms_value for cms in template_cms) for item in features),
+                bool,
+            ),
+            sitemap_missing=column(
+                (not item.has_sitemap_evidence or item.sitemap_marked_missing for item in features),
+                bool,
+            ),
+            cta_clarity=column((CTA_CLASSES.get(item.cta_clarity, 0) for item in features), np.int64),
+            has_contact_method=column((TRISTATE[item.has_contact_method] for item in features), np.int64),
+            has_https=column((TRISTATE[item.has_https] for item in features), np.int64),
+            trust_rating=column((TRUST_CLASSES.get(item.trust_rating, 3) for item in features), np.int64),
+        )
+
+
+def score_feature_matrix(
+    matrix: FeatureMatrix,
+    *,
+    performance_threshold: int,
+    lcp_threshold_ms: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """`(quality_scores, reason_flags)`; reason_flags has one boolean column per `REASON_CODES` entry."""
+    low_perf = matrix.perf_present & (matrix.perf_score < performance_threshold)
+    perf_needs_work = matrix.perf_present & ~low_perf & (matrix.perf_score < 90)
+    high_perf = matrix.perf_present & ~low_perf & ~perf_needs_work
+    high_lcp = matrix.lcp_present & (matrix.lcp_ms > lcp_threshold_ms)
+    fast_lcp = matrix.lcp_present & ~high_lcp & (matrix.lcp_ms < 1500)
+    no_contact_method = matrix.has_contact_method == 0
+    no_https = matrix.has_https == 0
+
+    reason_flags = np.column_stack(
+        [
+            matrix.has_website,
+            matrix.has_contact_email,
+            matrix.industry_fit,
+            low_perf,
+            perf_needs_work,
+            high_perf,
+            high_lcp,
+            fast_lcp,
+            (matrix.cta_clarity == 1) | (matrix.cta_clarity == 3),
+            matrix.cta_clarity == 2,
+            no_contact_method,
+            no_https,
+            matrix.sitemap_missing,
+            matrix.template_cms,
+            matrix.trust_rating == 0,
+            matrix.trust_rating == 2,
+        ]
+    )
+    scores = (
+        50
+        + reason_flags.astype(np.int64) @ FIXED_REASON_WEIGHTS
+        + CTA_WEIGHTS[matrix.site_type, matrix.cta_clarity]
+        + TRUST_WEIGHTS[matrix.site_type, matrix.trust_rating]
+        + np.where(no_contact_method, NO_CONTACT_METHOD_WEIGHTS[matrix.site_type], 0)
+        + np.where(no_https, NO_HTTPS_WEIGHTS[matrix.site_type], 0)
+    )
+    return np.clip(scores, 0, 100), reason_flags
+
+
+def score_features_batch(
+    features: Sequence[LeadScoreFeatures],
+    config: ScoringConfig | None = None,
+) -> list[ScoreResult]:
+    """`score_from_features` for many leads at once."""
+    if not features:
+        return []
+    config = config or scoring_config()
+    matrix = FeatureMatrix.from_features(
+        features,
+        fit_industries=config.fit_industries,
+        template_cms=config.template_cms,
+    )
+    quality_scores, reason_flags = score_feature_matrix(
+        matrix,
+        performance_threshold=config.performance_threshold,
+        lcp_threshold_ms=config.lcp_threshold_ms,
+    )
+    outreach_scores = 100 - quality_scores
+
+    results: list[ScoreResult] = []
+    for quality_score, outreach_score, flags in zip(
+        quality_scores.tolist(), outreach_scores.tolist(), reason_flags.tolist()
+    ):
+        bucket, recommendation = recommendation_for_score(
+            outreach_score,
+            quality_score,
+            config_version=config.version,
+        )
+        results.append(
+            ScoreResult(
+                score=outreach_score,
+                bucket=bucket,
+                reason_codes=[code for code, flagged in zip(REASON_CODES, flags) if flagged],
+                recommendation=recommendation,
+            )
+        )
+    return results
+
+
+def compute_lead_scores(pairs: Sequence[tuple[Lead, WebsiteReport | None]]) -> list[ScoreResult]:
+    """
+    `compute_lead_score` for many `(lead, report)` pairs, in input order.
+
+    Contacts and `LeadFeatures` rows for all leads are loaded in two queries
+    instead of two per lead (plus one evidence query for leads not materialized
+    yet), and the weights are applied to the whole batch with NumPy.
+    """
+    lead_ids = [lead.pk for lead, _report in pairs]
+    with_email = set(
+        Contact.objects.filter(lead_id__in=lead_ids)
+        .exclude(email="")
+        .order_by()
+        .values_list("lead_id", flat=True)
+        .distinct()
+    )
+    feature_rows = {row.lead_id: row for row in LeadFeatures.objects.filter(lead_id__in=lead_ids)}
+    evidence_by_lead: dict[int, list[WebsiteEvidence]] = {}
+    unmaterialized = [lead_id for lead_id in lead_ids if lead_id not in feature_rows]
+    if unmaterialized:
+        evidence_rows = (
+            WebsiteEvidence.objects.filter(lead_id__in=unmaterialized)
+            .order_by("lead_id", "-created_at", "-id")
+            .only("lead", "evidence_type", "payload")
+        )
+        evidence_by_lead = {
+            lead_id: list(rows) for lead_id, rows in groupby(evidence_rows.iterator(), key=lambda row: row.lead_id)
+        }
+
+    features: list[LeadScoreFeatures] = []
+    for lead, report_obj in pairs:
+        row = feature_rows.get(lead.pk)
+        if row is None:
+            features.append(
+                extract_score_features(
+                    lead=lead,
+                    report_obj=report_obj,
+                    evidence=evidence_by_lead.get(lead.pk, []),
+                    has_contact_email=lead.pk in with_email,
+                )
+            )
+        else:
+            features.append(
+                score_features_from_row(
+                    row,
+                    lead=lead,
+                    report_obj=report_obj,
+                    has_contact_email=lead.pk in with_email,
+                )
+            )
+    return score_features_batch(features)
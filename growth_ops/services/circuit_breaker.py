@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+import httpx
+import requests
+
+from growth_ops.services.app_settings import int_setting
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_SECONDS = 60
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+# Only failures that say "the host is unreachable or stalling" trip the breaker;
+# any HTTP response (even a 5xx) proves the host is answering.
+CONNECT_FAILURE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+    httpx.ConnectError,
+    httpx.TimeoutException,
+)
+
+
+def host_key(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def is_connect_failure(exc: BaseException) -> bool:
+    return isinstance(exc, CONNECT_FAILURE_EXCEPTIONS)
+
+
+class HostCircuitBreaker:
+    """
+    Per-hostname circuit breaker.
+
+    Trips open after `failure_threshold` consecutive connect/timeout failures;
+    while open, `allow()` fails fast. After `reset_seconds` one trial request is
+    let through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int | None = None,
+        reset_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: dict[str, dict[str, Any]] = {}
+
+    @property
+    def failure_threshold(self) -> int:
+        if self._failure_threshold is not None:
+            return self._failure_threshold
+        return max(1, int_setting("GROWTH_CIRCUIT_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD))
+
+    @property
+    def reset_seconds(self) -> float:
+        if self._reset_seconds is not None:
+            return self._reset_seconds
+        return max(0, int_setting("GROWTH_CIRCUIT_RESET_SECONDS", DEFAULT_RESET_SECONDS))
+
+    def _host_state(self, host: str) -> dict[str, Any]:
+        return self._hosts.setdefault(
+            host,
+            {"state": STATE_CLOSED, "consecutive_failures": 0, "opened_at": None, "rejected": 0},
+        )
+
+    def allow(self, url: str) -> bool:
+        host = host_key(url)
+        if not host:
+            return True
+        with self._lock:
+            state = self._host_state(host)
+            if state["state"] == STATE_CLOSED:
+                return True
+            if state["state"] == STATE_OPEN and self._clock() - state["opened_at"] >= self.reset_seconds:
+                state["state"] = STATE_HALF_OPEN
+                return True
+            state["rejected"] += 1
+            return False
+
+    def record_success(self, url: str) -> None:
+        host = host_key(url)
+        if not host:
+            return
+        with self._lock:
+            state = self._host_state(host)
+            state.update(state=STATE_CLOSED, consecutive_failures=0, opened_at=None)
+
+    def record_failure(self, url: str) -> None:
+        host = host_key(url)
+        if not host:
+            return
+        with self._lock:
+            state = self._host_state(host)
+            state["consecutive_failures"] += 1
+            if state["state"] == STATE_HALF_OPEN or state["consecutive_failures"] >= self.failure_threshold:
+                state["state"] = STATE_OPEN
+                state["opened_at"] = self._clock()
+
+    def record_exception(self, url: str, exc: BaseException) -> None:
+        """
+        Count `exc` against the host when it is a connect/timeout failure. Any other
+        request error (bad redirect chain, broken body) means the host did answer.
+        """
+        if is_connect_failure(exc):
+            self.record_failure(url)
+        else:
+            self.record_success(url)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """State of every host that has failed at least once since the last reset."""
+        now = self._clock()
+        with self._lock:
+            return {
+                host: {
+                    "state": state["state"],
+                    "consecutive_failures": state["consecutive_failures"],
+                    "rejected": state["rejected"],
+                    "open_for_seconds": round(now - state["opened_at"], 1) if state["opened_at"] is not None else None,
+                }
+                for host, state in sorted(self._hosts.items())
+                if state["consecutive_failures"] or state["state"] != STATE_CLOSED or state["rejected"]
+            }
+
+
+circuit_breaker = HostCircuitBreaker()
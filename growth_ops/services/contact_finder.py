@@ -5,17 +5,13 @@ from typing import Any
 from urllib.parse import urljoin, urlparse
 
 from growth_ops.services.evidence_fetcher import fetch_url
+from growth_ops.services.html_signals import TAG_RE, HomepageSignals, parse_homepage_signals
 
 MAILTO_RE = re.compile(r"mailto:([^\"'\s>]+)", re.IGNORECASE)
 TEL_RE = re.compile(r"tel:([^\"'\s>]+)", re.IGNORECASE)
 HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
-ANCHOR_RE = re.compile(
-    r"<a\b[^>]*href=[\"']([^\"']+)[\"'][^>]*>(.*?)</a>",
-    re.IGNORECASE | re.DOTALL,
-)
 EMAIL_RE = re.compile(r"\b[A-Z0-9._%+\-]+@[A-Z0-9.\-]+\.[A-Z]{2,}\b", re.IGNORECASE)
 PHONE_RE = re.compile(r"(\+?\d[\d\s().\-]{7,}\d)")
-TAG_RE = re.compile(r"<[^>]+>")
 
 CONTACT_LINK_HINT_WEIGHTS: dict[str, int] = {
     "contact": 100,
@@ -116,11 +112,11 @@ def _extract_social_links(links: list[str]) -> dict[str, str]:
     return out
 
 
-def _extract_anchor_candidates(html: str) -> list[tuple[str, str]]:
+def _extract_anchor_candidates(signals: HomepageSignals) -> list[tuple[str, str]]:
     candidates: list[tuple[str, str]] = []
     seen_hrefs: set[str] = set()
 
-    for href, anchor_body in ANCHOR_RE.findall(html or ""):
+    for href, anchor_body in signals.anchors:
         normalized_href = str(href or "").strip()
         if not normalized_href:
             continue
@@ -128,7 +124,7 @@ def _extract_anchor_candidates(html: str) -> list[tuple[str, str]]:
         candidates.append((normalized_href, anchor_text))
         seen_hrefs.add(normalized_href)
 
-    for href in HREF_RE.findall(html or ""):
+    for href in HREF_RE.findall(signals.html):
         normalized_href = str(href or "").strip()
         if not normalized_href or normalized_href in seen_hrefs:
             continue
@@ -200,12 +196,19 @@ def _best_phone(phones: list[str]) -> str | None:
     return sorted_candidates[0]
 
 
-def extract_contact_candidates(*, homepage_html: str, website_url: str | None = None) -> dict[str, Any]:
+def extract_contact_candidates(
+    *,
+    homepage_html: str,
+    website_url: str | None = None,
+    signals: HomepageSignals | None = None,
+) -> dict[str, Any]:
     html = homepage_html or ""
-    anchor_candidates = _extract_anchor_candidates(html)
+    if signals is None or signals.html != html:
+        signals = parse_homepage_signals(html)
+    anchor_candidates = _extract_anchor_candidates(signals)
     hrefs = [href for href, _text in anchor_candidates]
     normalized_links = _dedupe([_absolute_link(href, website_url) for href in hrefs if href.strip()])
-    text = _strip_html(html)
+    text = signals.markup_text
 
     mailto_matches = [_normalize_email(match) for match in MAILTO_RE.findall(html)]
     text_email_matches = [_normalize_email(match) for match in EMAIL_RE.findall(text)]
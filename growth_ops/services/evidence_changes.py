@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Iterable
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from growth_ops.models import EvidenceChangeLog, WebsiteEvidence
+from growth_ops.services.app_settings import int_setting
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_COMMIT_LAG_SECONDS = 30
+
+
+def commit_lag_seconds() -> int:
+    """How long a change-log entry must have existed before the feed hands it out."""
+    return max(0, int_setting("GROWTH_EVIDENCE_CHANGES_COMMIT_LAG_SECONDS", DEFAULT_COMMIT_LAG_SECONDS))
+
+
+def record_evidence_changes(records: Iterable[WebsiteEvidence]) -> list[EvidenceChangeLog]:
+    """
+    Append one change-log entry per newly written evidence row.
+
+    Each entry is compared with the newest earlier row for the same
+    `(lead, evidence_type, url, tool)`; rows with no predecessor, or whose
+    predecessor predates fingerprints, count as changed. Two queries total,
+    whatever the number of rows.
+    """
+    records = [record for record in records if record.pk is not None]
+    if not records:
+        return []
+
+    new_ids = {record.pk for record in records}
+    scope_keys = {(record.lead_id, record.evidence_type, record.url, record.tool) for record in records}
+    latest: dict[tuple[int, str, str, str], str] = {}
+    earlier = (
+        WebsiteEvidence.objects.filter(
+            lead_id__in={key[0] for key in scope_keys},
+            evidence_type__in={key[1] for key in scope_keys},
+        )
+        .exclude(pk__in=new_ids)
+        .order_by("-created_at", "-id")
+        .values_list("lead_id", "evidence_type", "url", "tool", "fingerprint")
+    )
+    for lead_id, evidence_type, url, tool, fingerprint in earlier:
+        key = (lead_id, evidence_type, url, tool)
+        if key in scope_keys:
+            latest.setdefault(key, fingerprint)
+
+    entries: list[EvidenceChangeLog] = []
+    for record in sorted(records, key=lambda record: record.pk):
+        key = (record.lead_id, record.evidence_type, record.url, record.tool)
+        previous = latest.get(key, "")
+        entries.append(
+            EvidenceChangeLog(
+                lead_id=record.lead_id,
+                evidence_id=record.pk,
+                evidence_type=record.evidence_type,
+                fingerprint=record.fingerprint,
+                previous_fingerprint=previous,
+                fingerprint_changed=not previous or previous != record.fingerprint,
+            )
+        )
+        # A second new row in the same scope is compared with the first one.
+        latest[key] = record.fingerprint
+    return EvidenceChangeLog.objects.bulk_create(entries)
+
+
+def evidence_changes_since(
+    cursor: int = 0,
+    *,
+    evidence_types: Iterable[str] | None = None,
+    changed_only: bool = False,
+) -> QuerySet[EvidenceChangeLog]:
+    """
+    Change-log entries after `cursor`, oldest first.
+
+    Ids are allocated at insert time but become visible at commit, so on
+    PostgreSQL a slow transaction can commit an id below one a reader has
+    already passed. The feed therefore stops before the first entry younger
+    than `commit_lag_seconds()`: entries from transactions that commit within
+    that window are never skipped. Longer transactions can still be skipped,
+    so the feed is best-effort beyond the window.
+    """
+    cursor = max(0, cursor)
+    queryset = EvidenceChangeLog.objects.filter(pk__gt=cursor).order_by("pk")
+    cutoff = timezone.now() - timedelta(seconds=commit_lag_seconds())
+    horizon = queryset.filter(created_at__gt=cutoff).values_list("pk", flat=True).first()
+    if horizon is not None:
+        queryset = queryset.filter(pk__lt=horizon)
+    if evidence_types:
+        queryset = queryset.filter(evidence_type__in=list(evidence_types))
+    if changed_only:
+        queryset = queryset.filter(fingerprint_changed=True)
+    return queryset
+
+
+def latest_evidence_cursor() -> int:
+    return EvidenceChangeLog.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+
+
+def leads_changed_since(cursor: int = 0, *, limit: int | None = None) -> tuple[list[int], int]:
+    """
+    Lead ids (in first-change order) whose evidence fingerprint changed after `cursor`,
+    plus the cursor to resume from.
+
+    With `limit`, the returned cursor stops just before the first entry of the
+    first lead left out, so resuming from it never skips a change.
+    """
+    lead_ids: list[int] = []
+    seen: set[int] = set()
+    next_cursor = max(0, cursor)
+    for entry_id, lead_id in evidence_changes_since(cursor, changed_only=True).values_list("pk", "lead_id").iterator():
+        if lead_id not in seen:
+            if limit is not None and len(lead_ids) >= limit:
+                break
+            seen.add(lead_id)
+            lead_ids.append(lead_id)
+        next_cursor = entry_id
+    return lead_ids, next_cursor
@@ -1,17 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import copy
 import json
 import os
-from typing import Any
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
 from urllib.parse import urljoin, urlparse, urlunparse
 
+import httpx
 import requests
 from django.conf import settings
 
+from growth_ops.services import pagespeed_cache
+from growth_ops.services.circuit_breaker import circuit_breaker, host_key
+from growth_ops.services.http_session import AsyncConnectionTrace, get_session
+from growth_ops.services.rate_limiter import (
+    QuotaExhaustedError,
+    async_call_with_quota,
+    call_with_quota,
+    get_bucket,
+)
+from growth_ops.services.sitemap_parser import SitemapDocumentParser, SitemapSummary
+
 REQUEST_TIMEOUT_SECONDS = 15
+DEFAULT_BATCH_CONCURRENCY = 10
+DEFAULT_PER_HOST_CONCURRENCY = 2
 MAX_BODY_CHARS = 20_000
+# Worst case 4 bytes per decoded char, +1 char to detect truncation.
+MAX_BODY_BYTES = (MAX_BODY_CHARS + 1) * 4
+STREAM_CHUNK_BYTES = 8_192
+CHARSET_SNIFF_BYTES = 4_096
 MAX_PAGESPEED_RAW_CHARS = 35_000
 PAGESPEED_API_URL = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+PAGESPEED_STRATEGY = "mobile"
+# Requested together so one cached result serves both the evidence pipeline and SiteAuditor.
+PAGESPEED_CATEGORIES = ("performance", "accessibility", "seo")
 PAGESPEED_RELEVANT_AUDITS = {
     "largest-contentful-paint",
     "cumulative-layout-shift",
@@ -21,6 +48,17 @@ PAGESPEED_RELEVANT_AUDITS = {
     "interactive",
 }
 
+CONTENT_TYPE_CHARSET_RE = re.compile(r";\s*charset\s*=\s*[\"']?([A-Za-z0-9._:-]+)", re.IGNORECASE)
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([A-Za-z0-9._:-]+)", re.IGNORECASE)
+XML_ENCODING_RE = re.compile(rb"^\s*<\?xml[^>]+encoding\s*=\s*[\"']([A-Za-z0-9._:-]+)[\"']", re.IGNORECASE)
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
 BASE_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -123,11 +161,10 @@ def _trim_pagespeed_raw_payload(payload: dict[str, Any]) -> dict[str, Any]:
             "finalDisplayedUrl": lighthouse.get("finalDisplayedUrl"),
             "fetchTime": lighthouse.get("fetchTime"),
             "categories": {
-                "performance": {
-                    "score": _as_float(
-                        ((lighthouse.get("categories") or {}).get("performance") or {}).get("score")
-                    )
+                category: {
+                    "score": _as_float(((lighthouse.get("categories") or {}).get(category) or {}).get("score"))
                 }
+                for category in PAGESPEED_CATEGORIES
             },
             "audits": trimmed_audits,
         }
@@ -196,166 +233,509 @@ def normalize_and_split_url(url: str) -> tuple[str | None, str | None]:
     return normalized_url, origin
 
 
-def fetch_url(url: str, accept: str) -> dict[str, Any]:
-    """Fetch URL with browser-like headers and return a non-throwing structured result."""
+def _fetch_error_payload(url: str, error: str) -> dict[str, Any]:
+    return {
+        "exists": False,
+        "status_code": None,
+        "requested_url": url,
+        "body": "",
+        "error": error,
+    }
+
+
+def _circuit_open_payload(url: str) -> dict[str, Any]:
+    """Fail-fast payload for a host whose circuit is open (recent connect/timeout failures)."""
+    payload = _fetch_error_payload(url, "circuit_open")
+    payload["circuit_host"] = host_key(url)
+    return payload
+
+
+def _fetch_result(
+    *,
+    url: str,
+    status_code: int,
+    final_url: str,
+    body: str,
+    headers: dict[str, str],
+) -> dict[str, Any]:
+    truncated = len(body) > MAX_BODY_CHARS
+    result: dict[str, Any] = {
+        "exists": 200 <= status_code < 400,
+        "status_code": status_code,
+        "requested_url": final_url or url,
+        "body": body[:MAX_BODY_CHARS],
+        "headers": headers,
+    }
+    if truncated:
+        result["truncated"] = True
+    return result
+
+
+def _known_codec(name: str | None) -> str | None:
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+
+
+def _header_value(headers: dict[str, str], name: str) -> str:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return str(value or "")
+    return ""
+
+
+def _content_length(headers: dict[str, str]) -> int | None:
+    raw = _header_value(headers, "content-length").strip()
+    return int(raw) if raw.isdigit() else None
+
+
+def _detect_charset(headers: dict[str, str], head: bytes) -> str:
+    """
+    Pick the body charset from the response headers, else a BOM, else a
+    `<meta charset>` / XML declaration in the first chunk, else UTF-8 when the
+    chunk decodes cleanly, else ISO-8859-1 (requests' text/* default).
+    """
+    content_type = _header_value(headers, "content-type")
+    match = CONTENT_TYPE_CHARSET_RE.search(content_type)
+    header_charset = _known_codec(match.group(1)) if match else None
+    if header_charset:
+        return header_charset
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    declared = XML_ENCODING_RE.search(head) or META_CHARSET_RE.search(head)
+    declared_charset = _known_codec(declared.group(1).decode("ascii", "ignore")) if declared else None
+    if declared_charset:
+        return declared_charset
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "ISO-8859-1"
+
+
+class _BoundedBodyReader:
+    """
+    Incrementally decode a streamed body, stopping once `MAX_BODY_CHARS` (+1 to
+    flag truncation) are decoded or `MAX_BODY_BYTES` are read.
+    """
+
+    def __init__(self, headers: dict[str, str]):
+        self._headers = headers
+        self._head = b""
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._parts: list[str] = []
+        self._chars = 0
+        self.bytes_read = 0
+        self.encoding = ""
+
+    @property
+    def done(self) -> bool:
+        return self._chars > MAX_BODY_CHARS or self.bytes_read >= MAX_BODY_BYTES
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume one chunk; returns True once the budget is reached."""
+        if not chunk:
+            return self.done
+        chunk = chunk[: MAX_BODY_BYTES - self.bytes_read]
+        self.bytes_read += len(chunk)
+        if self._decoder is None:
+            self._head += chunk
+            if len(self._head) < CHARSET_SNIFF_BYTES and not self.done:
+                return False
+            self._start_decoding()
+        else:
+            self._decode(chunk)
+        return self.done
+
+    def text(self) -> str:
+        if self._decoder is None:
+            self._start_decoding()
+        assert self._decoder is not None
+        self._parts.append(self._decoder.decode(b"", final=True))
+        return "".join(self._parts)[: MAX_BODY_CHARS + 1]
+
+    def _start_decoding(self) -> None:
+        self.encoding = _detect_charset(self._headers, self._head)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        head, self._head = self._head, b""
+        self._decode(head)
+
+    def _decode(self, chunk: bytes) -> None:
+        assert self._decoder is not None
+        decoded = self._decoder.decode(chunk)
+        self._parts.append(decoded)
+        self._chars += len(decoded)
+
+
+def _streamed_fetch_result(
+    *,
+    url: str,
+    status_code: int,
+    final_url: str,
+    reader: _BoundedBodyReader,
+    headers: dict[str, str],
+) -> dict[str, Any]:
+    result = _fetch_result(
+        url=url,
+        status_code=status_code,
+        final_url=final_url,
+        body=reader.text(),
+        headers=headers,
+    )
+    result["bytes_read"] = reader.bytes_read
+    result["content_length"] = _content_length(headers)
+    return result
+
+
+def _not_modified_result(
+    *,
+    url: str,
+    final_url: str,
+    headers: dict[str, str],
+    validators: dict[str, str],
+) -> dict[str, Any]:
+    """304 marker payload; `persist_evidence_items` swaps it for the stored row the validators came from."""
+    return {
+        "exists": True,
+        "status_code": 304,
+        "requested_url": final_url or url,
+        "body": "",
+        "headers": headers,
+        "not_modified": True,
+        "validators": dict(validators),
+    }
+
+
+def _request_headers(accept: str, validators: dict[str, str] | None = None) -> dict[str, str]:
     headers = dict(BASE_HEADERS)
     headers["Accept"] = accept
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def fetch_url(url: str, accept: str, validators: dict[str, str] | None = None) -> dict[str, Any]:
+    """
+    Fetch URL with browser-like headers and return a non-throwing structured result.
 
+    `validators` (`etag` / `last_modified` from a previous response) turn the request
+    into a conditional GET; a 304 comes back as a `not_modified` marker payload.
+    Hosts with an open circuit get a `circuit_open` payload without any request.
+    """
+    if not circuit_breaker.allow(url):
+        return _circuit_open_payload(url)
     try:
-        response = requests.get(
+        # Stream the body so oversized pages stop downloading once the budget is reached.
+        with get_session().get(
             url,
-            headers=headers,
+            headers=_request_headers(accept, validators),
             timeout=REQUEST_TIMEOUT_SECONDS,
             allow_redirects=True,
-        )
+            stream=True,
+        ) as response:
+            circuit_breaker.record_success(url)
+            headers = dict(response.headers)
+            if response.status_code == 304 and validators:
+                return _not_modified_result(
+                    url=url,
+                    final_url=response.url,
+                    headers=headers,
+                    validators=validators,
+                )
+            reader = _BoundedBodyReader(headers)
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                if reader.feed(chunk):
+                    break
     except requests.RequestException as exc:
-        return {
-            "exists": False,
-            "status_code": None,
-            "requested_url": url,
-            "body": "",
-            "error": str(exc),
-        }
+        circuit_breaker.record_exception(url, exc)
+        return _fetch_error_payload(url, str(exc))
 
-    body = response.text or ""
-    truncated = len(body) > MAX_BODY_CHARS
-    body_snippet = body[:MAX_BODY_CHARS]
+    return _streamed_fetch_result(
+        url=url,
+        status_code=response.status_code,
+        final_url=response.url,
+        reader=reader,
+        headers=headers,
+    )
+
+
+HOMEPAGE_ACCEPT = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+ROBOTS_ACCEPT = "text/plain,*/*;q=0.8"
+SITEMAP_ACCEPT = "application/xml,text/xml;q=0.9,*/*;q=0.8"
+
+
+def _robots_url(origin: str) -> str:
+    return urljoin(f"{origin}/", "robots.txt")
+
+
+def _sitemap_url(origin: str) -> str:
+    return urljoin(f"{origin}/", "sitemap.xml")
+
+
+def fetch_homepage(url: str, validators: dict[str, str] | None = None) -> dict[str, Any]:
+    return fetch_url(url, accept=HOMEPAGE_ACCEPT, validators=validators)
+
+
+def fetch_robots(origin: str, validators: dict[str, str] | None = None) -> dict[str, Any]:
+    return fetch_url(_robots_url(origin), accept=ROBOTS_ACCEPT, validators=validators)
+
+
+def _sitemap_result(
+    *,
+    url: str,
+    status_code: int,
+    final_url: str,
+    headers: dict[str, str],
+    bytes_read: int,
+    summary: SitemapSummary | None,
+) -> dict[str, Any]:
+    """Sitemap evidence payload: response metadata plus the parsed summary instead of a raw body."""
     result: dict[str, Any] = {
-        "exists": 200 <= response.status_code < 400,
-        "status_code": response.status_code,
-        "requested_url": response.url or url,
-        "body": body_snippet,
-        "headers": dict(response.headers),
+        "exists": 200 <= status_code < 400,
+        "status_code": status_code,
+        "requested_url": final_url or url,
+        "body": "",
+        "headers": headers,
+        "bytes_read": bytes_read,
+        "content_length": _content_length(headers),
     }
-    if truncated:
-        result["truncated"] = True
+    if summary is not None:
+        result["summary"] = summary.to_payload()
     return result
 
 
-def fetch_homepage(url: str) -> dict[str, Any]:
-    return fetch_url(url, accept="text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
-
+def _fetch_sitemap_document(
+    url: str,
+    summary: SitemapSummary,
+    *,
+    is_root: bool,
+    validators: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Stream one sitemap document into `summary`; returns its response metadata payload."""
+    if not circuit_breaker.allow(url):
+        return _circuit_open_payload(url)
+    parser = SitemapDocumentParser(summary, is_root=is_root)
+    bytes_read = 0
+    try:
+        with get_session().get(
+            url,
+            headers=_request_headers(SITEMAP_ACCEPT, validators),
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            allow_redirects=True,
+            stream=True,
+        ) as response:
+            circuit_breaker.record_success(url)
+            headers = dict(response.headers)
+            if response.status_code == 304 and validators:
+                return _not_modified_result(url=url, final_url=response.url, headers=headers, validators=validators)
+            if 200 <= response.status_code < 300:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                    bytes_read += len(chunk)
+                    if parser.feed(chunk):
+                        break
+                parser.close()
+    except requests.RequestException as exc:
+        circuit_breaker.record_exception(url, exc)
+        return _fetch_error_payload(url, str(exc))
 
-def fetch_robots(origin: str) -> dict[str, Any]:
-    robots_url = urljoin(f"{origin}/", "robots.txt")
-    return fetch_url(robots_url, accept="text/plain,*/*;q=0.8")
+    return _sitemap_result(
+        url=url,
+        status_code=response.status_code,
+        final_url=response.url,
+        headers=headers,
+        bytes_read=bytes_read,
+        summary=summary if 200 <= response.status_code < 300 else None,
+    )
 
 
-def fetch_sitemap(origin: str) -> dict[str, Any]:
-    sitemap_url = urljoin(f"{origin}/", "sitemap.xml")
-    return fetch_url(sitemap_url, accept="application/xml,text/xml;q=0.9,*/*;q=0.8")
+def _merge_child_sitemap(root_payload: dict[str, Any], child_payload: dict[str, Any], summary: SitemapSummary) -> None:
+    root_payload["bytes_read"] = int(root_payload.get("bytes_read") or 0) + int(child_payload.get("bytes_read") or 0)
+    if not (200 <= int(child_payload.get("status_code") or 0) < 300):
+        summary.child_fetch_errors += 1
+    root_payload["summary"] = summary.to_payload()
 
 
-def fetch_pagespeed(url: str) -> dict[str, Any]:
+def fetch_sitemap(origin: str, validators: dict[str, str] | None = None) -> dict[str, Any]:
     """
-    Fetch PageSpeed Insights data (mobile strategy) and return normalized metrics.
-    Never raises for operational errors; always returns structured payload.
+    Stream-parse `/sitemap.xml` (following `<sitemapindex>` children within budget)
+    into a compact summary; see `sitemap_parser.SitemapSummary`.
     """
+    url = _sitemap_url(origin)
+    summary = SitemapSummary(site_url=origin)
+    payload = _fetch_sitemap_document(url, summary, is_root=True, validators=validators)
+    if "summary" not in payload:
+        return payload
+    while (child_url := summary.pop_child_sitemap()) is not None:
+        _merge_child_sitemap(payload, _fetch_sitemap_document(child_url, summary, is_root=False), summary)
+    return payload
+
+
+def _pagespeed_error_payload(
+    error: str,
+    *,
+    raw: dict[str, Any] | None = None,
+    **extra: Any,
+) -> dict[str, Any]:
+    return {
+        "performance_score": None,
+        "lcp_ms": None,
+        "cls": None,
+        "fcp_ms": None,
+        "tbt_ms": None,
+        "error": error,
+        **extra,
+        "raw": raw or {},
+    }
+
+
+def _pagespeed_request_params(
+    url: str,
+    api_key: str | None = None,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Return `(params, None)` for a request, or `(None, error_payload)` when no request can be made."""
     normalized_url, _origin = normalize_and_split_url(url)
     if not normalized_url:
-        return {
-            "performance_score": None,
-            "lcp_ms": None,
-            "cls": None,
-            "fcp_ms": None,
-            "tbt_ms": None,
-            "error": "invalid_website_url",
-            "raw": {},
-        }
+        return None, _pagespeed_error_payload("invalid_website_url")
 
-    api_key = _pagespeed_api_key()
+    api_key = (api_key or "").strip() or _pagespeed_api_key()
     if not api_key:
-        return {
-            "performance_score": None,
-            "lcp_ms": None,
-            "cls": None,
-            "fcp_ms": None,
-            "tbt_ms": None,
-            "error": "missing_pagespeed_api_key",
-            "raw": {},
-        }
+        return None, _pagespeed_error_payload("missing_pagespeed_api_key")
 
-    params = {
+    return {
         "url": normalized_url,
-        "strategy": "mobile",
+        "strategy": PAGESPEED_STRATEGY,
+        "category": list(PAGESPEED_CATEGORIES),
         "key": api_key,
+    }, None
+
+
+def _pagespeed_result(status_code: int, raw_payload: Any) -> dict[str, Any]:
+    payload = raw_payload if isinstance(raw_payload, dict) else {}
+    if status_code >= 400:
+        return _pagespeed_error_payload(
+            "pagespeed_http_error",
+            status_code=status_code,
+            raw=_trim_pagespeed_raw_payload(payload),
+        )
+
+    metrics = _extract_pagespeed_metrics(payload)
+    return {
+        **metrics,
+        "error": "",
+        "raw": _trim_pagespeed_raw_payload(payload),
     }
 
+
+def _request_pagespeed(params: dict[str, Any], timeout: float = REQUEST_TIMEOUT_SECONDS) -> dict[str, Any]:
     try:
-        response = requests.get(PAGESPEED_API_URL, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+        # call_with_quota owns retries: each attempt takes a token, so the adapter must not retry on its own.
+        response = call_with_quota(
+            get_bucket("pagespeed", params["key"]),
+            lambda: get_session(retries=False).get(PAGESPEED_API_URL, params=params, timeout=timeout),
+        )
+    except QuotaExhaustedError as exc:
+        return _pagespeed_error_payload("pagespeed_quota_exhausted", error_detail=str(exc))
     except requests.RequestException as exc:
-        return {
-            "performance_score": None,
-            "lcp_ms": None,
-            "cls": None,
-            "fcp_ms": None,
-            "tbt_ms": None,
-            "error": "pagespeed_request_failed",
-            "error_detail": str(exc),
-            "raw": {},
-        }
+        return _pagespeed_error_payload("pagespeed_request_failed", error_detail=str(exc))
 
-    raw_payload: dict[str, Any]
     try:
         raw_payload = response.json()
     except ValueError:
         raw_payload = {}
+    return _pagespeed_result(response.status_code, raw_payload)
 
-    if response.status_code >= 400:
-        return {
-            "performance_score": None,
-            "lcp_ms": None,
-            "cls": None,
-            "fcp_ms": None,
-            "tbt_ms": None,
-            "error": "pagespeed_http_error",
-            "status_code": response.status_code,
-            "raw": _trim_pagespeed_raw_payload(raw_payload if isinstance(raw_payload, dict) else {}),
-        }
 
-    metrics = _extract_pagespeed_metrics(raw_payload if isinstance(raw_payload, dict) else {})
-    return {
-        **metrics,
-        "error": "",
-        "raw": _trim_pagespeed_raw_payload(raw_payload if isinstance(raw_payload, dict) else {}),
-    }
+def _store_pagespeed_result(params: dict[str, Any], result: dict[str, Any]) -> None:
+    if not result.get("error"):
+        pagespeed_cache.store(params["url"], params["strategy"], result)
 
 
-def collect_basic_evidence(website_url: str) -> list[dict[str, Any]]:
-    """Collect homepage/robots/sitemap evidence payloads ready for WebsiteEvidence persistence."""
-    normalized_url, origin = normalize_and_split_url(website_url)
-    if not normalized_url or not origin:
-        error_payload = {
-            "exists": False,
-            "status_code": None,
-            "requested_url": website_url,
-            "body": "",
-            "error": "invalid_website_url",
+def _refresh_pagespeed_cache(params: dict[str, Any], timeout: float = REQUEST_TIMEOUT_SECONDS) -> None:
+    _store_pagespeed_result(params, _request_pagespeed(params, timeout))
+
+
+def _cached_pagespeed(
+    params: dict[str, Any],
+    timeout: float = REQUEST_TIMEOUT_SECONDS,
+) -> dict[str, Any] | None:
+    """
+    Serve a cached result for `params` (or None on a miss). Stale entries are
+    returned as-is while a background refresh replaces them.
+    """
+    payload, state = pagespeed_cache.lookup(params["url"], params["strategy"])
+    if state == pagespeed_cache.CACHE_MISS:
+        pagespeed_cache.pagespeed_cache_stats.record("misses")
+        return None
+    if state == pagespeed_cache.CACHE_STALE:
+        pagespeed_cache.pagespeed_cache_stats.record("stale_hits")
+        pagespeed_cache.schedule_refresh(
+            params["url"],
+            params["strategy"],
+            lambda: _refresh_pagespeed_cache(params, timeout),
+        )
+    else:
+        pagespeed_cache.pagespeed_cache_stats.record("hits")
+    return dict(payload or {})
+
+
+def fetch_pagespeed(
+    url: str,
+    *,
+    force_refresh: bool = False,
+    api_key: str | None = None,
+    timeout: float = REQUEST_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """
+    Fetch PageSpeed Insights data (mobile strategy) and return normalized metrics.
+    Never raises for operational errors; always returns structured payload.
+
+    Successful results are cached per (normalized URL, strategy); `force_refresh`
+    bypasses the cache lookup and overwrites the entry.
+    """
+    params, error_payload = _pagespeed_request_params(url, api_key)
+    if params is None:
+        return error_payload or _pagespeed_error_payload("invalid_website_url")
+
+    if force_refresh:
+        pagespeed_cache.pagespeed_cache_stats.record("forced")
+    else:
+        cached = _cached_pagespeed(params, timeout)
+        if cached is not None:
+            return cached
+
+    result = _request_pagespeed(params, timeout)
+    _store_pagespeed_result(params, result)
+    return result
+
+
+def _invalid_url_evidence_items(website_url: str) -> list[dict[str, Any]]:
+    error_payload = _fetch_error_payload(website_url, "invalid_website_url")
+    return [
+        {
+            "evidence_type": evidence_type,
+            "url": website_url,
+            "tool": "python_requests",
+            "payload": error_payload,
         }
-        return [
-            {
-                "evidence_type": "homepage_html_snippet",
-                "url": website_url,
-                "tool": "python_requests",
-                "payload": error_payload,
-            },
-            {
-                "evidence_type": "robots_txt",
-                "url": website_url,
-                "tool": "python_requests",
-                "payload": error_payload,
-            },
-            {
-                "evidence_type": "sitemap_xml",
-                "url": website_url,
-                "tool": "python_requests",
-                "payload": error_payload,
-            },
-        ]
+        for evidence_type in ("homepage_html_snippet", "robots_txt", "sitemap_xml")
+    ]
 
-    homepage = fetch_homepage(normalized_url)
-    robots = fetch_robots(origin)
-    sitemap = fetch_sitemap(origin)
+
+def _basic_evidence_items(
+    *,
+    normalized_url: str,
+    origin: str,
+    homepage: dict[str, Any],
+    robots: dict[str, Any],
+    sitemap: dict[str, Any],
+) -> list[dict[str, Any]]:
     return [
         {
             "evidence_type": "homepage_html_snippet",
@@ -365,14 +745,457 @@ def collect_basic_evidence(website_url: str) -> list[dict[str, Any]]:
         },
         {
             "evidence_type": "robots_txt",
-            "url": robots.get("requested_url", urljoin(f"{origin}/", "robots.txt")),
+            "url": robots.get("requested_url", _robots_url(origin)),
             "tool": "python_requests",
             "payload": robots,
         },
         {
             "evidence_type": "sitemap_xml",
-            "url": sitemap.get("requested_url", urljoin(f"{origin}/", "sitemap.xml")),
+            "url": sitemap.get("requested_url", _sitemap_url(origin)),
             "tool": "python_requests",
             "payload": sitemap,
         },
     ]
+
+
+def _pagespeed_evidence_item(website_url: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "evidence_type": "pagespeed_json",
+        "url": website_url,
+        "tool": "pagespeed_api",
+        "payload": payload,
+    }
+
+
+def collect_basic_evidence(
+    website_url: str,
+    validators: dict[str, dict[str, str]] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Collect homepage/robots/sitemap evidence payloads ready for WebsiteEvidence persistence.
+
+    `validators` maps evidence_type -> stored response validators
+    (see `evidence_ingest.fetch_validators_for_lead`) for conditional re-fetches.
+    """
+    normalized_url, origin = normalize_and_split_url(website_url)
+    if not normalized_url or not origin:
+        return _invalid_url_evidence_items(website_url)
+
+    validators = validators or {}
+    return _basic_evidence_items(
+        normalized_url=normalized_url,
+        origin=origin,
+        homepage=fetch_homepage(normalized_url, validators.get("homepage_html_snippet")),
+        robots=fetch_robots(origin, validators.get("robots_txt")),
+        sitemap=fetch_sitemap(origin, validators.get("sitemap_xml")),
+    )
+
+
+class _ConcurrencyLimiter:
+    """Global + per-host concurrency caps for the async batch collector."""
+
+    def __init__(self, *, max_concurrency: int, per_host_limit: int):
+        self._global = asyncio.Semaphore(max(1, max_concurrency))
+        self._per_host_limit = max(1, per_host_limit)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        host = (urlparse(url).hostname or "").lower()
+        host_semaphore = self._hosts.setdefault(host, asyncio.Semaphore(self._per_host_limit))
+        # Take the host slot first so a busy host never parks global capacity.
+        async with host_semaphore:
+            async with self._global:
+                yield
+
+    @asynccontextmanager
+    async def global_slot(self) -> AsyncIterator[None]:
+        """Global cap only, for API calls whose pacing belongs to a quota bucket, not a host cap."""
+        async with self._global:
+            yield
+
+
+def _httpx_headers(headers: httpx.Headers) -> dict[str, str]:
+    """Mirror `dict(requests_response.headers)`: original casing, repeated headers joined."""
+    out: dict[str, str] = {}
+    lowered_keys: dict[str, str] = {}
+    for raw_key, raw_value in headers.raw:
+        key = raw_key.decode("latin-1")
+        value = raw_value.decode("latin-1")
+        existing_key = lowered_keys.get(key.lower())
+        if existing_key is None:
+            lowered_keys[key.lower()] = key
+            out[key] = value
+        else:
+            out[existing_key] = f"{out[existing_key]}, {value}"
+    return out
+
+
+async def _async_fetch_url(
+    client: httpx.AsyncClient,
+    limiter: _ConcurrencyLimiter,
+    url: str,
+    accept: str,
+    validators: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    try:
+        async with limiter.slot(url):
+            # Checked after the host slot is held so queued fetches see a circuit that just opened.
+            if not circuit_breaker.allow(url):
+                return _circuit_open_payload(url)
+            async with client.stream(
+                "GET",
+                url,
+                headers=_request_headers(accept, validators),
+                follow_redirects=True,
+                extensions={"trace": AsyncConnectionTrace()},
+            ) as response:
+                circuit_breaker.record_success(url)
+                headers = _httpx_headers(response.headers)
+                if response.status_code == 304 and validators:
+                    return _not_modified_result(
+                        url=url,
+                        final_url=str(response.url),
+                        headers=headers,
+                        validators=validators,
+                    )
+                reader = _BoundedBodyReader(headers)
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+                    if reader.feed(chunk):
+                        break
+    except (httpx.HTTPError, httpx.InvalidURL) as exc:
+        circuit_breaker.record_exception(url, exc)
+        return _fetch_error_payload(url, str(exc))
+
+    return _streamed_fetch_result(
+        url=url,
+        status_code=response.status_code,
+        final_url=str(response.url),
+        reader=reader,
+        headers=headers,
+    )
+
+
+async def _async_fetch_sitemap_document(
+    client: httpx.AsyncClient,
+    limiter: _ConcurrencyLimiter,
+    url: str,
+    summary: SitemapSummary,
+    *,
+    is_root: bool,
+    validators: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    parser = SitemapDocumentParser(summary, is_root=is_root)
+    bytes_read = 0
+    try:
+        async with limiter.slot(url):
+            if not circuit_breaker.allow(url):
+                return _circuit_open_payload(url)
+            async with client.stream(
+                "GET",
+                url,
+                headers=_request_headers(SITEMAP_ACCEPT, validators),
+                follow_redirects=True,
+                extensions={"trace": AsyncConnectionTrace()},
+            ) as response:
+                circuit_breaker.record_success(url)
+                headers = _httpx_headers(response.headers)
+                if response.status_code == 304 and validators:
+                    return _not_modified_result(
+                        url=url,
+                        final_url=str(response.url),
+                        headers=headers,
+                        validators=validators,
+                    )
+                if 200 <= response.status_code < 300:
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+                        bytes_read += len(chunk)
+                        if parser.feed(chunk):
+                            break
+                    parser.close()
+    except (httpx.HTTPError, httpx.InvalidURL) as exc:
+        circuit_breaker.record_exception(url, exc)
+        return _fetch_error_payload(url, str(exc))
+
+    return _sitemap_result(
+        url=url,
+        status_code=response.status_code,
+        final_url=str(response.url),
+        headers=headers,
+        bytes_read=bytes_read,
+        summary=summary if 200 <= response.status_code < 300 else None,
+    )
+
+
+async def _async_fetch_sitemap(
+    client: httpx.AsyncClient,
+    limiter: _ConcurrencyLimiter,
+    origin: str,
+    validators: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    url = _sitemap_url(origin)
+    summary = SitemapSummary(site_url=origin)
+    payload = await _async_fetch_sitemap_document(client, limiter, url, summary, is_root=True, validators=validators)
+    if "summary" not in payload:
+        return payload
+    while (child_url := summary.pop_child_sitemap()) is not None:
+        child_payload = await _async_fetch_sitemap_document(client, limiter, child_url, summary, is_root=False)
+        _merge_child_sitemap(payload, child_payload, summary)
+    return payload
+
+
+async def _async_fetch_pagespeed(
+    client: httpx.AsyncClient,
+    limiter: _ConcurrencyLimiter,
+    url: str,
+) -> dict[str, Any]:
+    params, error_payload = _pagespeed_request_params(url)
+    if params is None:
+        return error_payload or _pagespeed_error_payload("invalid_website_url")
+
+    async def send() -> httpx.Response:
+        # The per-host cap protects audited sites; PageSpeed is paced by its quota bucket,
+        # and a slot is held per attempt so quota waits never park global capacity.
+        async with limiter.global_slot():
+            return await client.get(PAGESPEED_API_URL, params=params, extensions={"trace": AsyncConnectionTrace()})
+
+    try:
+        response = await async_call_with_quota(get_bucket("pagespeed", params["key"]), send)
+    except QuotaExhaustedError as exc:
+        return _pagespeed_error_payload("pagespeed_quota_exhausted", error_detail=str(exc))
+    except (httpx.HTTPError, httpx.InvalidURL) as exc:
+        return _pagespeed_error_payload("pagespeed_request_failed", error_detail=str(exc))
+
+    try:
+        raw_payload = response.json()
+    except ValueError:
+        raw_payload = {}
+    return _pagespeed_result(response.status_code, raw_payload)
+
+
+PLANNED_FETCH_TYPES = ("homepage_html_snippet", "robots_txt", "sitemap_xml")
+
+
+def _target_fetch_keys(normalized_url: str, origin: str, include_pagespeed: bool) -> list[tuple[str, str]]:
+    keys = [
+        ("homepage_html_snippet", normalized_url),
+        ("robots_txt", _robots_url(origin)),
+        ("sitemap_xml", _sitemap_url(origin)),
+    ]
+    if include_pagespeed:
+        keys.append(("pagespeed_json", normalized_url))
+    return keys
+
+
+@dataclass(frozen=True)
+class EvidenceBatchPlan:
+    """
+    Distinct fetches for a batch of websites.
+
+    Leads sharing a normalized URL share the homepage/PageSpeed fetches; leads
+    sharing an origin share robots.txt and sitemap.xml.
+    """
+
+    website_urls: tuple[str, ...]
+    targets: tuple[tuple[str, str] | None, ...]
+    fetch_keys: tuple[tuple[str, str], ...]
+    include_pagespeed: bool
+
+    def keys_for(self, index: int) -> list[tuple[str, str]]:
+        target = self.targets[index]
+        if target is None:
+            return []
+        return _target_fetch_keys(target[0], target[1], self.include_pagespeed)
+
+    @property
+    def fetches_requested(self) -> int:
+        return sum(len(self.keys_for(index)) for index in range(len(self.targets)))
+
+    @property
+    def fetches_planned(self) -> int:
+        return len(self.fetch_keys)
+
+    @property
+    def fetches_saved(self) -> int:
+        return self.fetches_requested - self.fetches_planned
+
+
+def plan_evidence_batch(website_urls: list[str], *, include_pagespeed: bool = True) -> EvidenceBatchPlan:
+    targets: list[tuple[str, str] | None] = []
+    fetch_keys: dict[tuple[str, str], None] = {}
+    for website_url in website_urls:
+        normalized_url, origin = normalize_and_split_url(website_url)
+        if not normalized_url or not origin:
+            targets.append(None)
+            continue
+        targets.append((normalized_url, origin))
+        for key in _target_fetch_keys(normalized_url, origin, include_pagespeed):
+            fetch_keys.setdefault(key, None)
+    return EvidenceBatchPlan(
+        website_urls=tuple(website_urls),
+        targets=tuple(targets),
+        fetch_keys=tuple(fetch_keys),
+        include_pagespeed=include_pagespeed,
+    )
+
+
+def _shared_validators(
+    plan: EvidenceBatchPlan,
+    validators: list[dict[str, dict[str, str]]] | None,
+) -> dict[tuple[str, str], dict[str, str]]:
+    """
+    Validators per shared fetch. A conditional GET is only sent when every lead
+    sharing the fetch holds the same validators, so a 304 is valid for all of them.
+    """
+    if not validators:
+        return {}
+    candidates: dict[tuple[str, str], list[dict[str, str]]] = {}
+    for index in range(len(plan.targets)):
+        lead_validators = validators[index] if index < len(validators) else None
+        for key in plan.keys_for(index):
+            if key[0] in PLANNED_FETCH_TYPES:
+                candidates.setdefault(key, []).append((lead_validators or {}).get(key[0]) or {})
+    return {
+        key: values[0]
+        for key, values in candidates.items()
+        if values[0] and all(value == values[0] for value in values)
+    }
+
+
+async def _async_fetch_planned(
+    client: httpx.AsyncClient,
+    limiter: _ConcurrencyLimiter,
+    key: tuple[str, str],
+    validators: dict[str, str] | None,
+) -> dict[str, Any]:
+    fetch_type, url = key
+    if fetch_type == "pagespeed_json":
+        return await _async_fetch_pagespeed(client, limiter, url)
+    if fetch_type == "sitemap_xml":
+        _sitemap_target, origin = normalize_and_split_url(url)
+        return await _async_fetch_sitemap(client, limiter, origin or url, validators)
+    accept = HOMEPAGE_ACCEPT if fetch_type == "homepage_html_snippet" else ROBOTS_ACCEPT
+    return await _async_fetch_url(client, limiter, url, accept, validators)
+
+
+def _planned_evidence_items(
+    plan: EvidenceBatchPlan,
+    index: int,
+    results: dict[tuple[str, str], dict[str, Any]],
+) -> list[dict[str, Any]]:
+    website_url = plan.website_urls[index]
+    target = plan.targets[index]
+    if target is None:
+        items = _invalid_url_evidence_items(website_url)
+        if plan.include_pagespeed:
+            items.append(_pagespeed_evidence_item(website_url, _pagespeed_error_payload("invalid_website_url")))
+        return items
+
+    # Copies, so fanned-out payloads never alias between leads.
+    payloads = [copy.deepcopy(results[key]) for key in plan.keys_for(index)]
+    normalized_url, origin = target
+    items = _basic_evidence_items(
+        normalized_url=normalized_url,
+        origin=origin,
+        homepage=payloads[0],
+        robots=payloads[1],
+        sitemap=payloads[2],
+    )
+    if plan.include_pagespeed:
+        items.append(_pagespeed_evidence_item(website_url, payloads[3]))
+    return items
+
+
+async def collect_evidence_batch_async(
+    website_urls: list[str],
+    *,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    per_host_limit: int = DEFAULT_PER_HOST_CONCURRENCY,
+    include_pagespeed: bool = True,
+    transport: httpx.AsyncBaseTransport | None = None,
+    validators: list[dict[str, dict[str, str]]] | None = None,
+    known_pagespeed: dict[str, dict[str, Any]] | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Collect homepage/robots/sitemap (+ PageSpeed) evidence for many websites concurrently.
+
+    Returns one item list per input URL, in input order, with the same item shape
+    `collect_basic_evidence` + `fetch_pagespeed` produce for `persist_evidence_items`.
+    Each distinct URL is fetched once (see `plan_evidence_batch`) and fanned out.
+    `validators`, when given, is aligned with `website_urls` (one evidence_type -> validators
+    mapping per website) and enables conditional re-fetches. `known_pagespeed` maps
+    normalized URL -> already-known (cached) PageSpeed result, which is not re-fetched.
+    This coroutine never touches the database; `collect_evidence_batch` applies the cache.
+    """
+    plan = plan_evidence_batch(website_urls, include_pagespeed=include_pagespeed)
+    shared_validators = _shared_validators(plan, validators)
+    results: dict[tuple[str, str], dict[str, Any]] = {
+        ("pagespeed_json", url): payload for url, payload in (known_pagespeed or {}).items()
+    }
+    pending = [key for key in plan.fetch_keys if key not in results]
+
+    limiter = _ConcurrencyLimiter(max_concurrency=max_concurrency, per_host_limit=per_host_limit)
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS, transport=transport) as client:
+        fetched = await asyncio.gather(
+            *[_async_fetch_planned(client, limiter, key, shared_validators.get(key)) for key in pending]
+        )
+    results.update(zip(pending, fetched))
+    return [_planned_evidence_items(plan, index, results) for index in range(len(website_urls))]
+
+
+def collect_evidence_batch(
+    website_urls: list[str],
+    *,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    per_host_limit: int = DEFAULT_PER_HOST_CONCURRENCY,
+    include_pagespeed: bool = True,
+    transport: httpx.AsyncBaseTransport | None = None,
+    validators: list[dict[str, dict[str, str]]] | None = None,
+    refresh_pagespeed: bool = False,
+) -> list[list[dict[str, Any]]]:
+    """
+    Synchronous entry point for `collect_evidence_batch_async` (management commands, tasks).
+
+    PageSpeed results are served from / written to the shared cache here, around the
+    async fetch, so only uncached URLs hit the API.
+    """
+    plan = plan_evidence_batch(website_urls, include_pagespeed=include_pagespeed)
+    known_pagespeed = _cached_pagespeed_for_plan(plan, force_refresh=refresh_pagespeed)
+
+    batches = asyncio.run(
+        collect_evidence_batch_async(
+            website_urls,
+            max_concurrency=max_concurrency,
+            per_host_limit=per_host_limit,
+            include_pagespeed=include_pagespeed,
+            transport=transport,
+            validators=validators,
+            known_pagespeed=known_pagespeed,
+        )
+    )
+
+    if include_pagespeed:
+        stored: set[str] = set(known_pagespeed)
+        for target, items in zip(plan.targets, batches):
+            if target is None or target[0] in stored:
+                continue
+            stored.add(target[0])
+            _store_pagespeed_result({"url": target[0], "strategy": PAGESPEED_STRATEGY}, items[-1]["payload"])
+    return batches
+
+
+def _cached_pagespeed_for_plan(plan: EvidenceBatchPlan, *, force_refresh: bool) -> dict[str, dict[str, Any]]:
+    known: dict[str, dict[str, Any]] = {}
+    for fetch_type, url in plan.fetch_keys:
+        if fetch_type != "pagespeed_json":
+            continue
+        params, _error_payload = _pagespeed_request_params(url)
+        if params is None:
+            continue
+        if force_refresh:
+            pagespeed_cache.pagespeed_cache_stats.record("forced")
+            continue
+        cached = _cached_pagespeed(params)
+        if cached is not None:
+            known[url] = cached
+    return known
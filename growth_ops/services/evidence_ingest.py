@@ -7,9 +7,20 @@ import re
 from typing import Any
 
 from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
 
 from growth_ops.models import Lead, WebsiteEvidence
-from growth_ops.services.lead_ingest import domain_from_url, normalize_website_url
+from growth_ops.services.evidence_changes import record_evidence_changes
+from growth_ops.services.lead_features import record_evidence_features
+from growth_ops.services.lead_ingest import (
+    domain_from_url,
+    find_lead_by_company,
+    find_lead_by_website,
+    normalize_website_url,
+    website_match_key,
+)
+from growth_ops.services.sitemap_parser import SUMMARY_DEDUPE_FIELDS
 
 FETCH_V1_EVIDENCE_TYPES = {
     "homepage_html_snippet",
@@ -17,6 +28,8 @@ FETCH_V1_EVIDENCE_TYPES = {
     "sitemap_xml",
     "pagespeed_json",
 }
+CONDITIONAL_FETCH_EVIDENCE_TYPES = ("homepage_html_snippet", "robots_txt", "sitemap_xml")
+CONDITIONAL_FETCH_TOOL = "python_requests"
 MAX_DEDUPE_TEXT_LENGTH = 12_000
 WHITESPACE_RE = re.compile(r"\s+")
 TAG_GAP_RE = re.compile(r">\s+<")
@@ -25,6 +38,11 @@ NOSCRIPT_BLOCK_RE = re.compile(r"<noscript\b[^>]*>.*?</noscript>", re.IGNORECASE
 HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
 XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>", re.IGNORECASE)
 SITEMAP_LASTMOD_RE = re.compile(r"<lastmod\b[^>]*>.*?</lastmod>", re.IGNORECASE | re.DOTALL)
+# (open tag, close tag) of the blocks removed from homepage HTML, in sequential-pass order.
+HOMEPAGE_STRIP_BLOCKS = (("<script", "</script>"), ("<noscript", "</noscript>"), ("<!--", "-->"))
+# Non-ASCII characters that IGNORECASE regexes match as ASCII letters of those tags
+# (or whose lower() changes length); texts containing them use the regex passes.
+HOMEPAGE_CASE_FOLD_SPECIALS = ("\u0130", "\u0131", "\u017f")
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +102,73 @@ def _normalize_text_for_dedupe(text: str) -> str:
     return _truncate_for_dedupe(_collapse_whitespace(text))
 
 
+def _strip_homepage_html_sequential(html: str) -> str:
+    """Reference canonicalization: script, noscript and comment passes run one after another."""
+    stripped = SCRIPT_BLOCK_RE.sub(" ", html or "")
+    stripped = NOSCRIPT_BLOCK_RE.sub(" ", stripped)
+    return HTML_COMMENT_RE.sub(" ", stripped)
+
+
+def _homepage_block_end(html: str, lowered: str, start: int, kind: int) -> int | None:
+    """
+    End offset of the block whose open tag is at `start`, mirroring the strip regexes.
+    Returns None when that regex fails at `start` only, -1 when it can never match again.
+    """
+    open_tag, close_tag = HOMEPAGE_STRIP_BLOCKS[kind]
+    after = start + len(open_tag)
+    if kind == 2:
+        close = lowered.find(close_tag, after)
+        return -1 if close == -1 else close + len(close_tag)
+    if after < len(html) and (html[after].isalnum() or html[after] == "_"):
+        return None  # `\b` fails, e.g. `<scripts>`
+    tag_end = html.find(">", after)
+    if tag_end == -1:
+        return -1
+    close = lowered.find(close_tag, tag_end + 1)
+    return -1 if close == -1 else close + len(close_tag)
+
+
+def _strip_homepage_html_single_pass(html: str) -> str | None:
+    """
+    Strip script/noscript/comment blocks in one left-to-right scan using `str.find`.
+
+    Taking the leftmost block of any kind equals the sequential passes unless a
+    noscript block contains `<script` or a comment contains `<script`/`<noscript`
+    (the later passes would then see different text). Returns None in that case, or
+    for text with `HOMEPAGE_CASE_FOLD_SPECIALS`, so the caller falls back to
+    `_strip_homepage_html_sequential`.
+    """
+    if not html.isascii() and any(special in html for special in HOMEPAGE_CASE_FOLD_SPECIALS):
+        return None
+    lowered = html.lower()
+    next_starts = [lowered.find(open_tag) for open_tag, _close_tag in HOMEPAGE_STRIP_BLOCKS]
+    pieces: list[str] = []
+    position = 0
+    while True:
+        candidates = [(start, kind) for kind, start in enumerate(next_starts) if start != -1]
+        if not candidates:
+            break
+        start, kind = min(candidates)
+        end = _homepage_block_end(html, lowered, start, kind)
+        if end is None:
+            next_starts[kind] = lowered.find(HOMEPAGE_STRIP_BLOCKS[kind][0], start + 1)
+            continue
+        if end == -1:
+            next_starts[kind] = -1
+            continue
+        if kind == 1 and lowered.find("<script", start, end) != -1:
+            return None
+        if kind == 2 and (lowered.find("<script", start, end) != -1 or lowered.find("<noscript", start, end) != -1):
+            return None
+        pieces.append(html[position:start])
+        position = end
+        for other_kind, other_start in enumerate(next_starts):
+            if other_start != -1 and other_start < end:
+                next_starts[other_kind] = lowered.find(HOMEPAGE_STRIP_BLOCKS[other_kind][0], end)
+    pieces.append(html[position:])
+    return " ".join(pieces)
+
+
 def _normalize_homepage_html_for_dedupe(html: str) -> tuple[str, str]:
     """
     Homepage-specific canonicalization for dedupe:
@@ -93,16 +178,27 @@ def _normalize_homepage_html_for_dedupe(html: str) -> tuple[str, str]:
     - collapse whitespace and trim
     - deterministically truncate for comparison payload
     Returns (normalized_truncated_body, normalized_body_hash).
+
+    Output is identical to running the three removals as separate regex passes.
     """
-    stripped = SCRIPT_BLOCK_RE.sub(" ", html or "")
-    stripped = NOSCRIPT_BLOCK_RE.sub(" ", stripped)
-    stripped = HTML_COMMENT_RE.sub(" ", stripped)
-    normalized_full = _collapse_whitespace(stripped)
+    html = html or ""
+    stripped = _strip_homepage_html_single_pass(html)
+    if stripped is None:
+        stripped = _strip_homepage_html_sequential(html)
+    # Same result as WHITESPACE_RE collapse + strip: both split on str.isspace() characters.
+    normalized_full = " ".join(stripped.split())
     normalized_truncated = _truncate_for_dedupe(normalized_full)
     normalized_hash = hashlib.sha256(normalized_full.encode("utf-8")).hexdigest()[:16]
     return normalized_truncated, normalized_hash
 
 
+def _normalize_homepage_html_sequential(html: str) -> tuple[str, str]:
+    """Multi-pass reference for `_normalize_homepage_html_for_dedupe` (exactness checks and benchmarks)."""
+    normalized_full = _collapse_whitespace(_strip_homepage_html_sequential(html or ""))
+    normalized_hash = hashlib.sha256(normalized_full.encode("utf-8")).hexdigest()[:16]
+    return _truncate_for_dedupe(normalized_full), normalized_hash
+
+
 def _normalize_sitemap_xml_for_dedupe(xml: str) -> tuple[str, str]:
     """
     Sitemap-specific canonicalization for dedupe:
@@ -173,6 +269,14 @@ def canonicalize_evidence_payload(evidence_type: str, payload: Any) -> Any:
             "body": body,
             "body_hash": body_hash,
         }
+    if evidence_type == "sitemap_xml" and isinstance(payload.get("summary"), dict):
+        summary = payload["summary"]
+        return {
+            "exists": bool(payload.get("exists", False)),
+            "status_code": _normalize_status_code(payload.get("status_code")),
+            "requested_url": requested_url,
+            "summary": {field: summary.get(field) for field in SUMMARY_DEDUPE_FIELDS},
+        }
     if evidence_type == "sitemap_xml":
         body, body_hash = _normalize_sitemap_xml_for_dedupe(str(payload.get("body") or ""))
         return {
@@ -201,6 +305,12 @@ def canonicalize_evidence_payload(evidence_type: str, payload: Any) -> Any:
     }
 
 
+def evidence_fingerprint(evidence_type: str, payload: Any) -> str:
+    """sha256 of the canonical dedupe payload; stored on `WebsiteEvidence.fingerprint` at write time."""
+    canonical_json = _canonical_json(canonicalize_evidence_payload(evidence_type, payload))
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
 def find_matching_evidence(
     *,
     lead: Lead,
@@ -208,35 +318,115 @@ def find_matching_evidence(
     url: str,
     tool: str,
     payload: Any,
+    fingerprint: str | None = None,
 ) -> WebsiteEvidence | None:
-    recent_records = lead.website_evidence.filter(
-        evidence_type=evidence_type,
-        url=url,
-        tool=tool,
-    ).order_by("-created_at")[:25]
-    canonical_target = canonicalize_evidence_payload(evidence_type, payload)
-    target_payload = _canonical_json(canonical_target)
-    target_fingerprint = hashlib.sha256(target_payload.encode("utf-8")).hexdigest()[:16]
+    """
+    Return a stored row whose canonical payload matches `payload`.
+
+    Fingerprinted rows are matched with one indexed lookup. Rows written before the
+    fingerprint column existed (blank fingerprint) fall back to canonical comparison
+    over the 25 most recent of them, and get their fingerprint filled in on a match.
+    """
+    target_fingerprint = fingerprint or evidence_fingerprint(evidence_type, payload)
+    scoped_records = lead.website_evidence.filter(evidence_type=evidence_type, url=url, tool=tool)
+    # Compacted rows keep their fingerprint but no longer carry the evidence body.
+    match = (
+        scoped_records.filter(fingerprint=target_fingerprint, compacted_at__isnull=True)
+        .order_by("-created_at")
+        .first()
+    )
+    if match is not None:
+        return match
+
+    legacy_records = scoped_records.filter(fingerprint="").order_by("-created_at")[:25]
     candidate_fingerprints: list[str] = []
-    for record in recent_records:
-        candidate_payload = canonicalize_evidence_payload(evidence_type, record.payload)
-        candidate_json = _canonical_json(candidate_payload)
-        if evidence_type == "sitemap_xml":
-            candidate_fingerprints.append(hashlib.sha256(candidate_json.encode("utf-8")).hexdigest()[:16])
-        if candidate_json == target_payload:
+    for record in legacy_records:
+        candidate_fingerprint = evidence_fingerprint(evidence_type, record.payload)
+        candidate_fingerprints.append(candidate_fingerprint[:16])
+        if candidate_fingerprint == target_fingerprint:
+            record.fingerprint = candidate_fingerprint
+            record.save(update_fields=["fingerprint"])
             return record
     if evidence_type == "sitemap_xml":
         logger.debug(
-            "Sitemap dedupe miss: lead_id=%s url=%s tool=%s target_fp=%s candidates=%s",
+            "Sitemap dedupe miss: lead_id=%s url=%s tool=%s target_fp=%s legacy_candidates=%s",
             lead.id,
             url,
             tool,
-            target_fingerprint,
+            target_fingerprint[:16],
             candidate_fingerprints,
         )
     return None
 
 
+def response_validators(payload: Any) -> dict[str, str]:
+    """Extract `ETag` / `Last-Modified` (case-insensitive) from a stored fetch payload's headers."""
+    if not isinstance(payload, dict) or payload.get("not_modified"):
+        return {}
+    headers = payload.get("headers")
+    if not isinstance(headers, dict):
+        return {}
+    validators: dict[str, str] = {}
+    for key, value in headers.items():
+        lowered = str(key).strip().lower()
+        text = str(value or "").strip()
+        if not text:
+            continue
+        if lowered == "etag":
+            validators["etag"] = text
+        elif lowered == "last-modified":
+            validators["last_modified"] = text
+    return validators
+
+
+def fetch_validators_for_lead(lead: Lead) -> dict[str, dict[str, str]]:
+    """
+    Map evidence_type -> validators of the latest fetched row of that type.
+
+    Only the newest row per type is considered: a 304 must point back at exactly
+    the row `persist_evidence_items` will reuse.
+    """
+    validators: dict[str, dict[str, str]] = {}
+    seen_types: set[str] = set()
+    records = lead.website_evidence.filter(
+        evidence_type__in=CONDITIONAL_FETCH_EVIDENCE_TYPES,
+        tool=CONDITIONAL_FETCH_TOOL,
+    ).order_by("-created_at", "-id")
+    for record in records:
+        if record.evidence_type in seen_types:
+            continue
+        seen_types.add(record.evidence_type)
+        record_validators = response_validators(record.payload)
+        if record_validators:
+            validators[record.evidence_type] = record_validators
+        if len(seen_types) == len(CONDITIONAL_FETCH_EVIDENCE_TYPES):
+            break
+    return validators
+
+
+def find_revalidated_evidence(
+    *,
+    lead: Lead,
+    evidence_type: str,
+    url: str,
+    tool: str,
+    payload: dict[str, Any],
+) -> WebsiteEvidence | None:
+    """Return the stored row whose validators produced a 304, without touching its body."""
+    sent_validators = payload.get("validators") or {}
+    if not sent_validators:
+        return None
+    recent_records = lead.website_evidence.filter(
+        evidence_type=evidence_type,
+        url=url,
+        tool=tool,
+    ).order_by("-created_at")[:25]
+    for record in recent_records:
+        if response_validators(record.payload) == sent_validators:
+            return record
+    return None
+
+
 def resolve_lead_for_evidence(validated_data: dict[str, Any]) -> Lead:
     """
     Resolve or create a lead for incoming evidence using the current API behavior.
@@ -253,12 +443,12 @@ def resolve_lead_for_evidence(validated_data: dict[str, Any]) -> Lead:
     source = (validated_data.get("source") or "n8n").strip() or "n8n"
 
     if website_url:
-        existing = Lead.objects.filter(website_url__iexact=website_url).order_by("-created_at").first()
+        existing = find_lead_by_website(website_url)
         if existing:
             return existing
 
     if company_name:
-        existing = Lead.objects.filter(company_name__iexact=company_name).order_by("-created_at").first()
+        existing = find_lead_by_company(company_name)
         if existing:
             return existing
 
@@ -277,20 +467,43 @@ def resolve_lead_for_evidence(validated_data: dict[str, Any]) -> Lead:
 
 @transaction.atomic
 def persist_evidence_items(*, lead: Lead, items: list[dict[str, Any]]) -> dict[str, Any]:
-    """Persist evidence with duplicate detection and return summary counters."""
-    created_ids: list[int] = []
+    """
+    Persist evidence with duplicate detection and return summary counters.
+    Newly written rows are appended to the evidence change log.
+    """
+    created_records: list[WebsiteEvidence] = []
     reused_ids: list[int] = []
+    not_modified_count = 0
+    revalidation_miss_count = 0
 
     for item in items:
         normalized_url = normalize_website_url(item.get("url", "")) or lead.website_url
         tool = item.get("tool", "")
         payload = item.get("payload", {})
+        if isinstance(payload, dict) and payload.get("not_modified"):
+            # 304 revalidation: reuse the stored row as-is, no body download or canonicalization.
+            revalidated = find_revalidated_evidence(
+                lead=lead,
+                evidence_type=item["evidence_type"],
+                url=normalized_url,
+                tool=tool,
+                payload=payload,
+            )
+            if revalidated is not None:
+                reused_ids.append(revalidated.id)
+                not_modified_count += 1
+            else:
+                # The marker has no body: storing it would shadow the real evidence.
+                revalidation_miss_count += 1
+            continue
+        fingerprint = evidence_fingerprint(item["evidence_type"], payload)
         existing = find_matching_evidence(
             lead=lead,
             evidence_type=item["evidence_type"],
             url=normalized_url,
             tool=tool,
             payload=payload,
+            fingerprint=fingerprint,
         )
         if existing is not None:
             reused_ids.append(existing.id)
@@ -302,9 +515,13 @@ def persist_evidence_items(*, lead: Lead, items: list[dict[str, Any]]) -> dict[s
             url=normalized_url,
             tool=tool,
             payload=payload,
+            fingerprint=fingerprint,
         )
-        created_ids.append(record.id)
+        created_records.append(record)
 
+    record_evidence_changes(created_records)
+    record_evidence_features(created_records)
+    created_ids = [record.id for record in created_records]
     if created_ids and lead.status == "new":
         lead.status = "evidence_collected"
         lead.save(update_fields=["status", "updated_at"])
@@ -313,10 +530,230 @@ def persist_evidence_items(*, lead: Lead, items: list[dict[str, Any]]) -> dict[s
         "lead_id": lead.id,
         "created_count": len(created_ids),
         "reused_count": len(reused_ids),
+        "not_modified_count": not_modified_count,
+        "revalidation_miss_count": revalidation_miss_count,
         "evidence_ids": created_ids + reused_ids,
     }
 
 
+def _newest_leads_by_company(company_keys: set[str]) -> dict[str, Lead]:
+    """Lowercased company name -> newest lead, in one query on the `Lower(company_name)` index."""
+    if not company_keys:
+        return {}
+    matches: dict[str, Lead] = {}
+    leads = (
+        Lead.objects.annotate(company_name_lower=Lower("company_name"))
+        .filter(company_name_lower__in=company_keys)
+        .order_by("-created_at")
+    )
+    for lead in leads:
+        matches.setdefault(lead.company_name_lower, lead)
+    return matches
+
+
+def _newest_leads_by_website(match_keys: set[str]) -> dict[str, Lead]:
+    """`Lead.website_match_key` -> newest lead with that website, in one indexed query."""
+    if not match_keys:
+        return {}
+    matches: dict[str, Lead] = {}
+    for lead in Lead.objects.filter(website_match_key__in=match_keys).order_by("-created_at"):
+        matches.setdefault(lead.website_match_key, lead)
+    return matches
+
+
+def resolve_leads_for_evidence(groups: list[dict[str, Any]]) -> list[Lead | None]:
+    """
+    Bulk counterpart of `resolve_lead_for_evidence` with the same matching order
+    (lead_id, then website, then company_name), using one query per key kind.
+
+    Returns None for a group whose `lead_id` does not exist or that has no usable key.
+    Groups matching nothing fall back to `resolve_lead_for_evidence` so lead creation
+    (and reuse of a lead created by an earlier group in the batch) behaves identically.
+    """
+    lead_ids = {group["lead_id"] for group in groups if group.get("lead_id") is not None}
+    leads_by_id = Lead.objects.in_bulk(lead_ids) if lead_ids else {}
+    website_keys = {
+        website_match_key(group.get("website_url", "")) for group in groups if group.get("lead_id") is None
+    } - {""}
+    company_keys = {
+        (group.get("company_name") or "").strip().lower()
+        for group in groups
+        if group.get("lead_id") is None
+    } - {""}
+    leads_by_website = _newest_leads_by_website(website_keys)
+    leads_by_company = _newest_leads_by_company(company_keys)
+
+    resolved: list[Lead | None] = []
+    for group in groups:
+        if group.get("lead_id") is not None:
+            resolved.append(leads_by_id.get(group["lead_id"]))
+            continue
+        website_url = group.get("website_url", "")
+        company_key = (group.get("company_name") or "").strip().lower()
+        lead = leads_by_website.get(website_match_key(website_url))
+        if lead is None and company_key:
+            lead = leads_by_company.get(company_key)
+        if lead is None:
+            try:
+                lead = resolve_lead_for_evidence(group)
+            except Lead.DoesNotExist:
+                lead = None
+        resolved.append(lead)
+    return resolved
+
+
+def _evidence_items_for_group(group: dict[str, Any], lead: Lead) -> list[dict[str, Any]]:
+    items = list(group.get("items", []))
+    technical_data = group.get("technical_data")
+    if isinstance(technical_data, dict):
+        items.extend(technical_data_to_evidence_items(technical_data, default_url=lead.website_url))
+    return items
+
+
+@transaction.atomic
+def persist_evidence_batch(groups: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Persist evidence for many leads at once and return one summary per group.
+
+    Leads are resolved in bulk, every item is fingerprinted up front and matched
+    against stored rows in one query, and new rows are written with `bulk_create`.
+    Groups that cannot be resolved get an `error` entry instead of failing the batch.
+    """
+    leads = resolve_leads_for_evidence(groups)
+    results: list[dict[str, Any]] = []
+    pending: list[tuple[dict[str, Any], Lead, list[dict[str, Any]]]] = []
+    for index, (group, lead) in enumerate(zip(groups, leads)):
+        if lead is None:
+            error = "lead_id_not_found" if group.get("lead_id") is not None else "lead_not_found"
+            results.append({"index": index, "error": error})
+            continue
+        items = _evidence_items_for_group(group, lead)
+        if not items:
+            results.append({"index": index, "lead_id": lead.id, "error": "no_evidence_items_provided"})
+            continue
+        result = {
+            "index": index,
+            "lead_id": lead.id,
+            "created_count": 0,
+            "reused_count": 0,
+            "not_modified_count": 0,
+            "revalidation_miss_count": 0,
+            "evidence_ids": [],
+        }
+        results.append(result)
+        pending.append((result, lead, items))
+
+    # Fingerprint every item once, then match all of them with a single indexed query.
+    prepared: list[tuple[dict[str, Any], Lead, dict[str, Any], tuple[int, str, str, str, str]]] = []
+    for result, lead, items in pending:
+        for item in items:
+            normalized_url = normalize_website_url(item.get("url", "")) or lead.website_url
+            key = (
+                lead.id,
+                item["evidence_type"],
+                normalized_url,
+                item.get("tool", ""),
+                evidence_fingerprint(item["evidence_type"], item.get("payload", {})),
+            )
+            prepared.append((result, lead, item, key))
+
+    existing_ids: dict[tuple[int, str, str, str, str], int] = {}
+    legacy_scopes: set[tuple[int, str, str, str]] = set()
+    if prepared:
+        batch_lead_ids = {key[0] for _result, _lead, _item, key in prepared}
+        stored = (
+            WebsiteEvidence.objects.filter(
+                lead_id__in=batch_lead_ids,
+                fingerprint__in={key[4] for _result, _lead, _item, key in prepared},
+                compacted_at__isnull=True,
+            )
+            .order_by("-created_at")
+            .values_list("id", "lead_id", "evidence_type", "url", "tool", "fingerprint")
+        )
+        for record_id, *record_key in stored:
+            existing_ids.setdefault(tuple(record_key), record_id)
+        # Rows written before fingerprints existed still need the canonical comparison.
+        legacy_scopes = set(
+            WebsiteEvidence.objects.filter(lead_id__in=batch_lead_ids, fingerprint="").values_list(
+                "lead_id", "evidence_type", "url", "tool"
+            )
+        )
+
+    new_records: dict[tuple[int, str, str, str, str], WebsiteEvidence] = {}
+    new_record_results: list[tuple[dict[str, Any], tuple[int, str, str, str, str], bool]] = []
+    for result, lead, item, key in prepared:
+        lead_id, evidence_type, normalized_url, tool, fingerprint = key
+        payload = item.get("payload", {})
+        if isinstance(payload, dict) and payload.get("not_modified"):
+            revalidated = find_revalidated_evidence(
+                lead=lead,
+                evidence_type=evidence_type,
+                url=normalized_url,
+                tool=tool,
+                payload=payload,
+            )
+            if revalidated is not None:
+                result["evidence_ids"].append(revalidated.id)
+                result["reused_count"] += 1
+                result["not_modified_count"] += 1
+            else:
+                result["revalidation_miss_count"] += 1
+            continue
+
+        existing_id = existing_ids.get(key)
+        if existing_id is None and key[:4] in legacy_scopes:
+            legacy_match = find_matching_evidence(
+                lead=lead,
+                evidence_type=evidence_type,
+                url=normalized_url,
+                tool=tool,
+                payload=payload,
+                fingerprint=fingerprint,
+            )
+            existing_id = legacy_match.id if legacy_match is not None else None
+        if existing_id is not None:
+            result["evidence_ids"].append(existing_id)
+            result["reused_count"] += 1
+            continue
+
+        if key in new_records:
+            # Duplicate of an item earlier in this batch: reuse the row about to be created.
+            new_record_results.append((result, key, False))
+            result["reused_count"] += 1
+            continue
+        new_records[key] = WebsiteEvidence(
+            lead=lead,
+            evidence_type=evidence_type,
+            url=normalized_url,
+            tool=tool,
+            payload=payload,
+            fingerprint=fingerprint,
+        )
+        new_record_results.append((result, key, True))
+        result["created_count"] += 1
+
+    if new_records:
+        WebsiteEvidence.objects.bulk_create(list(new_records.values()))
+        record_evidence_changes(new_records.values())
+        record_evidence_features(new_records.values())
+        created_ids: dict[int, list[int]] = {}
+        for result, key, created in new_record_results:
+            if created:
+                created_ids.setdefault(result["index"], []).append(new_records[key].id)
+            else:
+                result["evidence_ids"].append(new_records[key].id)
+        # Same id order as `persist_evidence_items`: created rows first, then reused ones.
+        for result, _lead, _items in pending:
+            result["evidence_ids"] = created_ids.get(result["index"], []) + result["evidence_ids"]
+        created_lead_ids = {result["lead_id"] for result, _key, created in new_record_results if created}
+        Lead.objects.filter(pk__in=created_lead_ids, status="new").update(
+            status="evidence_collected",
+            updated_at=timezone.now(),
+        )
+
+    return results
+
+
 def persist_technical_data(
     *,
     lead: Lead,
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from growth_ops.models import Lead, WebsiteEvidence
+from growth_ops.services.app_settings import int_setting
+from growth_ops.services.evidence_ingest import evidence_fingerprint
+from growth_ops.services.scoring import scoring_payload_fields
+
+DEFAULT_KEEP_LATEST = 3
+DEFAULT_BATCH_SIZE = 200
+# Small response metadata kept on compacted rows so existence checks still work.
+COMPACTED_PAYLOAD_FIELDS = ("exists", "status_code", "requested_url", "error")
+
+
+def keep_latest_default() -> int:
+    return max(1, int_setting("GROWTH_EVIDENCE_KEEP_LATEST", DEFAULT_KEEP_LATEST))
+
+
+def _payload_bytes(payload: Any) -> int:
+    return len(json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def _evidence_id(value: Any) -> int | None:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def referenced_evidence_ids(lead: Lead) -> set[int]:
+    """Evidence ids cited by the lead's reports (`evidence_ids`) or draft proof points."""
+    referenced: set[int] = set()
+    for evidence_ids in lead.website_reports.values_list("evidence_ids", flat=True):
+        if isinstance(evidence_ids, list):
+            referenced.update(filter(None, (_evidence_id(value) for value in evidence_ids)))
+    for proof_points in lead.outbound_drafts.values_list("proof_points", flat=True):
+        if isinstance(proof_points, list):
+            referenced.update(
+                filter(
+                    None,
+                    (_evidence_id(point.get("evidence_id")) for point in proof_points if isinstance(point, dict)),
+                )
+            )
+    return referenced
+
+
+def compacted_payload(record: WebsiteEvidence, fingerprint: str, original_bytes: int) -> dict[str, Any]:
+    """Fingerprint stub that keeps existence metadata and every value scoring reads from the payload."""
+    payload = record.payload if isinstance(record.payload, dict) else {}
+    stub: dict[str, Any] = {field: payload[field] for field in COMPACTED_PAYLOAD_FIELDS if field in payload}
+    stub.update(scoring_payload_fields(payload))
+    if not isinstance(record.payload, dict):
+        stub["original_type"] = type(record.payload).__name__
+    stub.update({"compacted": True, "fingerprint": fingerprint, "original_bytes": original_bytes})
+    return stub
+
+
+def compaction_candidate_ids(lead: Lead, *, keep_latest: int) -> list[int]:
+    """
+    Ids of the lead's uncompacted rows outside the newest `keep_latest` of their
+    `(evidence_type, url, tool)` group that no report or draft references.
+    """
+    referenced = referenced_evidence_ids(lead)
+    seen_per_group: dict[tuple[str, str, str], int] = {}
+    candidates: list[int] = []
+    rows = lead.website_evidence.order_by("-created_at", "-id").values_list(
+        "id", "evidence_type", "url", "tool", "compacted_at"
+    )
+    for record_id, evidence_type, url, tool, compacted_at in rows:
+        key = (evidence_type, url or "", tool or "")
+        rank = seen_per_group.get(key, 0)
+        seen_per_group[key] = rank + 1
+        if rank < keep_latest or compacted_at is not None or record_id in referenced:
+            continue
+        candidates.append(record_id)
+    return candidates
+
+
+@transaction.atomic
+def _compact_rows(record_ids: list[int], *, dry_run: bool) -> int:
+    reclaimed = 0
+    records = list(
+        WebsiteEvidence.objects.filter(pk__in=record_ids).only("pk", "evidence_type", "payload", "fingerprint")
+    )
+    compacted_at = timezone.now()
+    for record in records:
+        fingerprint = record.fingerprint or evidence_fingerprint(record.evidence_type, record.payload)
+        original_bytes = _payload_bytes(record.payload)
+        stub = compacted_payload(record, fingerprint, original_bytes)
+        reclaimed += max(0, original_bytes - _payload_bytes(stub))
+        record.payload = stub
+        record.fingerprint = fingerprint
+        record.compacted_at = compacted_at
+    if records and not dry_run:
+        WebsiteEvidence.objects.bulk_update(records, ["payload", "fingerprint", "compacted_at"])
+    return reclaimed
+
+
+def compact_lead_evidence(
+    lead: Lead,
+    *,
+    keep_latest: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """Compact one lead's evidence history; returns rows compacted and payload bytes reclaimed."""
+    keep = keep_latest_default() if keep_latest is None else max(1, keep_latest)
+    candidates = compaction_candidate_ids(lead, keep_latest=keep)
+    reclaimed = 0
+    for offset in range(0, len(candidates), max(1, batch_size)):
+        reclaimed += _compact_rows(candidates[offset : offset + batch_size], dry_run=dry_run)
+    return {"rows_compacted": len(candidates), "bytes_reclaimed": reclaimed}
+
+
+def leads_with_uncompacted_evidence(lead_ids: list[int] | None = None) -> QuerySet[Lead]:
+    leads = Lead.objects.filter(website_evidence__compacted_at__isnull=True).distinct().order_by("pk")
+    if lead_ids:
+        leads = leads.filter(pk__in=lead_ids)
+    return leads
+
+
+def compact_evidence(
+    *,
+    keep_latest: int | None = None,
+    lead_ids: list[int] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    on_lead: Callable[[Lead, dict[str, int]], None] | None = None,
+) -> dict[str, int]:
+    """
+    Compact evidence for every lead (or `lead_ids`) one lead at a time.
+
+    `on_lead(lead, summary)` is called after each lead, e.g. for progress output.
+    """
+    totals = {"leads_scanned": 0, "rows_compacted": 0, "bytes_reclaimed": 0}
+    for lead in leads_with_uncompacted_evidence(lead_ids).iterator():
+        summary = compact_lead_evidence(lead, keep_latest=keep_latest, batch_size=batch_size, dry_run=dry_run)
+        if on_lead is not None:
+            on_lead(lead, summary)
+        totals["leads_scanned"] += 1
+        totals["rows_compacted"] += summary["rows_compacted"]
+        totals["bytes_reclaimed"] += summary["bytes_reclaimed"]
+    return totals
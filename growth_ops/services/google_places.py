@@ -6,6 +6,8 @@ from typing import Any
 import requests
 from django.conf import settings
 
+from growth_ops.services.rate_limiter import call_with_quota, get_bucket
+
 GOOGLE_PLACES_TEXTSEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
 GOOGLE_PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
 GOOGLE_PLACES_TIMEOUT_SECONDS = 20
@@ -21,8 +23,24 @@ def _google_places_api_key() -> str:
     return key
 
 
+def _over_query_limit(response: requests.Response) -> bool:
+    """Places reports rate limiting as HTTP 200 with `OVER_QUERY_LIMIT` in the body."""
+    if response.status_code != 200:
+        return False
+    try:
+        payload = response.json()
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and payload.get("status") == "OVER_QUERY_LIMIT"
+
+
 def _request_google_places_json(*, url: str, params: dict[str, Any]) -> dict[str, Any]:
-    response = requests.get(url, params=params, timeout=GOOGLE_PLACES_TIMEOUT_SECONDS)
+    # Throttled per API key; 429/5xx and OVER_QUERY_LIMIT are retried with backoff before raise_for_status.
+    response = call_with_quota(
+        get_bucket("google_places", str(params.get("key") or "")),
+        lambda: requests.get(url, params=params, timeout=GOOGLE_PLACES_TIMEOUT_SECONDS),
+        throttled=_over_query_limit,
+    )
     response.raise_for_status()
     payload = response.json()
     status_value = payload.get("status", "UNKNOWN_ERROR")
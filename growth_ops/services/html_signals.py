@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+META_DESCRIPTION_RE = re.compile(
+    r'<meta\b[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\'][^>]*>',
+    re.IGNORECASE | re.DOTALL,
+)
+META_DESCRIPTION_RE_ALT = re.compile(
+    r'<meta\b[^>]*content=["\']([^"\']*)["\'][^>]*name=["\']description["\'][^>]*>',
+    re.IGNORECASE | re.DOTALL,
+)
+CANONICAL_RE = re.compile(
+    r'<link\b[^>]*rel=["\']canonical["\'][^>]*href=["\']([^"\']+)["\'][^>]*>',
+    re.IGNORECASE | re.DOTALL,
+)
+CANONICAL_RE_ALT = re.compile(
+    r'<link\b[^>]*href=["\']([^"\']+)["\'][^>]*rel=["\']canonical["\'][^>]*>',
+    re.IGNORECASE | re.DOTALL,
+)
+FORM_RE = re.compile(r"<form\b[^>]*>", re.IGNORECASE)
+SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+STYLE_RE = re.compile(r"<style\b[^>]*>.*?</style>", re.IGNORECASE | re.DOTALL)
+NOSCRIPT_RE = re.compile(r"<noscript\b[^>]*>.*?</noscript>", re.IGNORECASE | re.DOTALL)
+HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+TAG_RE = re.compile(r"<[^>]+>")
+MULTISPACE_RE = re.compile(r"\s+")
+H1_TEXT_RE = re.compile(r"<h1\b[^>]*>(.*?)</h1>", re.IGNORECASE | re.DOTALL)
+HEADING_RE = re.compile(r"<h[1-6]\b[^>]*>.*?</h[1-6]>", re.IGNORECASE | re.DOTALL)
+SECTION_RE = re.compile(r"<section\b[^>]*>", re.IGNORECASE)
+CTA_ACTION_BLOCK_RE = re.compile(r"<(a|button)\b([^>]*)>(.*?)</\1>", re.IGNORECASE | re.DOTALL)
+ANCHOR_RE = re.compile(
+    r"<a\b[^>]*href=[\"']([^\"']+)[\"'][^>]*>(.*?)</a>",
+    re.IGNORECASE | re.DOTALL,
+)
+DEPTH_TOKEN_RE = re.compile(r"<(/?)([a-zA-Z0-9]+)(?:\s[^>]*)?>")
+
+# The single pass: every "<" in the lowercased document with its tag name.
+TAG_START_RE = re.compile(r"<(/?)([a-z0-9]*)")
+HIDDEN_BLOCK_OPENERS = {
+    "script": (re.compile(r"<script\b[^>]*>", re.IGNORECASE), "</script>"),
+    "style": (re.compile(r"<style\b[^>]*>", re.IGNORECASE), "</style>"),
+    "noscript": (re.compile(r"<noscript\b[^>]*>", re.IGNORECASE), "</noscript>"),
+}
+# Blocks the regex passes remove *before* the given kind; nesting them changes the result.
+EARLIER_REMOVED_OPENERS = {
+    "script": (),
+    "style": ("<script",),
+    "noscript": ("<script", "<style"),
+    "comment": ("<script", "<style", "<noscript"),
+}
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+# Characters that `re.IGNORECASE` matches against ASCII letters (or whose lowercase
+# changes length), which would desynchronize offsets in the lowercased copy.
+CASE_FOLD_SPECIALS = ("\u0130", "\u0131", "\u017f", "\u212a")
+
+
+@dataclass(frozen=True)
+class DepthIndex:
+    """
+    DOM depth after every open/close tag as a prefix array over tag end offsets,
+    so the depth at any offset is one binary search instead of a re-tokenization.
+    """
+
+    ends: tuple[int, ...]
+    depths: tuple[int, ...]
+
+    @classmethod
+    def from_tokens(cls, tokens: list[tuple[int, bool, bool]]) -> DepthIndex:
+        """`tokens` are `(end offset, is_closing, is_self_closing)` in document order."""
+        depth = 0
+        depths: list[int] = []
+        for _end, is_closing, is_self_closing in tokens:
+            if is_closing:
+                depth = max(0, depth - 1)
+            elif not is_self_closing:
+                depth += 1
+            depths.append(depth)
+        return cls(ends=tuple(end for end, _closing, _self_closing in tokens), depths=tuple(depths))
+
+    def depth_at(self, position: int) -> int:
+        """Depth after the tags that end at or before `position` (minimum 1), like `dom_depth_until`."""
+        index = bisect_right(self.ends, position)
+        return max(self.depths[index - 1] if index else 0, 1)
+
+
+@dataclass(frozen=True)
+class HomepageSignals:
+    """
+    Everything report building and contact extraction read from one homepage body.
+
+    Built by `parse_homepage_signals` in a single tokenizer pass over the `<`
+    positions of the document; each field is identical to what the corresponding
+    regex pass over the raw HTML returns (`homepage_signals_from_regex_passes`).
+    """
+
+    html: str
+    lowered: str
+    # Script/style/noscript/comment-free text with tags replaced, whitespace collapsed.
+    visible_text: str
+    # `(start, end)` HTML offsets of the raw text runs behind `visible_text`;
+    # None when the document needed the regex passes.
+    text_runs: tuple[tuple[int, int], ...] | None
+    # Tag-stripped text that keeps script/style contents (contact extraction).
+    markup_text: str
+    title: str
+    meta_description: str
+    canonical_href: str
+    h1_texts: tuple[str, ...]
+    tag_counts: Mapping[str, int]
+    # `(start, attrs, inner_html)` of each `<a>` / `<button>` block.
+    action_blocks: tuple[tuple[int, str, str], ...]
+    # `(href, inner_html)` of each `<a href>` block.
+    anchors: tuple[tuple[str, str], ...]
+    depth_index: DepthIndex
+    single_pass: bool
+
+    def visible_text_before(self, offset: int) -> str:
+        """`visible_text` of `html[:offset]`, reusing the text runs when the cut is between tags."""
+        if self.text_runs is not None:
+            parts: list[str] = []
+            for start, end in self.text_runs:
+                if offset < start:
+                    break
+                if offset <= end:
+                    parts.append(self.html[start:offset])
+                    return _collapse_whitespace(" ".join(parts))
+                parts.append(self.html[start:end])
+        return strip_html_for_signal_analysis(self.html[:offset])
+
+    def depth_at(self, position: int) -> int:
+        return self.depth_index.depth_at(position)
+
+
+def _collapse_whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+
+def strip_html_for_signal_analysis(html: str) -> str:
+    cleaned = SCRIPT_RE.sub(" ", html or "")
+    cleaned = STYLE_RE.sub(" ", cleaned)
+    cleaned = NOSCRIPT_RE.sub(" ", cleaned)
+    cleaned = HTML_COMMENT_RE.sub(" ", cleaned)
+    cleaned = TAG_RE.sub(" ", cleaned)
+    return MULTISPACE_RE.sub(" ", cleaned).strip()
+
+
+def _h1_text(inner_html: str) -> str:
+    return MULTISPACE_RE.sub(" ", TAG_RE.sub(" ", inner_html)).strip()
+
+
+def dom_depth_until(html: str, position: int) -> int:
+    """Reference depth lookup: re-tokenizes `html[:position]` on every call (O(tags))."""
+    depth = 0
+    for token in DEPTH_TOKEN_RE.finditer(html[: max(position, 0)]):
+        raw_tag = token.group(0)
+        is_closing = token.group(1) == "/"
+        is_self_closing = raw_tag.endswith("/>")
+        if is_closing:
+            depth = max(0, depth - 1)
+            continue
+        if not is_self_closing:
+            depth += 1
+    return max(depth, 1)
+
+
+def build_depth_index(html: str) -> DepthIndex:
+    return DepthIndex.from_tokens(
+        [
+            (token.end(), token.group(1) == "/", token.group(0).endswith("/>"))
+            for token in DEPTH_TOKEN_RE.finditer(html or "")
+        ]
+    )
+
+
+def homepage_signals_from_regex_passes(html: str) -> HomepageSignals:
+    """Reference implementation: one regex pass per signal over the raw HTML."""
+    html = html or ""
+    title_match = TITLE_RE.search(html)
+    meta_match = META_DESCRIPTION_RE.search(html) or META_DESCRIPTION_RE_ALT.search(html)
+    canonical_match = CANONICAL_RE.search(html) or CANONICAL_RE_ALT.search(html)
+    return HomepageSignals(
+        html=html,
+        lowered=html.lower(),
+        visible_text=strip_html_for_signal_analysis(html),
+        text_runs=None,
+        markup_text=_collapse_whitespace(TAG_RE.sub(" ", html)),
+        title=_collapse_whitespace(title_match.group(1)) if title_match else "",
+        meta_description=_collapse_whitespace(meta_match.group(1)) if meta_match else "",
+        canonical_href=canonical_match.group(1).strip() if canonical_match else "",
+        h1_texts=tuple(filter(None, (_h1_text(match) for match in H1_TEXT_RE.findall(html)))),
+        tag_counts=MappingProxyType(
+            {
+                "headings": len(HEADING_RE.findall(html)),
+                "sections": len(SECTION_RE.findall(html)),
+                "forms": len(FORM_RE.findall(html)),
+            }
+        ),
+        action_blocks=tuple(
+            (match.start(), match.group(2) or "", match.group(3) or "")
+            for match in CTA_ACTION_BLOCK_RE.finditer(html)
+        ),
+        anchors=tuple(ANCHOR_RE.findall(html)),
+        depth_index=build_depth_index(html),
+        single_pass=False,
+    )
+
+
+def _single_pass_signals(html: str) -> HomepageSignals | None:
+    """
+    Tokenize once and derive every signal from the `<` positions.
+
+    Tag-level patterns are tried with `.match()` only at `<` positions carrying the
+    right tag name, resuming after each match exactly like `finditer`, so they see
+    the same document the regex passes see (including markup inside comments and
+    scripts). Returns None when `re.IGNORECASE` case folding could disagree with
+    the lowercased copy.
+    """
+    if any(special in html for special in CASE_FOLD_SPECIALS):
+        return None
+    lowered = html.lower()
+    length = len(html)
+
+    title = meta = meta_alt = canonical = canonical_alt = None
+    h1_texts: list[str] = []
+    counts = {"headings": 0, "sections": 0, "forms": 0}
+    action_blocks: list[tuple[int, str, str]] = []
+    anchors: list[tuple[str, str]] = []
+    depth_tokens: list[tuple[int, bool, bool]] = []
+    # Resume offsets: a pattern never matches inside its own previous match.
+    h1_until = heading_until = section_until = form_until = 0
+    action_until = anchor_until = depth_until = 0
+
+    # Visible text: removed spans (blocks, comments, tags) with text runs between them.
+    text_runs: list[tuple[int, int]] = []
+    text_start = text_until = 0
+    text_exact = True
+    # Markup text: tags only, as `TAG_RE.sub` sees the raw document.
+    markup_runs: list[tuple[int, int]] = []
+    markup_start = markup_until = 0
+
+    for token in TAG_START_RE.finditer(lowered):
+        position = token.start()
+        is_closing = token.group(1) == "/"
+        name = token.group(2)
+
+        if not is_closing and name:
+            if name.startswith("title") and title is None:
+                match = TITLE_RE.match(html, position)
+                if match:
+                    title = _collapse_whitespace(match.group(1))
+            elif name == "meta":
+                if meta is None and (match := META_DESCRIPTION_RE.match(html, position)):
+                    meta = _collapse_whitespace(match.group(1))
+                if meta is None and meta_alt is None and (match := META_DESCRIPTION_RE_ALT.match(html, position)):
+                    meta_alt = _collapse_whitespace(match.group(1))
+            elif name == "link":
+                if canonical is None and (match := CANONICAL_RE.match(html, position)):
+                    canonical = match.group(1).strip()
+                if canonical is None and canonical_alt is None and (match := CANONICAL_RE_ALT.match(html, position)):
+                    canonical_alt = match.group(1).strip()
+            elif name == "section":
+                if position >= section_until and (match := SECTION_RE.match(html, position)):
+                    counts["sections"] += 1
+                    section_until = match.end()
+            elif name == "form":
+                if position >= form_until and (match := FORM_RE.match(html, position)):
+                    counts["forms"] += 1
+                    form_until = match.end()
+            elif name in HEADING_TAGS:
+                if position >= heading_until and (match := HEADING_RE.match(html, position)):
+                    counts["headings"] += 1
+                    heading_until = match.end()
+                if name == "h1" and position >= h1_until and (match := H1_TEXT_RE.match(html, position)):
+                    text = _h1_text(match.group(1))
+                    if text:
+                        h1_texts.append(text)
+                    h1_until = match.end()
+            if name == "a" or name == "button":
+                if position >= action_until and (match := CTA_ACTION_BLOCK_RE.match(html, position)):
+                    action_blocks.append((position, match.group(2) or "", match.group(3) or ""))
+                    action_until = match.end()
+                if name == "a" and position >= anchor_until and (match := ANCHOR_RE.match(html, position)):
+                    anchors.append((match.group(1), match.group(2)))
+                    anchor_until = match.end()
+
+        # DEPTH_TOKEN_RE: `<name>` or `<name` + whitespace + `...>`.
+        if name and position >= depth_until:
+            name_end = token.end()
+            follow = html[name_end] if name_end < length else ""
+            tag_end = -1
+            if follow == ">":
+                tag_end = name_end + 1
+            elif follow.isspace():
+                close = html.find(">", name_end)
+                tag_end = close + 1 if close != -1 else -1
+            if tag_end != -1:
+                depth_tokens.append((tag_end, is_closing, html[tag_end - 2] == "/"))
+                depth_until = tag_end
+
+        # TAG_RE over the raw document.
+        if position >= markup_until:
+            close = html.find(">", position + 1)
+            if close == -1:
+                markup_until = length + 1
+            elif close > position + 1:
+                markup_runs.append((markup_start, position))
+                markup_start = markup_until = close + 1
+
+        # Visible text: blocks, then comments, then tags, as the regex passes remove them.
+        if text_exact and position >= text_until:
+            span_end = -1
+            if lowered.startswith("<!--", position):
+                close = lowered.find("-->", position + 4)
+                if close != -1:
+                    span_end = close + 3
+                    if any(opener in lowered[position + 4 : close] for opener in EARLIER_REMOVED_OPENERS["comment"]):
+                        text_exact = False
+            if span_end == -1 and not is_closing and name in HIDDEN_BLOCK_OPENERS:
+                opener_re, closer = HIDDEN_BLOCK_OPENERS[name]
+                opener = opener_re.match(html, position)
+                if opener:
+                    close = lowered.find(closer, opener.end())
+                    if close != -1:
+                        span_end = close + len(closer)
+                        inner = lowered[opener.end() : close]
+                        if any(nested in inner for nested in EARLIER_REMOVED_OPENERS[name]):
+                            text_exact = False
+            if span_end == -1:
+                close = html.find(">", position + 1)
+                if close == -1:
+                    text_until = length + 1
+                elif close > position + 1:
+                    span_end = close + 1
+                    inner = lowered[position + 1 : close]
+                    if "<" in inner and any(opener in inner for opener in ("<!--", "<script", "<style", "<noscript")):
+                        # A block inside a tag is removed before the tag in the regex passes.
+                        text_exact = False
+            if span_end != -1:
+                text_runs.append((text_start, position))
+                text_start = text_until = span_end
+
+    if not text_exact:
+        visible_text = strip_html_for_signal_analysis(html)
+        runs: tuple[tuple[int, int], ...] | None = None
+    else:
+        text_runs.append((text_start, length))
+        runs = tuple(text_runs)
+        visible_text = _collapse_whitespace(" ".join(html[start:end] for start, end in runs))
+    markup_runs.append((markup_start, length))
+
+    return HomepageSignals(
+        html=html,
+        lowered=lowered,
+        visible_text=visible_text,
+        text_runs=runs,
+        markup_text=_collapse_whitespace(" ".join(html[start:end] for start, end in markup_runs)),
+        title=title or "",
+        meta_description=meta if meta is not None else (meta_alt or ""),
+        canonical_href=canonical if canonical is not None else (canonical_alt or ""),
+        h1_texts=tuple(h1_texts),
+        tag_counts=MappingProxyType(counts),
+        action_blocks=tuple(action_blocks),
+        anchors=tuple(anchors),
+        depth_index=DepthIndex.from_tokens(depth_tokens),
+        single_pass=True,
+    )
+
+
+@lru_cache(maxsize=32)
+def parse_homepage_signals(html: str) -> HomepageSignals:
+    """Signals for one homepage body; cached so reporting and contact extraction share a parse."""
+    html = html or ""
+    return _single_pass_signals(html) or homepage_signals_from_regex_passes(html)
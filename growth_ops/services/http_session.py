@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from growth_ops.services.app_settings import float_setting, int_setting
+
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 4
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+REQUEST_STARTED_TRACE_EVENTS = {"http11.send_request_headers.started", "http2.send_request_headers.started"}
+
+
+class ConnectionStats:
+    """Thread-safe counters of outbound requests vs freshly opened connections."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+
+    def record_request(self, *, new_connection: bool) -> None:
+        with self._lock:
+            self._requests += 1
+            if new_connection:
+                self._new_connections += 1
+
+    def record_new_connection(self) -> None:
+        with self._lock:
+            self._new_connections += 1
+
+    def record_request_only(self) -> None:
+        with self._lock:
+            self._requests += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests = 0
+            self._new_connections = 0
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "new_connections": self._new_connections,
+                "reused_connections": max(0, self._requests - self._new_connections),
+            }
+
+
+connection_stats = ConnectionStats()
+
+
+class _CountingPoolMixin:
+    """Flag connections created by the pool so checkouts can be classified as new or reused."""
+
+    def _new_conn(self):  # type: ignore[no-untyped-def]
+        conn = super()._new_conn()  # type: ignore[misc]
+        conn._growth_ops_fresh = True
+        return conn
+
+    def _get_conn(self, timeout: float | None = None):  # type: ignore[no-untyped-def]
+        conn = super()._get_conn(timeout=timeout)  # type: ignore[misc]
+        fresh = bool(getattr(conn, "_growth_ops_fresh", False))
+        conn._growth_ops_fresh = False
+        connection_stats.record_request(new_connection=fresh)
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose host pools report connection reuse into `connection_stats`."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def build_retry() -> Retry:
+    max_retries = max(0, int_setting("GROWTH_HTTP_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+    return Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=max(0.0, float_setting("GROWTH_HTTP_RETRY_BACKOFF_SECONDS", DEFAULT_RETRY_BACKOFF_SECONDS)),
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+
+def build_session(*, retries: bool = True) -> requests.Session:
+    """
+    Build a keep-alive session with per-host connection pools.
+
+    `retries=False` sends every request exactly once, for callers such as
+    `rate_limiter.call_with_quota` that own retries and backoff themselves.
+    """
+    adapter = PooledHTTPAdapter(
+        pool_connections=max(1, int_setting("GROWTH_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)),
+        pool_maxsize=max(1, int_setting("GROWTH_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)),
+        max_retries=build_retry() if retries else Retry(0, read=False),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _close_all(sessions: dict[bool, requests.Session]) -> None:
+    for session in sessions.values():
+        session.close()
+
+
+class _ThreadSessions:
+    """One thread's sessions, closed when the thread exits and its local storage is released."""
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.by_retries: dict[bool, requests.Session] = {}
+        weakref.finalize(self, _close_all, self.by_retries)
+
+
+_local = threading.local()
+_sessions_lock = threading.Lock()
+_live_sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+_generation = 0
+
+
+def get_session(*, retries: bool = True) -> requests.Session:
+    """
+    Return the calling thread's pooled session (see `build_session` for `retries`).
+
+    One session per thread keeps cookie/adapter state thread-confined while
+    connections to the same origin are reused across every fetch on that thread.
+    Sessions live in thread-local storage, so a worker thread's sockets are
+    closed when it exits, inside or outside `pipeline_session_scope`.
+    """
+    holder = getattr(_local, "sessions", None)
+    if holder is None or holder.generation != _generation:
+        holder = _ThreadSessions(_generation)
+        _local.sessions = holder
+    session = holder.by_retries.get(retries)
+    if session is None:
+        session = build_session(retries=retries)
+        holder.by_retries[retries] = session
+        with _sessions_lock:
+            _live_sessions.add(session)
+    return session
+
+
+def close_sessions() -> None:
+    """Close every thread's sessions; each thread builds fresh ones on its next `get_session`."""
+    global _generation
+    with _sessions_lock:
+        _generation += 1
+        sessions = list(_live_sessions)
+        _live_sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+@contextmanager
+def pipeline_session_scope() -> Iterator[ConnectionStats]:
+    """Share pooled sessions for the duration of one pipeline run and expose its connection stats."""
+    close_sessions()
+    connection_stats.reset()
+    try:
+        yield connection_stats
+    finally:
+        close_sessions()
+
+
+class AsyncConnectionTrace:
+    """
+    httpcore `trace` extension callback feeding `connection_stats` for httpx clients.
+
+    Pass as `extensions={"trace": AsyncConnectionTrace()}` on each request.
+    """
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            connection_stats.record_new_connection()
+        elif event_name in REQUEST_STARTED_TRACE_EVENTS:
+            connection_stats.record_request_only()
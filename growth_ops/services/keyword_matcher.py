@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+WORD_CHAR_RE = re.compile(r"\w")
+
+
+@dataclass(frozen=True)
+class KeywordMatcher:
+    """
+    Precompiled `\\b<keyword>\\b` matcher for a whole keyword set.
+
+    `hits()` returns, per keyword, the same count and first offset as a separate
+    `re.finditer` per keyword. Keywords whose matches can never overlap share one
+    named-group alternation, so a typical set is found in a single scan; a keyword
+    that could overlap another (e.g. "book" / "book now") gets its own scan group.
+    """
+
+    keywords: tuple[str, ...]
+    any_pattern: re.Pattern[str] | None
+    scan_patterns: tuple[re.Pattern[str], ...]
+
+    def search(self, text: str) -> bool:
+        """True when any keyword occurs in `text` (expected lowercased)."""
+        return bool(self.any_pattern and self.any_pattern.search(text))
+
+    def hits(self, text: str) -> dict[str, tuple[int, int]]:
+        """`{keyword: (match_count, first_match_start)}` for keywords present in `text`."""
+        found: dict[str, tuple[int, int]] = {}
+        for pattern in self.scan_patterns:
+            for match in pattern.finditer(text):
+                keyword = self.keywords[int(match.lastgroup[1:])]
+                count, first_start = found.get(keyword, (0, match.start()))
+                found[keyword] = (count + 1, first_start)
+        return found
+
+
+def _is_word(char: str) -> bool:
+    return bool(WORD_CHAR_RE.match(char))
+
+
+def _boundary_possible(left: str | None, right: str | None) -> bool:
+    # `None` is a character outside both keywords, which can be anything.
+    if left is None or right is None:
+        return True
+    return _is_word(left) != _is_word(right)
+
+
+def _can_overlap(first: str, second: str) -> bool:
+    """Whether a `\\bfirst\\b` match and a `\\bsecond\\b` match can share a character."""
+    for offset in range(1 - len(second), len(first)):
+        chars: dict[int, str] = {}
+        consistent = True
+        for word, start in ((first, 0), (second, offset)):
+            for index, char in enumerate(word, start=start):
+                if chars.setdefault(index, char) != char:
+                    consistent = False
+                    break
+            if not consistent:
+                break
+        if not consistent:
+            continue
+        if all(
+            _boundary_possible(chars.get(edge - 1), chars.get(edge))
+            for start, end in ((0, len(first)), (offset, offset + len(second)))
+            for edge in (start, end)
+        ):
+            return True
+    return False
+
+
+def _alternation(keywords: tuple[str, ...], indexes: Iterable[int]) -> re.Pattern[str]:
+    return re.compile("|".join(rf"\b(?P<k{index}>{re.escape(keywords[index])})\b" for index in indexes))
+
+
+@lru_cache(maxsize=64)
+def _compiled_matcher(keyword_set: frozenset[str]) -> KeywordMatcher:
+    keywords = tuple(sorted(keyword_set, key=lambda keyword: (-len(keyword), keyword)))
+    if not keywords:
+        return KeywordMatcher(keywords=(), any_pattern=None, scan_patterns=())
+
+    groups: list[list[int]] = []
+    for index, keyword in enumerate(keywords):
+        for group in groups:
+            if not any(_can_overlap(keywords[member], keyword) for member in group):
+                group.append(index)
+                break
+        else:
+            groups.append([index])
+
+    return KeywordMatcher(
+        keywords=keywords,
+        any_pattern=_alternation(keywords, range(len(keywords))),
+        scan_patterns=tuple(_alternation(keywords, group) for group in groups),
+    )
+
+
+def keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Cached matcher for `keywords` (lowercased); equal keyword sets share one compiled matcher."""
+    return _compiled_matcher(frozenset(keyword.lower() for keyword in keywords if keyword))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from itertools import groupby
+from typing import Iterable
+
+from django.utils import timezone
+
+from growth_ops.models import Lead, LeadFeatures, WebsiteEvidence, WebsiteReport
+from growth_ops.services.scoring import (
+    REPORT_FEATURE_FIELDS,
+    fold_evidence_into_features,
+    fold_report_into_features,
+)
+
+EVIDENCE_FEATURE_FIELDS = (
+    "last_evidence_id",
+    "perf_score",
+    "lcp_ms",
+    "cms_value",
+    "has_tech_fingerprint",
+    "has_sitemap_evidence",
+    "sitemap_marked_missing",
+)
+
+
+def build_lead_features(lead: Lead) -> LeadFeatures:
+    """Recompute the lead's features from all of its evidence and its latest report, and save them."""
+    features = LeadFeatures.objects.filter(lead=lead).first() or LeadFeatures(lead=lead)
+    for field in EVIDENCE_FEATURE_FIELDS:
+        setattr(features, field, LeadFeatures._meta.get_field(field).get_default())
+    fold_evidence_into_features(
+        features,
+        lead.website_evidence.order_by("created_at", "id").only("id", "evidence_type", "payload").iterator(),
+    )
+    fold_report_into_features(features, lead.website_reports.order_by("-created_at", "-id").first())
+    features.save()
+    return features
+
+
+def record_evidence_features(records: Iterable[WebsiteEvidence]) -> None:
+    """
+    Fold newly written evidence rows into their leads' features.
+
+    Rows the stored features have already seen are skipped, so recording the
+    same rows twice is harmless. Leads without a features row are built from
+    all of their evidence instead.
+    """
+    records = sorted(
+        (record for record in records if record.pk is not None),
+        key=lambda record: (record.lead_id, record.created_at, record.pk),
+    )
+    if not records:
+        return
+
+    lead_ids = {record.lead_id for record in records}
+    existing = {features.lead_id: features for features in LeadFeatures.objects.filter(lead_id__in=lead_ids)}
+    changed: list[LeadFeatures] = []
+    now = timezone.now()
+    for lead_id, lead_records in groupby(records, key=lambda record: record.lead_id):
+        features = existing.get(lead_id)
+        if features is None:
+            build_lead_features(Lead.objects.get(pk=lead_id))
+            continue
+        unseen = [record for record in lead_records if record.pk > features.last_evidence_id]
+        if unseen:
+            features.updated_at = now
+            changed.append(fold_evidence_into_features(features, unseen))
+    if changed:
+        LeadFeatures.objects.bulk_update(changed, [*EVIDENCE_FEATURE_FIELDS, "updated_at"])
+
+
+def record_report_features(lead: Lead, report_obj: WebsiteReport) -> LeadFeatures:
+    """Point the lead's features at `report_obj`, the report just persisted or reused."""
+    features = LeadFeatures.objects.filter(lead=lead).first()
+    if features is None:
+        features = build_lead_features(lead)
+    if features.report_id != report_obj.pk:
+        fold_report_into_features(features, report_obj)
+        features.save(update_fields=["report", *REPORT_FEATURE_FIELDS, "updated_at"])
+    return features
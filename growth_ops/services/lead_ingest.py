@@ -4,6 +4,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 from django.db import transaction
+from django.db.models.functions import Lower
 
 from growth_ops.models import Contact, Lead
 
@@ -24,11 +25,50 @@ def domain_from_url(raw_url: str) -> str:
     return (parsed.hostname or "").strip()
 
 
+def lead_domain_key(raw_url: str) -> str:
+    """Matching key for a website: lowercased host with scheme, `www.`, port and path folded away."""
+    host = domain_from_url(raw_url).lower().rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+def website_match_key(raw_url: str) -> str:
+    """Full website URL, lowercased, with the scheme, a leading `www.` and trailing slashes folded away."""
+    normalized = normalize_website_url(raw_url).lower()
+    if "://" in normalized:
+        normalized = normalized.split("://", 1)[1]
+    if normalized.startswith("www."):
+        normalized = normalized[4:]
+    return normalized.rstrip("/")
+
+
+def find_lead_by_website(website_url: str) -> Lead | None:
+    """
+    The newest lead whose stored URL matches `website_url` (see `website_match_key`), via its index.
+
+    Different pages on one host (e.g. two facebook.com profiles) are different
+    businesses, so a domain-only match is never returned.
+    """
+    match_key = website_match_key(website_url)
+    if not match_key:
+        return None
+    return Lead.objects.filter(website_match_key=match_key).order_by("-created_at").first()
+
+
+def find_lead_by_company(company_name: str, location: str = "") -> Lead | None:
+    """Case-insensitive name (+ location) match served by the `Lower(company_name), Lower(location)` index."""
+    queryset = Lead.objects.annotate(company_name_lower=Lower("company_name")).filter(
+        company_name_lower=company_name.lower()
+    )
+    if location:
+        queryset = queryset.annotate(location_lower=Lower("location")).filter(location_lower=location.lower())
+    return queryset.order_by("-created_at").first()
+
+
 def find_existing_lead(validated_data: dict[str, Any]) -> Lead | None:
     """
     Match existing leads in the same order as the current API contract:
     1) google_place_id
-    2) normalized website_url
+    2) website URL (exact `Lead.website_match_key`)
     3) company_name (+ optional location)
     """
     google_place_id = (validated_data.get("google_place_id") or "").strip()
@@ -42,15 +82,12 @@ def find_existing_lead(validated_data: dict[str, Any]) -> Lead | None:
             return match
 
     if website_url:
-        match = Lead.objects.filter(website_url__iexact=website_url).order_by("-created_at").first()
+        match = find_lead_by_website(website_url)
         if match:
             return match
 
     if company_name:
-        queryset = Lead.objects.filter(company_name__iexact=company_name)
-        if location:
-            queryset = queryset.filter(location__iexact=location)
-        match = queryset.order_by("-created_at").first()
+        match = find_lead_by_company(company_name, location)
         if match:
             return match
 
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from growth_ops.models import PageSpeedCacheEntry
+from growth_ops.services.app_settings import int_setting
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_STALE_SECONDS = 6 * 24 * 60 * 60
+CACHE_FRESH = "fresh"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+logger = logging.getLogger(__name__)
+
+
+def cache_ttl_seconds() -> int:
+    return max(0, int_setting("GROWTH_PAGESPEED_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+
+
+def cache_stale_seconds() -> int:
+    """Window after TTL expiry during which a stale entry is served while it is refreshed."""
+    return max(0, int_setting("GROWTH_PAGESPEED_CACHE_STALE_SECONDS", DEFAULT_STALE_SECONDS))
+
+
+class PageSpeedCacheStats:
+    """Thread-safe hit/miss counters for one process (reset per pipeline run)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "stale_hits": 0, "misses": 0, "forced": 0, "refreshes": 0}
+
+    def record(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            for name in self._counts:
+                self._counts[name] = 0
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+pagespeed_cache_stats = PageSpeedCacheStats()
+
+
+def lookup(normalized_url: str, strategy: str) -> tuple[dict[str, Any] | None, str]:
+    """Return `(payload, state)` where state is fresh, stale (within the SWR window) or miss."""
+    entry = PageSpeedCacheEntry.objects.filter(normalized_url=normalized_url, strategy=strategy).first()
+    if entry is None:
+        return None, CACHE_MISS
+
+    age = timezone.now() - entry.fetched_at
+    ttl = timedelta(seconds=cache_ttl_seconds())
+    if age <= ttl:
+        return entry.payload, CACHE_FRESH
+    if age <= ttl + timedelta(seconds=cache_stale_seconds()):
+        return entry.payload, CACHE_STALE
+    return None, CACHE_MISS
+
+
+def store(normalized_url: str, strategy: str, payload: dict[str, Any]) -> None:
+    """Upsert a successful PageSpeed payload; errors are never cached."""
+    PageSpeedCacheEntry.objects.update_or_create(
+        normalized_url=normalized_url,
+        strategy=strategy,
+        defaults={"payload": payload, "fetched_at": timezone.now()},
+    )
+
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pagespeed-refresh")
+_refresh_lock = threading.Lock()
+_refreshing: set[tuple[str, str]] = set()
+
+
+def _run_refresh(key: tuple[str, str], refresh: Callable[[], None]) -> None:
+    try:
+        refresh()
+        pagespeed_cache_stats.record("refreshes")
+    except Exception:
+        logger.exception("Background PageSpeed refresh failed for %s (%s)", *key)
+    finally:
+        with _refresh_lock:
+            _refreshing.discard(key)
+        close_old_connections()
+
+
+def schedule_refresh(normalized_url: str, strategy: str, refresh: Callable[[], None]) -> bool:
+    """Queue a background refresh unless one is already in flight for the same key."""
+    key = (normalized_url, strategy)
+    with _refresh_lock:
+        if key in _refreshing:
+            return False
+        _refreshing.add(key)
+    _refresh_executor.submit(_run_refresh, key, refresh)
+    return True
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, TypeVar
+
+from growth_ops.services.app_settings import float_setting
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BACKOFF_BASE_SECONDS = 1.0
+DEFAULT_BACKOFF_CAP_SECONDS = 60.0
+# Per-API defaults: (requests per second, requests per process per UTC day; 0 = unlimited).
+API_QUOTA_DEFAULTS: dict[str, tuple[float, int]] = {
+    "pagespeed": (4.0, 25_000),
+    "google_places": (10.0, 0),
+}
+API_QUOTA_SETTINGS: dict[str, tuple[str, str]] = {
+    "pagespeed": ("GROWTH_PAGESPEED_QPS", "GROWTH_PAGESPEED_PROCESS_BUDGET"),
+    "google_places": ("GROWTH_PLACES_QPS", "GROWTH_PLACES_PROCESS_BUDGET"),
+}
+
+ResponseT = TypeVar("ResponseT")
+
+
+class QuotaExhaustedError(RuntimeError):
+    """Raised when this process has used its whole per-day request budget for an API key."""
+
+
+def _utc_day(epoch_seconds: float) -> str:
+    return datetime.fromtimestamp(epoch_seconds, tz=dt_timezone.utc).strftime("%Y-%m-%d")
+
+
+class QuotaBucket:
+    """
+    Reservation-based token bucket for one API key.
+
+    Each caller reserves the next free send slot under the lock and then sleeps
+    outside it, so concurrent threads/tasks are spaced at `per_second` without
+    busy-waiting. A `Retry-After` pushes the next free slot out for every caller
+    sharing the key.
+
+    `process_budget` caps the reservations this process makes per UTC day. It is
+    a guard against a runaway run, not Google's daily quota: the counter lives in
+    memory, so every command run and worker process starts its own.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_second: float,
+        process_budget: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self.process_budget = max(0, int(process_budget))
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._lock = threading.Lock()
+        self._next_free = 0.0
+        self._day = ""
+        self._used_today = 0
+        self._metrics = {
+            "requests": 0,
+            "retries": 0,
+            "throttled": 0,
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    def reserve(self) -> float:
+        """Claim the next send slot and return how long the caller must wait for it."""
+        with self._lock:
+            day = _utc_day(self._wall_clock())
+            if day != self._day:
+                self._day = day
+                self._used_today = 0
+            if self.process_budget and self._used_today >= self.process_budget:
+                raise QuotaExhaustedError(f"Per-process budget of {self.process_budget} requests for today exhausted.")
+            self._used_today += 1
+
+            now = self._clock()
+            slot = max(now, self._next_free)
+            self._next_free = slot + self.interval
+            wait = slot - now
+            self._metrics["requests"] += 1
+            self._metrics["total_wait_seconds"] += wait
+            self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], wait)
+            return wait
+
+    def defer(self, seconds: float) -> None:
+        """Push the next free slot at least `seconds` out (server-requested backoff)."""
+        with self._lock:
+            self._next_free = max(self._next_free, self._clock() + max(0.0, seconds))
+
+    def record_retry(self, status_code: int) -> None:
+        with self._lock:
+            self._metrics["retries"] += 1
+            if status_code == 429:
+                self._metrics["throttled"] += 1
+
+    def _enter_queue(self) -> None:
+        with self._lock:
+            self._metrics["queue_depth"] += 1
+            self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], self._metrics["queue_depth"])
+
+    def _leave_queue(self) -> None:
+        with self._lock:
+            self._metrics["queue_depth"] -= 1
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            self._enter_queue()
+            try:
+                time.sleep(wait)
+            finally:
+                self._leave_queue()
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            self._enter_queue()
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._leave_queue()
+        return wait
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot["used_today"] = self._used_today
+        snapshot["total_wait_seconds"] = round(snapshot["total_wait_seconds"], 3)
+        snapshot["max_wait_seconds"] = round(snapshot["max_wait_seconds"], 3)
+        return snapshot
+
+
+_buckets_lock = threading.Lock()
+_buckets: dict[tuple[str, str], QuotaBucket] = {}
+
+
+def _key_label(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:8]
+
+
+def get_bucket(api_name: str, api_key: str) -> QuotaBucket:
+    """Shared bucket for `(api_name, api_key)`, created from the API's quota settings."""
+    key = (api_name, _key_label(api_key))
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            default_per_second, default_budget = API_QUOTA_DEFAULTS.get(api_name, (1.0, 0))
+            per_second_setting, budget_setting = API_QUOTA_SETTINGS.get(api_name, ("", ""))
+            bucket = QuotaBucket(
+                per_second=float_setting(per_second_setting, default_per_second),
+                process_budget=int(float_setting(budget_setting, default_budget)),
+            )
+            _buckets[key] = bucket
+    return bucket
+
+
+def reset_buckets() -> None:
+    with _buckets_lock:
+        _buckets.clear()
+
+
+def quota_metrics() -> dict[str, dict[str, Any]]:
+    """Metrics per bucket, labelled `api_name:<key hash prefix>` so keys never leak into logs."""
+    with _buckets_lock:
+        buckets = dict(_buckets)
+    return {f"{api_name}:{label}": bucket.snapshot() for (api_name, label), bucket in sorted(buckets.items())}
+
+
+def parse_retry_after(value: Any, *, now: float | None = None) -> float | None:
+    """Parse a `Retry-After` header (delta-seconds or HTTP-date) into seconds."""
+    text = str(value or "").strip()
+    if not text:
+        return None
+    if text.isdigit():
+        return float(text)
+    try:
+        retry_at = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt_timezone.utc)
+    current = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - current)
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """`Retry-After` when given, else capped exponential backoff with equal jitter."""
+    if retry_after is not None:
+        return min(retry_after, DEFAULT_BACKOFF_CAP_SECONDS)
+    ceiling = min(DEFAULT_BACKOFF_CAP_SECONDS, DEFAULT_BACKOFF_BASE_SECONDS * (2**attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def _retry_delay(
+    bucket: QuotaBucket,
+    response: Any,
+    attempt: int,
+    throttled: Callable[[Any], bool] | None = None,
+) -> float | None:
+    """
+    Return how long this caller sleeps before retrying, or None when `response` is final.
+
+    A 429 throttles the whole key, so its delay is applied to the bucket (every caller
+    waits) instead of to this caller alone. `throttled` flags responses that mean the
+    same without the status code (e.g. a 200 carrying an over-quota status), which
+    are treated as a 429.
+    """
+    status_code = int(getattr(response, "status_code", 0) or 0)
+    if throttled is not None and throttled(response):
+        status_code = 429
+    if status_code not in RETRYABLE_STATUS_CODES or attempt + 1 >= DEFAULT_MAX_ATTEMPTS:
+        return None
+    bucket.record_retry(status_code)
+    delay = backoff_delay(attempt, parse_retry_after(response.headers.get("Retry-After")))
+    if status_code == 429:
+        bucket.defer(delay)
+        return 0.0
+    return delay
+
+
+def call_with_quota(
+    bucket: QuotaBucket,
+    send: Callable[[], ResponseT],
+    *,
+    throttled: Callable[[ResponseT], bool] | None = None,
+) -> ResponseT:
+    """
+    Send through `bucket`, retrying 429/5xx (and `throttled` responses) with backoff.
+    Returns the last response; raises `QuotaExhaustedError` when the process budget is gone.
+    """
+    attempt = 0
+    while True:
+        bucket.acquire()
+        response = send()
+        delay = _retry_delay(bucket, response, attempt, throttled)
+        if delay is None:
+            return response
+        if delay > 0:
+            time.sleep(delay)
+        attempt += 1
+
+
+async def async_call_with_quota(bucket: QuotaBucket, send: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+    """Async counterpart of `call_with_quota` for the httpx batch collector."""
+    attempt = 0
+    while True:
+        await bucket.acquire_async()
+        response = await send()
+        delay = _retry_delay(bucket, response, attempt)
+        if delay is None:
+            return response
+        if delay > 0:
+            await asyncio.sleep(delay)
+        attempt += 1
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+from django.conf import settings
 from django.db import transaction
 
 from growth_ops.models import Lead, WebsiteEvidence, WebsiteReport
+from growth_ops.services.html_signals import MULTISPACE_RE, TAG_RE, HomepageSignals, parse_homepage_signals
+from growth_ops.services.keyword_matcher import keyword_matcher
+from growth_ops.services.lead_features import record_report_features
 from growth_ops.services.llm_gateway import LLMGatewayClient, LLMGatewayError
+from growth_ops.services.stage_timing import stage_timer
 
 RULES_REPORT_MODEL = "rules_v1"
 RULES_REPORT_PROMPT_VERSION = "growth_report_v2_rules_1"
+REPORT_MEMO_VERSION = "report_memo_1"
+# Fallbacks decided by the report inputs alone; other fallbacks (gateway errors) are retried.
+DETERMINISTIC_LLM_FALLBACK_PREFIXES = ("missing_required_keys:", "missing_evidence_for_llm", "missing_website_url")
 LOW_PERFORMANCE_THRESHOLD = 70.0
 HIGH_LCP_THRESHOLD_MS = 2500.0
 SEO_TITLE_MIN_LENGTH = 30
@@ -40,40 +50,12 @@ PLATFORM_MARKERS = {
     "webflow": "webflow",
     "wix": "wix",
 }
-TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
 H1_RE = re.compile(r"<h1\b[^>]*>.*?</h1>", re.IGNORECASE | re.DOTALL)
-META_DESCRIPTION_RE = re.compile(
-    r'<meta\b[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\'][^>]*>',
-    re.IGNORECASE | re.DOTALL,
-)
-META_DESCRIPTION_RE_ALT = re.compile(
-    r'<meta\b[^>]*content=["\']([^"\']*)["\'][^>]*name=["\']description["\'][^>]*>',
-    re.IGNORECASE | re.DOTALL,
-)
-CANONICAL_RE = re.compile(
-    r'<link\b[^>]*rel=["\']canonical["\'][^>]*href=["\']([^"\']+)["\'][^>]*>',
-    re.IGNORECASE | re.DOTALL,
-)
-CANONICAL_RE_ALT = re.compile(
-    r'<link\b[^>]*href=["\']([^"\']+)["\'][^>]*rel=["\']canonical["\'][^>]*>',
-    re.IGNORECASE | re.DOTALL,
-)
 PHONE_RE = re.compile(r"(\+?\d[\d\s\-\(\)]{7,}\d)")
 EMAIL_RE = re.compile(r"[A-Z0-9._%+\-]+@[A-Z0-9.\-]+\.[A-Z]{2,}", re.IGNORECASE)
-FORM_RE = re.compile(r"<form\b[^>]*>", re.IGNORECASE)
 TESTIMONIAL_RE = re.compile(r"\b(testimonial|testimonials|review|reviews|client stories)\b", re.IGNORECASE)
 TEAM_RE = re.compile(r"\b(about us|our team|meet the team|our story|who we are)\b", re.IGNORECASE)
 ADDRESS_RE = re.compile(r"\b(address|street|road|avenue|galway|dublin|ireland|location)\b", re.IGNORECASE)
-SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
-STYLE_RE = re.compile(r"<style\b[^>]*>.*?</style>", re.IGNORECASE | re.DOTALL)
-NOSCRIPT_RE = re.compile(r"<noscript\b[^>]*>.*?</noscript>", re.IGNORECASE | re.DOTALL)
-HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
-TAG_RE = re.compile(r"<[^>]+>")
-MULTISPACE_RE = re.compile(r"\s+")
-H1_TEXT_RE = re.compile(r"<h1\b[^>]*>(.*?)</h1>", re.IGNORECASE | re.DOTALL)
-HEADING_RE = re.compile(r"<h[1-6]\b[^>]*>.*?</h[1-6]>", re.IGNORECASE | re.DOTALL)
-SECTION_RE = re.compile(r"<section\b[^>]*>", re.IGNORECASE)
-CTA_ACTION_BLOCK_RE = re.compile(r"<(a|button)\b([^>]*)>(.*?)</\1>", re.IGNORECASE | re.DOTALL)
 INSTITUTIONAL_RE = re.compile(r"\b(university|award|certified|official|since)\b", re.IGNORECASE)
 PRICING_RE = re.compile(
     r"(€\s?\d+|pricing|price|starting at|from\s+€|per\s+month|/month)",
@@ -161,6 +143,24 @@ def _normalize_evidence_ids(evidence_ids: list[int | str]) -> list[str]:
     return out
 
 
+def _without_stage_timings(report_payload: Any) -> Any:
+    """Report payload minus `_provenance.stage_timings_ms`, which differs on every run."""
+    provenance = report_payload.get("_provenance") if isinstance(report_payload, dict) else None
+    if not isinstance(provenance, dict) or "stage_timings_ms" not in provenance:
+        return report_payload
+    stripped_provenance = {key: value for key, value in provenance.items() if key != "stage_timings_ms"}
+    return {**report_payload, "_provenance": stripped_provenance}
+
+
+def with_stage_timings(report_payload: dict[str, Any], durations_ms: dict[str, float]) -> dict[str, Any]:
+    """Copy of `report_payload` with per-stage durations recorded in `_provenance.stage_timings_ms`."""
+    provenance = report_payload.get("_provenance")
+    return {
+        **report_payload,
+        "_provenance": {**(provenance if isinstance(provenance, dict) else {}), "stage_timings_ms": durations_ms},
+    }
+
+
 def _find_matching_report(
     *,
     lead: Lead,
@@ -174,18 +174,79 @@ def _find_matching_report(
         model=model,
         prompt_version=prompt_version,
     ).order_by("-created_at")[:25]
-    target_report = _canonical_json(report_payload)
+    target_report = _canonical_json(_without_stage_timings(report_payload))
     target_evidence_ids = list(evidence_ids)
     for report in recent_reports:
         if (
             list(report.evidence_ids or []) == target_evidence_ids
-            and _canonical_json(report.report) == target_report
+            and _canonical_json(_without_stage_timings(report.report)) == target_report
             and (report.summary or "") == summary
         ):
             return report
     return None
 
 
+def report_llm_prompt_version() -> str:
+    """LLM report prompt version the gateway is expected to serve; bump it to invalidate memoized reports."""
+    return str(
+        getattr(settings, "LLM_GATEWAY_REPORT_PROMPT_VERSION", os.getenv("LLM_GATEWAY_REPORT_PROMPT_VERSION", ""))
+    ).strip()
+
+
+def report_memo_key(*, lead: Lead, evidence: list[WebsiteEvidence], model: str, prompt_version: str) -> str:
+    """
+    sha256 over everything a generated report depends on: the evidence fingerprint
+    set, rules and LLM prompt versions, CTA keywords and the lead fields read by
+    `build_report_payload` / `enhance_report_with_llm`.
+
+    Returns "" (not memoizable) when any evidence row has no fingerprint yet.
+    """
+    if any(not item.fingerprint for item in evidence):
+        return ""
+    key_material = {
+        "memo_version": REPORT_MEMO_VERSION,
+        "model": model,
+        "prompt_version": prompt_version,
+        "llm_prompt_version": report_llm_prompt_version(),
+        "cta_keywords": cta_keywords(),
+        "evidence": sorted(
+            [item.evidence_type, item.url or "", item.tool or "", item.fingerprint] for item in evidence
+        ),
+        "lead": {
+            "company_name": lead.company_name or "",
+            "location": lead.location or "",
+            "website_url": lead.website_url or "",
+            "market": lead.market or "",
+            "industry": lead.industry or "",
+        },
+    }
+    return hashlib.sha256(_canonical_json(key_material).encode("utf-8")).hexdigest()
+
+
+def report_is_memoizable(report_payload: Any) -> bool:
+    """False for reports that fell back to deterministic output because of a transient LLM failure."""
+    provenance = report_payload.get("_provenance") if isinstance(report_payload, dict) else None
+    if not isinstance(provenance, dict) or not provenance.get("llm_fallback_used"):
+        return True
+    reason = str(provenance.get("llm_fallback_reason") or "")
+    return reason.startswith(DETERMINISTIC_LLM_FALLBACK_PREFIXES)
+
+
+def find_memoized_report(*, lead: Lead, memo_key: str, evidence_ids: list[int | str]) -> WebsiteReport | None:
+    """Newest report stored under `memo_key` that cites the same evidence rows; marks the lead reported."""
+    if not memo_key:
+        return None
+    target_evidence_ids = _normalize_evidence_ids(evidence_ids)
+    for report in lead.website_reports.filter(memo_key=memo_key).order_by("-created_at", "-id")[:5]:
+        if list(report.evidence_ids or []) == target_evidence_ids:
+            if lead.status in {"new", "evidence_collected"}:
+                lead.status = "reported"
+                lead.save(update_fields=["status", "updated_at"])
+            record_report_features(lead, report)
+            return report
+    return None
+
+
 def validate_evidence_ids_for_lead(lead: Lead, evidence_ids: list[Any]) -> list[int]:
     numeric_ids: set[int] = set()
     for item in evidence_ids:
@@ -249,25 +310,6 @@ def _evidence_exists(evidence_obj: WebsiteEvidence | None) -> bool:
     return status_code is not None and 200 <= status_code < 400
 
 
-def _strip_html_for_signal_analysis(html: str) -> str:
-    cleaned = SCRIPT_RE.sub(" ", html or "")
-    cleaned = STYLE_RE.sub(" ", cleaned)
-    cleaned = NOSCRIPT_RE.sub(" ", cleaned)
-    cleaned = HTML_COMMENT_RE.sub(" ", cleaned)
-    cleaned = TAG_RE.sub(" ", cleaned)
-    return MULTISPACE_RE.sub(" ", cleaned).strip()
-
-
-def _extract_h1_texts(homepage_html: str) -> list[str]:
-    values: list[str] = []
-    for match in H1_TEXT_RE.findall(homepage_html):
-        stripped = TAG_RE.sub(" ", match)
-        normalized = MULTISPACE_RE.sub(" ", stripped).strip()
-        if normalized:
-            values.append(normalized)
-    return values
-
-
 def _extract_domain_token(domain_or_url: str) -> str:
     raw = (domain_or_url or "").strip().lower()
     if not raw:
@@ -284,18 +326,13 @@ def _extract_domain_token(domain_or_url: str) -> str:
     return parts[0]
 
 
-def _dom_depth_until(html: str, position: int) -> int:
-    depth = 0
-    for token in re.finditer(r"<(/?)([a-zA-Z0-9]+)(?:\s[^>]*)?>", html[: max(position, 0)]):
-        raw_tag = token.group(0)
-        is_closing = token.group(1) == "/"
-        is_self_closing = raw_tag.endswith("/>")
-        if is_closing:
-            depth = max(0, depth - 1)
-            continue
-        if not is_self_closing:
-            depth += 1
-    return max(depth, 1)
+def cta_keywords() -> list[str]:
+    """CTA keywords from `GROWTH_CTA_KEYWORDS` (list setting or comma-separated env), else `CTA_KEYWORDS`."""
+    configured = getattr(settings, "GROWTH_CTA_KEYWORDS", None)
+    if not isinstance(configured, (list, tuple)):
+        configured = os.getenv("GROWTH_CTA_KEYWORDS", "").split(",")
+    keywords = [str(keyword).strip().lower() for keyword in configured if str(keyword).strip()]
+    return keywords or list(CTA_KEYWORDS)
 
 
 def _count_keyword_hits(text: str, keywords: list[str]) -> tuple[int, float | None]:
@@ -304,13 +341,14 @@ def _count_keyword_hits(text: str, keywords: list[str]) -> tuple[int, float | No
     total_hits = 0
     first_pos: float | None = None
 
+    hits = keyword_matcher(keywords).hits(normalized)
     for keyword in keywords:
-        pattern = re.compile(rf"\b{re.escape(keyword.lower())}\b")
-        matches = list(pattern.finditer(normalized))
-        if not matches:
+        hit = hits.get(keyword.lower())
+        if hit is None:
             continue
-        total_hits += len(matches)
-        hit_pos = matches[0].start() / text_len
+        match_count, first_start = hit
+        total_hits += match_count
+        hit_pos = first_start / text_len
         if first_pos is None or hit_pos < first_pos:
             first_pos = hit_pos
 
@@ -327,7 +365,10 @@ def _cta_position_label(first_cta_position: float | None) -> str:
     return "late"
 
 
-def _derive_cta_signals(homepage_payload: dict[str, Any]) -> dict[str, Any]:
+def _derive_cta_signals(
+    homepage_payload: dict[str, Any],
+    signals: HomepageSignals | None = None,
+) -> dict[str, Any]:
     body_html = str(homepage_payload.get("body") or "")
     exists = bool(homepage_payload.get("exists", False))
     if not exists or not body_html:
@@ -345,48 +386,50 @@ def _derive_cta_signals(homepage_payload: dict[str, Any]) -> dict[str, Any]:
             "visual_cta_density": 0.0,
         }
 
-    visible_text = _strip_html_for_signal_analysis(body_html)
-    keyword_hits, first_cta_ratio = _count_keyword_hits(visible_text, CTA_KEYWORDS)
+    if signals is None or signals.html != body_html:
+        signals = parse_homepage_signals(body_html)
+    visible_text = signals.visible_text
+    keywords = cta_keywords()
+    cta_matcher = keyword_matcher(keywords)
+    keyword_hits, first_cta_ratio = _count_keyword_hits(visible_text, keywords)
     first_cta_position_ratio = first_cta_ratio
 
     has_phone = bool(PHONE_RE.search(visible_text))
     has_email = bool(EMAIL_RE.search(visible_text))
-    has_form = bool(FORM_RE.search(body_html))
+    has_form = signals.tag_counts["forms"] > 0
     has_contact_method = has_phone or has_email or has_form
 
     body_length = max(len(body_html), 1)
     hero_length = max(1, int(body_length * 0.35))
     hero_html = body_html[:hero_length]
-    hero_text = _strip_html_for_signal_analysis(hero_html)
+    hero_text = signals.visible_text_before(hero_length)
     pricing_detected = bool(PRICING_RE.search(hero_html) or PRICING_RE.search(hero_text))
 
     action_elements_count = 0
     action_elements_above_fold = 0
     cta_depth_sum = 0.0
     first_action_ratio: float | None = None
-    for match in CTA_ACTION_BLOCK_RE.finditer(body_html):
-        attrs = (match.group(2) or "").lower()
-        action_body = match.group(3) or ""
+    for action_start, raw_attrs, action_body in signals.action_blocks:
+        attrs = raw_attrs.lower()
         action_text = MULTISPACE_RE.sub(" ", TAG_RE.sub(" ", action_body)).strip().lower()
         combined = f"{attrs} {action_text}".strip()
         if not combined:
             continue
 
-        is_cta_intent = any(
-            re.search(rf"\b{re.escape(keyword.lower())}\b", combined)
-            for keyword in CTA_KEYWORDS
-        ) or any(token in combined for token in ("mailto:", "tel:", "btn", "cta", "pricing", "price"))
+        is_cta_intent = cta_matcher.search(combined) or any(
+            token in combined for token in ("mailto:", "tel:", "btn", "cta", "pricing", "price")
+        )
         if not is_cta_intent:
             continue
 
         action_elements_count += 1
-        start_ratio = match.start() / body_length
+        start_ratio = action_start / body_length
         if first_action_ratio is None or start_ratio < first_action_ratio:
             first_action_ratio = start_ratio
         if start_ratio <= 0.35:
             action_elements_above_fold += 1
 
-        depth = _dom_depth_until(body_html, match.start())
+        depth = signals.depth_at(action_start)
         cta_depth_sum += float(depth)
 
     if first_action_ratio is not None:
@@ -426,27 +469,6 @@ def _derive_cta_signals(homepage_payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _extract_title_text(homepage_html: str) -> str:
-    match = TITLE_RE.search(homepage_html)
-    if not match:
-        return ""
-    return " ".join(match.group(1).split()).strip()
-
-
-def _extract_meta_description(homepage_html: str) -> str:
-    match = META_DESCRIPTION_RE.search(homepage_html) or META_DESCRIPTION_RE_ALT.search(homepage_html)
-    if not match:
-        return ""
-    return " ".join(match.group(1).split()).strip()
-
-
-def _extract_canonical_href(homepage_html: str) -> str:
-    match = CANONICAL_RE.search(homepage_html) or CANONICAL_RE_ALT.search(homepage_html)
-    if not match:
-        return ""
-    return match.group(1).strip()
-
-
 def _resolve_canonical_mismatch(canonical_href: str, requested_url: str) -> bool:
     if not canonical_href:
         return False
@@ -477,7 +499,11 @@ def _performance_rating(score: float | None) -> str:
     return "poor"
 
 
-def _detect_platform_signals(homepage_payload: dict[str, Any], tech_payload: dict[str, Any]) -> tuple[str, list[str]]:
+def _detect_platform_signals(
+    homepage_payload: dict[str, Any],
+    tech_payload: dict[str, Any],
+    homepage_signals: HomepageSignals | None = None,
+) -> tuple[str, list[str]]:
     cms = str(
         tech_payload.get("cms")
         or tech_payload.get("platform")
@@ -488,7 +514,10 @@ def _detect_platform_signals(homepage_payload: dict[str, Any], tech_payload: dic
     if cms:
         signals.append(cms)
 
-    homepage_body = str(homepage_payload.get("body") or "").lower()
+    if homepage_signals is not None:
+        homepage_body = homepage_signals.lowered
+    else:
+        homepage_body = str(homepage_payload.get("body") or "").lower()
     for marker, signal in PLATFORM_MARKERS.items():
         if marker in homepage_body and signal not in signals:
             signals.append(signal)
@@ -516,8 +545,14 @@ def _trust_rating(score: int, max_score: int) -> str:
     return "weak"
 
 
-def infer_site_type(homepage_html: str, title: str, domain: str) -> str:
-    combined = f"{title or ''} {_strip_html_for_signal_analysis(homepage_html)} {domain or ''}".lower()
+def infer_site_type(
+    homepage_html: str,
+    title: str,
+    domain: str,
+    signals: HomepageSignals | None = None,
+) -> str:
+    visible_text = (signals or parse_homepage_signals(homepage_html or "")).visible_text
+    combined = f"{title or ''} {visible_text} {domain or ''}".lower()
     if "university" in combined:
         return "institutional"
 
@@ -610,23 +645,30 @@ def build_report_payload(*, lead: Lead, evidence: list[WebsiteEvidence]) -> dict
 
     has_robots = _evidence_exists(robots)
     has_sitemap = _evidence_exists(sitemap)
+    sitemap_summary: dict[str, Any] = {}
+    if sitemap is not None and isinstance(sitemap.payload, dict) and isinstance(sitemap.payload.get("summary"), dict):
+        sitemap_summary = sitemap.payload["summary"]
     homepage_html = str(homepage_payload.get("body") or "")
     homepage_requested_url = str(homepage_payload.get("requested_url") or lead.website_url or "")
-    homepage_text = _strip_html_for_signal_analysis(homepage_html)
+    # One tokenizer pass feeds every HTML-derived signal below.
+    with stage_timer("homepage_parse"):
+        signals = parse_homepage_signals(homepage_html)
+    homepage_text = signals.visible_text
 
-    title_text = _extract_title_text(homepage_html)
+    title_text = signals.title
     title_length = len(title_text)
-    meta_description = _extract_meta_description(homepage_html)
+    meta_description = signals.meta_description
     meta_description_length = len(meta_description)
-    h1_texts = _extract_h1_texts(homepage_html)
+    h1_texts = list(signals.h1_texts)
     h1_count = len(h1_texts)
     unique_h1_count = len({value.lower() for value in h1_texts})
     has_h1 = h1_count > 0
-    canonical_href = _extract_canonical_href(homepage_html)
+    canonical_href = signals.canonical_href
     has_canonical = bool(canonical_href)
     canonical_mismatch = _resolve_canonical_mismatch(canonical_href, homepage_requested_url)
 
-    cta_signals = _derive_cta_signals(homepage_payload)
+    with stage_timer("cta_signals"):
+        cta_signals = _derive_cta_signals(homepage_payload, signals)
     cta_clarity = str(cta_signals["clarity"])
     has_phone = bool(cta_signals["has_phone"])
     has_email = bool(cta_signals["has_email"])
@@ -641,8 +683,8 @@ def build_report_payload(*, lead: Lead, evidence: list[WebsiteEvidence]) -> dict
         has_address = (lead.location or "").strip().lower() in homepage_text.lower()
 
     has_institutional_signal = bool(INSTITUTIONAL_RE.search(homepage_text))
-    heading_count = len(HEADING_RE.findall(homepage_html))
-    section_count = len(SECTION_RE.findall(homepage_html))
+    heading_count = signals.tag_counts["headings"]
+    section_count = signals.tag_counts["sections"]
     content_depth_score = min(5, (heading_count // 2) + (section_count // 2))
     if len(homepage_text) > 2000:
         content_depth_score = min(5, content_depth_score + 1)
@@ -655,16 +697,20 @@ def build_report_payload(*, lead: Lead, evidence: list[WebsiteEvidence]) -> dict
     if domain_token and len(domain_token) >= 4:
         brand_tokens.append(domain_token)
     normalized_brand_tokens = list(dict.fromkeys(brand_tokens))
-    brand_mention_count = 0
-    for token in normalized_brand_tokens:
-        brand_mention_count = max(brand_mention_count, len(re.findall(rf"\b{re.escape(token)}\b", homepage_text.lower())))
+    brand_hits = keyword_matcher(normalized_brand_tokens).hits(homepage_text.lower())
+    brand_mention_count = max((match_count for match_count, _first_start in brand_hits.values()), default=0)
 
     structured_sections = heading_count >= 4 or section_count >= 3
     has_brand_signal = brand_mention_count >= 2 or structured_sections
 
-    inferred_site_type = infer_site_type(homepage_html, title_text, homepage_requested_url or lead.website_url or "")
+    inferred_site_type = infer_site_type(
+        homepage_html,
+        title_text,
+        homepage_requested_url or lead.website_url or "",
+        signals=signals,
+    )
 
-    cms, platform_signals = _detect_platform_signals(homepage_payload, tech_payload)
+    cms, platform_signals = _detect_platform_signals(homepage_payload, tech_payload, signals)
     has_https = str(lead.website_url or "").strip().lower().startswith("https://")
 
     if perf_source == "pagespeed_json":
@@ -962,6 +1008,8 @@ def build_report_payload(*, lead: Lead, evidence: list[WebsiteEvidence]) -> dict
         "seo": {
             "has_robots": has_robots,
             "has_sitemap": has_sitemap,
+            "sitemap_url_count": sitemap_summary.get("url_count"),
+            "sitemap_host_mismatch_count": sitemap_summary.get("host_mismatch_count"),
             "has_title": has_title,
             "title_length": title_length if has_title else 0,
             "has_meta_description": has_meta_description,
@@ -1167,7 +1215,8 @@ def enhance_report_with_llm(
 
     try:
         llm = LLMGatewayClient()
-        llm_response = llm.report(request_payload)
+        with stage_timer("llm_gateway"):
+            llm_response = llm.report(request_payload)
         if not isinstance(llm_response, dict):
             raise ValueError("llm_report_invalid_shape")
 
@@ -1216,6 +1265,7 @@ def upsert_report(
     prompt_version: str,
     summary: str = "",
     force: bool = False,
+    memo_key: str = "",
 ) -> tuple[WebsiteReport, bool]:
     normalized_evidence_ids = _normalize_evidence_ids(evidence_ids)
     resolved_summary = summary.strip()
@@ -1227,18 +1277,23 @@ def upsert_report(
         ).strip()
 
     if not force:
-        existing_report = _find_matching_report(
-            lead=lead,
-            model=model,
-            prompt_version=prompt_version,
-            evidence_ids=normalized_evidence_ids,
-            report_payload=report_payload,
-            summary=resolved_summary,
-        )
+        with stage_timer("report_dedupe"):
+            existing_report = _find_matching_report(
+                lead=lead,
+                model=model,
+                prompt_version=prompt_version,
+                evidence_ids=normalized_evidence_ids,
+                report_payload=report_payload,
+                summary=resolved_summary,
+            )
         if existing_report is not None:
+            if memo_key and existing_report.memo_key != memo_key:
+                existing_report.memo_key = memo_key
+                existing_report.save(update_fields=["memo_key"])
             if lead.status in {"new", "evidence_collected"}:
                 lead.status = "reported"
                 lead.save(update_fields=["status", "updated_at"])
+            record_report_features(lead, existing_report)
             return existing_report, False
 
     report = WebsiteReport.objects.create(
@@ -1248,10 +1303,12 @@ def upsert_report(
         evidence_ids=normalized_evidence_ids,
         report=report_payload,
         summary=resolved_summary,
+        memo_key=memo_key,
     )
     if lead.status in {"new", "evidence_collected"}:
         lead.status = "reported"
         lead.save(update_fields=["status", "updated_at"])
+    record_report_features(lead, report)
     return report, True
 
 
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Iterable
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
-from growth_ops.models import Lead, WebsiteReport
+from growth_ops.models import Lead, LeadFeatures, WebsiteEvidence, WebsiteReport
+from growth_ops.services.app_settings import int_setting
 
 REASON_HAS_WEBSITE = "HAS_WEBSITE"
 REASON_LOW_MOBILE_PERF = "LOW_MOBILE_PERFORMANCE"
@@ -28,6 +33,26 @@ REASON_INDUSTRY_FIT = "INDUSTRY_FIT"
 # A: strongest opportunity, B: worth contacting, C: skip for now.
 OUTREACH_BUCKET_A_MIN = 70
 OUTREACH_BUCKET_B_MIN = 35
+DEFAULT_FIT_INDUSTRIES = [
+    "construction",
+    "legal",
+    "medical",
+    "finance",
+    "real estate",
+    "ecommerce",
+    "hospitality",
+    "saas",
+]
+DEFAULT_TEMPLATE_CMS = ["wordpress", "wix", "squarespace", "shopify", "webflow"]
+REPORT_FEATURE_FIELDS = (
+    "site_type",
+    "cta_clarity",
+    "trust_rating",
+    "has_contact_method",
+    "report_has_https",
+    "report_perf_score",
+    "report_lcp_ms",
+)
 
 
 @dataclass(frozen=True)
@@ -63,14 +88,6 @@ def priority_for_bucket(bucket: str) -> str:
     return "low"
 
 
-def _int_setting(name: str, default: int) -> int:
-    raw = str(getattr(settings, name, os.getenv(name, default))).strip()
-    try:
-        return int(raw)
-    except (TypeError, ValueError):
-        return default
-
-
 def _list_setting(name: str, default: list[str]) -> list[str]:
     setting_value = getattr(settings, name, None)
     if isinstance(setting_value, (list, tuple)):
@@ -82,6 +99,70 @@ def _list_setting(name: str, default: list[str]) -> list[str]:
     return [item.strip().lower() for item in raw.split(",") if item.strip()]
 
 
+SCORING_CONFIG_SETTINGS = frozenset(
+    {
+        "LEAD_SCORE_LIGHTHOUSE_THRESHOLD",
+        "LEAD_SCORE_LCP_THRESHOLD_MS",
+        "LEAD_SCORE_FIT_INDUSTRIES",
+        "LEAD_SCORE_TEMPLATE_CMS",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ScoringConfig:
+    """Scoring thresholds and keyword lists, resolved from settings/env once per process."""
+
+    performance_threshold: int
+    lcp_threshold_ms: int
+    fit_industries: tuple[str, ...]
+    template_cms: tuple[str, ...]
+    # Short hash of the values above, recorded on every score's recommendation.
+    version: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        values = json.dumps(
+            [self.performance_threshold, self.lcp_threshold_ms, self.fit_industries, self.template_cms],
+            separators=(",", ":"),
+        )
+        object.__setattr__(self, "version", hashlib.sha256(values.encode("utf-8")).hexdigest()[:12])
+
+    @classmethod
+    def from_settings(cls) -> ScoringConfig:
+        return cls(
+            performance_threshold=int_setting("LEAD_SCORE_LIGHTHOUSE_THRESHOLD", 70),
+            lcp_threshold_ms=int_setting("LEAD_SCORE_LCP_THRESHOLD_MS", 3000),
+            fit_industries=tuple(_list_setting("LEAD_SCORE_FIT_INDUSTRIES", DEFAULT_FIT_INDUSTRIES)),
+            template_cms=tuple(sorted(set(_list_setting("LEAD_SCORE_TEMPLATE_CMS", DEFAULT_TEMPLATE_CMS)))),
+        )
+
+
+_scoring_config: ScoringConfig | None = None
+
+
+def scoring_config() -> ScoringConfig:
+    """The process-wide `ScoringConfig`, built on first use."""
+    global _scoring_config
+    config = _scoring_config
+    if config is None:
+        config = _scoring_config = ScoringConfig.from_settings()
+    return config
+
+
+def reload_scoring_config() -> ScoringConfig:
+    """Rebuild the config, e.g. after changing the LEAD_SCORE_* environment variables."""
+    global _scoring_config
+    _scoring_config = ScoringConfig.from_settings()
+    return _scoring_config
+
+
+@receiver(setting_changed)
+def _reload_scoring_config_on_setting_change(*, setting: str, **kwargs: Any) -> None:
+    global _scoring_config
+    if setting in SCORING_CONFIG_SETTINGS:
+        _scoring_config = None
+
+
 def _to_float(value: Any) -> float | None:
     try:
         return float(value)
@@ -89,6 +170,54 @@ def _to_float(value: Any) -> float | None:
         return None
 
 
+# Payload paths read by _extract_performance_score / _extract_lcp_ms, and the CMS keys of tech fingerprints.
+SCORING_NUMERIC_PAYLOAD_PATHS = (
+    ("performance_score",),
+    ("performance",),
+    ("mobile_performance_score",),
+    ("categories", "performance", "score"),
+    ("lighthouseResult", "categories", "performance", "score"),
+    ("lcp_ms",),
+    ("largest_contentful_paint_ms",),
+    ("metrics", "lcp", "value_ms"),
+    ("audits", "largest-contentful-paint", "numericValue"),
+    ("lighthouseResult", "audits", "largest-contentful-paint", "numericValue"),
+)
+SCORING_CMS_KEYS = ("cms", "platform", "builder")
+
+
+def scoring_payload_fields(payload: Any) -> dict[str, Any]:
+    """
+    The parts of an evidence payload that scoring reads, nested as in `payload`.
+
+    Retention compaction keeps these on its stubs so compacted rows score
+    exactly like the originals.
+    """
+    if not isinstance(payload, dict):
+        return {}
+    kept: dict[str, Any] = {key: payload[key] for key in SCORING_CMS_KEYS if key in payload}
+    for path in SCORING_NUMERIC_PAYLOAD_PATHS:
+        node: Any = payload
+        for key in path:
+            if not isinstance(node, dict) or key not in node:
+                break
+            node = node[key]
+        else:
+            if isinstance(node, (dict, list)):
+                # Never parses as a number, so scoring ignores it.
+                continue
+            target = kept
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = node
+    return kept
+
+
+def _payload_is_dict(payload: Any) -> bool:
+    # Compacted stubs are always dicts; `original_type` marks stubs of non-dict payloads.
+    return isinstance(payload, dict) and not (payload.get("compacted") and "original_type" in payload)
+
+
 def _extract_performance_score(payload: Any) -> float | None:
     if not isinstance(payload, dict):
         return None
@@ -238,13 +367,20 @@ def _extract_has_contact_method(report_obj: WebsiteReport | None) -> bool | None
     return None
 
 
-def _extract_has_https(report_obj: WebsiteReport | None, lead: Lead) -> bool | None:
+def _extract_report_has_https(report_obj: WebsiteReport | None) -> bool | None:
     payload = _report_payload(report_obj)
     technical = payload.get("technical")
     if isinstance(technical, dict):
         value = technical.get("has_https")
         if isinstance(value, bool):
             return value
+    return None
+
+
+def _extract_has_https(report_obj: WebsiteReport | None, lead: Lead) -> bool | None:
+    report_value = _extract_report_has_https(report_obj)
+    if report_value is not None:
+        return report_value
     website_url = str(lead.website_url or "").strip().lower()
     if website_url:
         return website_url.startswith("https://")
@@ -267,85 +403,225 @@ def _trust_weight_for_site_type(site_type: str) -> dict[str, int]:
     return {"weak": -10, "moderate": 0, "strong": 2}
 
 
-def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -> ScoreResult:
-    performance_threshold = _int_setting("LEAD_SCORE_LIGHTHOUSE_THRESHOLD", 70)
-    lcp_threshold_ms = _int_setting("LEAD_SCORE_LCP_THRESHOLD_MS", 3000)
+@dataclass(frozen=True)
+class LeadScoreFeatures:
+    """Everything `compute_lead_score` reads from a lead, its evidence and its report."""
+
+    has_website: bool
+    has_contact_email: bool
+    industry: str
+    site_type: str
+    perf_score: float | None
+    lcp_ms: float | None
+    cms_value: str
+    has_sitemap_evidence: bool
+    sitemap_marked_missing: bool
+    cta_clarity: str
+    has_contact_method: bool | None
+    has_https: bool | None
+    trust_rating: str
+
+
+def fold_evidence_into_features(features: LeadFeatures, evidence: Iterable[WebsiteEvidence]) -> LeadFeatures:
+    """
+    Update the evidence columns of `features` (in memory) with `evidence`, oldest first.
+
+    Each row counts as newer than everything folded in before it, so a
+    performance or LCP value replaces the stored one, while the CMS comes from
+    the first tech fingerprint ever seen.
+    """
+    for item in evidence:
+        payload = item.payload
+        if item.evidence_type == "sitemap_xml":
+            features.has_sitemap_evidence = True
+            if isinstance(payload, dict):
+                if payload.get("exists") is False:
+                    features.sitemap_marked_missing = True
+                if payload.get("status_code") in {404, 410}:
+                    features.sitemap_marked_missing = True
+
+        perf_score = _extract_performance_score(payload)
+        if perf_score is not None:
+            features.perf_score = perf_score
+        lcp_ms = _extract_lcp_ms(payload)
+        if lcp_ms is not None:
+            features.lcp_ms = lcp_ms
+
+        is_fingerprint = item.evidence_type == "tech_fingerprint" and _payload_is_dict(payload)
+        if is_fingerprint and not features.has_tech_fingerprint:
+            features.has_tech_fingerprint = True
+            features.cms_value = str(
+                payload.get("cms") or payload.get("platform") or payload.get("builder") or ""
+            ).lower()[:255]
+        if item.pk is not None:
+            features.last_evidence_id = max(features.last_evidence_id, item.pk)
+    return features
+
+
+def report_feature_values(report_obj: WebsiteReport | None) -> dict[str, Any]:
+    """The `LeadFeatures` report columns for `report_obj`."""
+    return {
+        "report": report_obj,
+        "site_type": _extract_site_type(report_obj),
+        "cta_clarity": _extract_cta_clarity(report_obj),
+        "trust_rating": _extract_trust_rating(report_obj),
+        "has_contact_method": _extract_has_contact_method(report_obj),
+        "report_has_https": _extract_report_has_https(report_obj),
+        "report_perf_score": _extract_report_performance_score(report_obj),
+        "report_lcp_ms": _extract_report_lcp_ms(report_obj),
+    }
+
+
+def fold_report_into_features(features: LeadFeatures, report_obj: WebsiteReport | None) -> LeadFeatures:
+    for field, value in report_feature_values(report_obj).items():
+        setattr(features, field, value)
+    return features
+
+
+def score_features_from_row(
+    features: LeadFeatures,
+    *,
+    lead: Lead,
+    report_obj: WebsiteReport | None,
+    has_contact_email: bool,
+) -> LeadScoreFeatures:
+    """
+    Score inputs from a materialized `LeadFeatures` row.
+
+    The report columns are used when the row was built from `report_obj`;
+    scoring against any other report reads that report's JSON instead.
+    """
+    report_id = report_obj.pk if report_obj is not None else None
+    if report_id is not None and features.report_id == report_id:
+        report_values = {field: getattr(features, field) for field in REPORT_FEATURE_FIELDS}
+    else:
+        report_values = report_feature_values(report_obj)
 
-    fit_industries = _list_setting(
-        "LEAD_SCORE_FIT_INDUSTRIES",
-        [
-            "construction",
-            "legal",
-            "medical",
-            "finance",
-            "real estate",
-            "ecommerce",
-            "hospitality",
-            "saas",
-        ],
+    perf_score = features.perf_score
+    report_perf_score = report_values["report_perf_score"]
+    if report_perf_score is not None:
+        perf_score = report_perf_score if perf_score is None else min(perf_score, report_perf_score)
+
+    lcp_ms = features.lcp_ms
+    report_lcp_ms = report_values["report_lcp_ms"]
+    if report_lcp_ms is not None:
+        lcp_ms = report_lcp_ms if lcp_ms is None else max(lcp_ms, report_lcp_ms)
+
+    has_https = report_values["report_has_https"]
+    if has_https is None:
+        website_url = str(lead.website_url or "").strip().lower()
+        has_https = website_url.startswith("https://") if website_url else None
+
+    return LeadScoreFeatures(
+        has_website=bool(lead.website_url),
+        has_contact_email=has_contact_email,
+        industry=(lead.industry or "").lower(),
+        site_type=report_values["site_type"],
+        perf_score=perf_score,
+        lcp_ms=lcp_ms,
+        cms_value=features.cms_value,
+        has_sitemap_evidence=features.has_sitemap_evidence,
+        sitemap_marked_missing=features.sitemap_marked_missing,
+        cta_clarity=report_values["cta_clarity"],
+        has_contact_method=report_values["has_contact_method"],
+        has_https=has_https,
+        trust_rating=report_values["trust_rating"],
     )
-    template_cms = set(
-        _list_setting(
-            "LEAD_SCORE_TEMPLATE_CMS",
-            ["wordpress", "wix", "squarespace", "shopify", "webflow"],
-        )
+
+
+def extract_score_features(
+    *,
+    lead: Lead,
+    report_obj: WebsiteReport | None,
+    evidence: Iterable[WebsiteEvidence],
+    has_contact_email: bool,
+) -> LeadScoreFeatures:
+    """Score inputs straight from the JSON payloads, without touching the DB; `evidence` is newest first."""
+    features = fold_evidence_into_features(LeadFeatures(), reversed(list(evidence)))
+    fold_report_into_features(features, report_obj)
+    return score_features_from_row(
+        features,
+        lead=lead,
+        report_obj=report_obj,
+        has_contact_email=has_contact_email,
     )
 
+
+def recommendation_for_score(
+    outreach_score: int,
+    quality_score: int,
+    *,
+    config_version: str,
+) -> tuple[str, dict[str, Any]]:
+    """`(bucket, recommendation)` for an outreach score produced under `config_version`."""
+    bucket = bucket_for_outreach_score(outreach_score)
+    priority = priority_for_bucket(bucket)
+
+    if bucket == "A":
+        recommendation = {
+            "offer_type": "aggressive_outreach",
+            "label": "Aggressive outreach",
+            "priority": priority,
+            "outreach_mode": "aggressive",
+            "score_semantics": "outreach_opportunity",
+            "outreach_score": outreach_score,
+            # Alias retained for backward compatibility.
+            "opportunity_score": outreach_score,
+            "quality_score": quality_score,
+        }
+    elif bucket == "B":
+        recommendation = {
+            "offer_type": "moderate_outreach",
+            "label": "Moderate outreach",
+            "priority": priority,
+            "outreach_mode": "moderate",
+            "score_semantics": "outreach_opportunity",
+            "outreach_score": outreach_score,
+            "opportunity_score": outreach_score,
+            "quality_score": quality_score,
+        }
+    else:
+        recommendation = {
+            "offer_type": "low_priority",
+            "label": "Low priority",
+            "priority": priority,
+            "outreach_mode": "low",
+            "score_semantics": "outreach_opportunity",
+            "outreach_score": outreach_score,
+            "opportunity_score": outreach_score,
+            "quality_score": quality_score,
+        }
+
+    recommendation["scoring_config_version"] = config_version
+    return bucket, recommendation
+
+
+def score_from_features(features: LeadScoreFeatures, config: ScoringConfig | None = None) -> ScoreResult:
+    config = config or scoring_config()
+    performance_threshold = config.performance_threshold
+    lcp_threshold_ms = config.lcp_threshold_ms
+    fit_industries = config.fit_industries
+    template_cms = config.template_cms
+
     reason_codes: list[str] = []
     score = 50
 
-    if lead.website_url:
+    if features.has_website:
         score += 5
         reason_codes.append(REASON_HAS_WEBSITE)
 
-    if lead.contacts.exclude(email="").exists():
+    if features.has_contact_email:
         score += 3
         reason_codes.append(REASON_CONTACT_EMAIL)
 
-    industry = (lead.industry or "").lower()
+    industry = features.industry
     if industry and any(keyword in industry for keyword in fit_industries):
         score += 2
         reason_codes.append(REASON_INDUSTRY_FIT)
 
-    site_type = _extract_site_type(report_obj)
-
-    evidence_qs = lead.website_evidence.all()
-
-    perf_score: float | None = None
-    lcp_ms: float | None = None
-    cms_value = ""
-    has_sitemap_evidence = False
-    sitemap_marked_missing = False
-
-    for evidence in evidence_qs:
-        if evidence.evidence_type == "sitemap_xml":
-            has_sitemap_evidence = True
-            payload = evidence.payload
-            if isinstance(payload, dict):
-                if payload.get("exists") is False:
-                    sitemap_marked_missing = True
-                status_code = payload.get("status_code")
-                if status_code in {404, 410}:
-                    sitemap_marked_missing = True
-
-        payload = evidence.payload
-        if perf_score is None:
-            perf_score = _extract_performance_score(payload)
-        if lcp_ms is None:
-            lcp_ms = _extract_lcp_ms(payload)
-
-        if evidence.evidence_type == "tech_fingerprint" and isinstance(payload, dict):
-            cms_value = str(
-                payload.get("cms") or payload.get("platform") or payload.get("builder") or ""
-            ).lower()
-
-    report_perf_score = _extract_report_performance_score(report_obj)
-    if report_perf_score is not None:
-        perf_score = report_perf_score if perf_score is None else min(perf_score, report_perf_score)
-
-    report_lcp_ms = _extract_report_lcp_ms(report_obj)
-    if report_lcp_ms is not None:
-        lcp_ms = report_lcp_ms if lcp_ms is None else max(lcp_ms, report_lcp_ms)
+    site_type = features.site_type
+    perf_score = features.perf_score
+    lcp_ms = features.lcp_ms
 
     if perf_score is not None and perf_score < performance_threshold:
         score -= 16
@@ -364,7 +640,7 @@ def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -
         score += 3
         reason_codes.append(REASON_FAST_LCP)
 
-    cta_clarity = _extract_cta_clarity(report_obj)
+    cta_clarity = features.cta_clarity
     cta_weights = _cta_weight_for_site_type(site_type)
     if cta_clarity in {"poor", "missing", "unclear"}:
         score += cta_weights["missing"]
@@ -378,7 +654,7 @@ def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -
     elif cta_clarity == "clear":
         score += cta_weights["clear"]
 
-    has_contact_method = _extract_has_contact_method(report_obj)
+    has_contact_method = features.has_contact_method
     if has_contact_method is False:
         if site_type == "institutional":
             score -= 6
@@ -388,7 +664,7 @@ def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -
             score -= 8
         reason_codes.append(REASON_NO_VISIBLE_CONTACT_METHOD)
 
-    has_https = _extract_has_https(report_obj, lead)
+    has_https = features.has_https
     if has_https is False:
         if site_type == "institutional":
             score -= 8
@@ -398,15 +674,16 @@ def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -
             score -= 10
         reason_codes.append(REASON_NO_HTTPS)
 
-    if not has_sitemap_evidence or sitemap_marked_missing:
+    if not features.has_sitemap_evidence or features.sitemap_marked_missing:
         score -= 8
         reason_codes.append(REASON_SITEMAP_MISSING)
 
+    cms_value = features.cms_value
     if cms_value and any(cms in cms_value for cms in template_cms):
         score -= 5
         reason_codes.append(REASON_TEMPLATE_LIMIT)
 
-    trust_rating = _extract_trust_rating(report_obj)
+    trust_rating = features.trust_rating
     trust_weights = _trust_weight_for_site_type(site_type)
     if trust_rating == "weak":
         score += trust_weights["weak"]
@@ -419,43 +696,7 @@ def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -
 
     quality_score = _normalize_score_0_100(score)
     outreach_score = 100 - quality_score
-    bucket = bucket_for_outreach_score(outreach_score)
-    priority = priority_for_bucket(bucket)
-
-    if bucket == "A":
-        recommendation = {
-            "offer_type": "aggressive_outreach",
-            "label": "Aggressive outreach",
-            "priority": priority,
-            "outreach_mode": "aggressive",
-            "score_semantics": "outreach_opportunity",
-            "outreach_score": outreach_score,
-            # Alias retained for backward compatibility.
-            "opportunity_score": outreach_score,
-            "quality_score": quality_score,
-        }
-    elif bucket == "B":
-        recommendation = {
-            "offer_type": "moderate_outreach",
-            "label": "Moderate outreach",
-            "priority": priority,
-            "outreach_mode": "moderate",
-            "score_semantics": "outreach_opportunity",
-            "outreach_score": outreach_score,
-            "opportunity_score": outreach_score,
-            "quality_score": quality_score,
-        }
-    else:
-        recommendation = {
-            "offer_type": "low_priority",
-            "label": "Low priority",
-            "priority": priority,
-            "outreach_mode": "low",
-            "score_semantics": "outreach_opportunity",
-            "outreach_score": outreach_score,
-            "opportunity_score": outreach_score,
-            "quality_score": quality_score,
-        }
+    bucket, recommendation = recommendation_for_score(outreach_score, quality_score, config_version=config.version)
 
     # Preserve stable reason ordering and remove accidental duplicates.
     deduped_reasons = list(dict.fromkeys(reason_codes))
@@ -465,3 +706,24 @@ def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -
         reason_codes=deduped_reasons,
         recommendation=recommendation,
     )
+
+
+def compute_lead_score(*, lead: Lead, report_obj: WebsiteReport | None = None) -> ScoreResult:
+    has_contact_email = lead.contacts.exclude(email="").exists()
+    row = LeadFeatures.objects.filter(lead=lead).first()
+    if row is None:
+        # Not materialized yet (see refresh_lead_features): read the payloads directly.
+        features = extract_score_features(
+            lead=lead,
+            report_obj=report_obj,
+            evidence=lead.website_evidence.order_by("-created_at", "-id"),
+            has_contact_email=has_contact_email,
+        )
+    else:
+        features = score_features_from_row(
+            row,
+            lead=lead,
+            report_obj=report_obj,
+            has_contact_email=has_contact_email,
+        )
+    return score_from_features(features)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
 
-from django.db import transaction
+from django.db import connections, transaction
+from django.db.models import OuterRef, QuerySet, Subquery
+from django.utils import timezone
 
-from growth_ops.models import Lead, LeadScore, WebsiteReport
+from growth_ops.models import Lead, LeadFeatures, LeadScore, WebsiteEvidence, WebsiteReport
+from growth_ops.services.batch_scoring import compute_lead_scores
 from growth_ops.services.contact_enrichment import upsert_contacts_for_lead
 from growth_ops.services.contact_finder import enrich_with_contact_page, extract_contact_candidates
 from growth_ops.services.drafting import upsert_outbound_draft
@@ -17,10 +23,16 @@ from growth_ops.services.reporting import (
     RULES_REPORT_PROMPT_VERSION,
     build_report_payload,
     enhance_report_with_llm,
+    find_memoized_report,
     get_latest_evidence_for_lead,
+    report_is_memoizable,
+    report_memo_key,
     upsert_report,
+    with_stage_timings,
 )
 from growth_ops.services.scoring import compute_lead_score
+from growth_ops.services.stage_timing import durations_ms, merge_durations, stage_timer, timing_scope
+from growth_ops.services.worker_setup import setup_django_worker
 
 
 def _canonical_json(value: Any) -> str:
@@ -54,16 +66,18 @@ def upsert_lead_score(
     report_obj: WebsiteReport | None,
     force: bool = False,
 ) -> tuple[LeadScore, bool]:
-    result = compute_lead_score(lead=lead, report_obj=report_obj)
+    with stage_timer("score_compute"):
+        result = compute_lead_score(lead=lead, report_obj=report_obj)
 
     if not force:
-        existing_score = _find_matching_score(
-            lead=lead,
-            score=result.score,
-            bucket=result.bucket,
-            reason_codes=result.reason_codes,
-            recommendation=result.recommendation,
-        )
+        with stage_timer("score_dedupe"):
+            existing_score = _find_matching_score(
+                lead=lead,
+                score=result.score,
+                bucket=result.bucket,
+                reason_codes=result.reason_codes,
+                recommendation=result.recommendation,
+            )
         if existing_score is not None:
             if lead.status in {"new", "evidence_collected", "reported"}:
                 lead.status = "scored"
@@ -83,6 +97,110 @@ def upsert_lead_score(
     return score_record, True
 
 
+def _current_reports(leads: list[Lead]) -> dict[int, WebsiteReport | None]:
+    """The report each lead is scored against: its `LeadFeatures.report`, else its newest report."""
+    reports: dict[int, WebsiteReport | None] = {}
+    fallback_ids: dict[int, int] = {}
+    for lead in leads:
+        try:
+            report_obj = lead.features.report
+        except LeadFeatures.DoesNotExist:
+            report_obj = None
+        reports[lead.pk] = report_obj
+        if report_obj is None and lead.latest_report_id is not None:
+            fallback_ids[lead.pk] = lead.latest_report_id
+    if fallback_ids:
+        fallback_reports = WebsiteReport.objects.in_bulk(fallback_ids.values())
+        for lead_id, report_id in fallback_ids.items():
+            reports[lead_id] = fallback_reports.get(report_id)
+    return reports
+
+
+def _recent_scores_by_key(
+    lead_ids: Iterable[int],
+    scores: Iterable[int],
+) -> dict[tuple[int, int, str], list[LeadScore]]:
+    """The 25 newest scores per `(lead, score, bucket)`, as `_find_matching_score` sees them."""
+    recent: dict[tuple[int, int, str], list[LeadScore]] = {}
+    rows = LeadScore.objects.filter(lead_id__in=set(lead_ids), score__in=set(scores)).order_by(
+        "lead_id", "score", "bucket", "-created_at", "-id"
+    )
+    for row in rows.iterator():
+        matches = recent.setdefault((row.lead_id, row.score, row.bucket), [])
+        if len(matches) < 25:
+            matches.append(row)
+    return recent
+
+
+@transaction.atomic
+def bulk_upsert_lead_scores(
+    leads: QuerySet[Lead],
+    *,
+    force: bool = False,
+    batch_size: int = 500,
+) -> list[tuple[Lead, LeadScore, bool]]:
+    """
+    `upsert_lead_score` for every lead in `leads`, in a constant number of queries.
+
+    Each lead is scored against its current report (see `_current_reports`).
+    Contacts, features and evidence are loaded per batch by `compute_lead_scores`,
+    equivalent stored scores are matched with one query, and new `LeadScore` rows
+    and status transitions are written with `bulk_create` / `bulk_update`.
+    Returns `(lead, score_record, created)` in queryset order.
+    """
+    latest_report = WebsiteReport.objects.filter(lead=OuterRef("pk")).order_by("-created_at", "-id").values("pk")[:1]
+    leads = list(
+        {
+            lead.pk: lead
+            for lead in leads.select_related("features__report").annotate(latest_report_id=Subquery(latest_report))
+        }.values()
+    )
+    if not leads:
+        return []
+
+    with stage_timer("bulk_score_compute"):
+        reports = _current_reports(leads)
+        results = compute_lead_scores([(lead, reports[lead.pk]) for lead in leads])
+    with stage_timer("bulk_score_dedupe"):
+        recent_scores = {} if force else _recent_scores_by_key((lead.pk for lead in leads), (r.score for r in results))
+
+    outcomes: list[tuple[Lead, LeadScore, bool]] = []
+    new_scores: list[LeadScore] = []
+    for lead, result in zip(leads, results):
+        target_reasons = list(result.reason_codes)
+        target_recommendation = _canonical_json(result.recommendation)
+        existing_score = next(
+            (
+                score_record
+                for score_record in recent_scores.get((lead.pk, result.score, result.bucket), [])
+                if list(score_record.reason_codes or []) == target_reasons
+                and _canonical_json(score_record.recommendation) == target_recommendation
+            ),
+            None,
+        )
+        if existing_score is not None:
+            outcomes.append((lead, existing_score, False))
+            continue
+        score_record = LeadScore(
+            lead=lead,
+            score=result.score,
+            bucket=result.bucket,
+            reason_codes=result.reason_codes,
+            recommendation=result.recommendation,
+        )
+        new_scores.append(score_record)
+        outcomes.append((lead, score_record, True))
+    with stage_timer("bulk_score_write"):
+        LeadScore.objects.bulk_create(new_scores, batch_size=batch_size)
+        now = timezone.now()
+        scored_leads = [lead for lead in leads if lead.status in {"new", "evidence_collected", "reported"}]
+        for lead in scored_leads:
+            lead.status = "scored"
+            lead.updated_at = now
+        Lead.objects.bulk_update(scored_leads, ["status", "updated_at"], batch_size=batch_size)
+    return outcomes
+
+
 def persist_lead_score(*, lead: Lead, report_obj: WebsiteReport | None) -> LeadScore:
     score_record, _created = upsert_lead_score(lead=lead, report_obj=report_obj, force=False)
     return score_record
@@ -117,11 +235,12 @@ def run_outreach_for_lead(
         raise ValueError("lead_missing_score")
 
     report_payload = resolved_report.report if isinstance(resolved_report.report, dict) else {}
-    decision = classify_outreach_opportunity(
-        lead=lead,
-        report_payload=report_payload,
-        score_obj=resolved_score,
-    )
+    with stage_timer("outreach_decision"):
+        decision = classify_outreach_opportunity(
+            lead=lead,
+            report_payload=report_payload,
+            score_obj=resolved_score,
+        )
     if not decision.get("should_contact", False):
         return {
             "lead_id": lead.id,
@@ -134,22 +253,24 @@ def run_outreach_for_lead(
             "draft_skipped": True,
         }
 
-    email_payload = build_outreach_email(
-        lead=lead,
-        report_payload=report_payload,
-        score_obj=resolved_score,
-        decision=decision,
-        report_obj=resolved_report,
-        sequence_step=1,
-    )
-    draft, draft_created = upsert_outbound_draft(
-        lead=lead,
-        decision=decision,
-        email_payload=email_payload,
-        score_obj=resolved_score,
-        report_obj=resolved_report,
-        force=force,
-    )
+    with stage_timer("email_build"):
+        email_payload = build_outreach_email(
+            lead=lead,
+            report_payload=report_payload,
+            score_obj=resolved_score,
+            decision=decision,
+            report_obj=resolved_report,
+            sequence_step=1,
+        )
+    with stage_timer("draft_upsert"):
+        draft, draft_created = upsert_outbound_draft(
+            lead=lead,
+            decision=decision,
+            email_payload=email_payload,
+            score_obj=resolved_score,
+            report_obj=resolved_report,
+            force=force,
+        )
 
     extracted_contacts: dict[str, Any] = {
         "emails": [],
@@ -168,15 +289,16 @@ def run_outreach_for_lead(
     primary_contact = None
     extraction_error = ""
     try:
-        homepage_html, source_url = _latest_homepage_html_for_lead(lead)
-        extracted_contacts = extract_contact_candidates(
-            homepage_html=homepage_html,
-            website_url=source_url or lead.website_url,
-        )
-        extracted_contacts = enrich_with_contact_page(
-            candidates=extracted_contacts,
-            website_url=source_url or lead.website_url,
-        )
+        with stage_timer("contact_extract"):
+            homepage_html, source_url = _latest_homepage_html_for_lead(lead)
+            extracted_contacts = extract_contact_candidates(
+                homepage_html=homepage_html,
+                website_url=source_url or lead.website_url,
+            )
+            extracted_contacts = enrich_with_contact_page(
+                candidates=extracted_contacts,
+                website_url=source_url or lead.website_url,
+            )
         contact_summary = upsert_contacts_for_lead(
             lead=lead,
             extracted_contacts=extracted_contacts,
@@ -268,32 +390,66 @@ def run_outreach_for_lead(
     }
 
 
-def run_report_and_score_for_lead(
+@dataclass(frozen=True)
+class ReportInputs:
+    """What a report/score run for one lead reads from the DB, gathered up front."""
+
+    lead: Lead
+    evidence: list[WebsiteEvidence]
+    memo_key: str
+    memoized_report: WebsiteReport | None
+
+    @property
+    def evidence_ids(self) -> list[int]:
+        return [item.id for item in self.evidence]
+
+
+def prepare_report_inputs(
     lead: Lead,
     *,
     force: bool = False,
     model: str = RULES_REPORT_MODEL,
     prompt_version: str = RULES_REPORT_PROMPT_VERSION,
-) -> dict[str, Any]:
-    evidence = get_latest_evidence_for_lead(lead)
-    evidence_ids = [item.id for item in evidence]
+) -> ReportInputs:
+    with stage_timer("evidence_load"):
+        evidence = get_latest_evidence_for_lead(lead)
+    with stage_timer("report_memo"):
+        memo_key = report_memo_key(lead=lead, evidence=evidence, model=model, prompt_version=prompt_version)
+        # A memo hit skips both the deterministic rebuild and the LLM gateway call.
+        memoized_report = None
+        if not force:
+            memoized_report = find_memoized_report(
+                lead=lead,
+                memo_key=memo_key,
+                evidence_ids=[item.id for item in evidence],
+            )
+    return ReportInputs(lead=lead, evidence=evidence, memo_key=memo_key, memoized_report=memoized_report)
 
-    deterministic_report_payload = build_report_payload(lead=lead, evidence=evidence)
-    report_payload = enhance_report_with_llm(
-        lead=lead,
-        evidence=evidence,
-        deterministic_report=deterministic_report_payload,
-    )
-    report_summary = str(report_payload.get("summary") or "").strip()
-    report_obj, report_created = upsert_report(
-        lead=lead,
-        report_payload=report_payload,
-        evidence_ids=evidence_ids,
-        model=model,
-        prompt_version=prompt_version,
-        summary=report_summary,
-        force=force,
-    )
+
+def persist_report_and_score(
+    inputs: ReportInputs,
+    report_payload: dict[str, Any] | None,
+    *,
+    force: bool = False,
+    model: str = RULES_REPORT_MODEL,
+    prompt_version: str = RULES_REPORT_PROMPT_VERSION,
+) -> dict[str, Any]:
+    """Write the report (unless memoized) and the score; `report_payload` is ignored on a memo hit."""
+    lead = inputs.lead
+    report_obj = inputs.memoized_report
+    report_created = False
+    if report_obj is None:
+        report_summary = str(report_payload.get("summary") or "").strip()
+        report_obj, report_created = upsert_report(
+            lead=lead,
+            report_payload=report_payload,
+            evidence_ids=inputs.evidence_ids,
+            model=model,
+            prompt_version=prompt_version,
+            summary=report_summary,
+            force=force,
+            memo_key=inputs.memo_key if report_is_memoizable(report_payload) else "",
+        )
 
     score_obj, score_created = upsert_lead_score(
         lead=lead,
@@ -307,11 +463,132 @@ def run_report_and_score_for_lead(
         "score_id": score_obj.id,
         "report_created": report_created,
         "report_reused": not report_created,
+        "report_memoized": inputs.memoized_report is not None,
         "score_created": score_created,
         "score_reused": not score_created,
     }
 
 
+def run_report_and_score_for_lead(
+    lead: Lead,
+    *,
+    force: bool = False,
+    model: str = RULES_REPORT_MODEL,
+    prompt_version: str = RULES_REPORT_PROMPT_VERSION,
+) -> dict[str, Any]:
+    with timing_scope() as durations:
+        inputs = prepare_report_inputs(lead, force=force, model=model, prompt_version=prompt_version)
+        report_payload = None
+        if inputs.memoized_report is None:
+            with stage_timer("report_build"):
+                deterministic_report_payload = build_report_payload(lead=lead, evidence=inputs.evidence)
+            report_payload = enhance_report_with_llm(
+                lead=lead,
+                evidence=inputs.evidence,
+                deterministic_report=deterministic_report_payload,
+            )
+            report_payload = with_stage_timings(report_payload, durations_ms(durations))
+        return persist_report_and_score(
+            inputs,
+            report_payload,
+            force=force,
+            model=model,
+            prompt_version=prompt_version,
+        )
+
+
+def _build_report_in_worker(
+    lead: Lead,
+    evidence: list[WebsiteEvidence],
+) -> tuple[dict[str, Any], dict[str, float]]:
+    with timing_scope(record=False) as durations:
+        with stage_timer("report_build"):
+            report_payload = build_report_payload(lead=lead, evidence=evidence)
+    return report_payload, durations
+
+
+def _enhance_when_built(build: Future, inputs: ReportInputs) -> tuple[dict[str, Any], dict[str, float]]:
+    deterministic_report_payload, durations = build.result()
+    with timing_scope(record=False) as enhance_durations:
+        report_payload = enhance_report_with_llm(
+            lead=inputs.lead,
+            evidence=inputs.evidence,
+            deterministic_report=deterministic_report_payload,
+        )
+    return report_payload, merge_durations(durations, enhance_durations)
+
+
+def run_report_and_score_batch(
+    leads: Iterable[Lead],
+    *,
+    workers: int = 1,
+    force: bool = False,
+    model: str = RULES_REPORT_MODEL,
+    prompt_version: str = RULES_REPORT_PROMPT_VERSION,
+) -> Iterator[tuple[Lead, dict[str, Any] | None, Exception | None]]:
+    """
+    Yield `(lead, result, error)` per lead, in input order.
+
+    With `workers > 1`, `build_report_payload` runs in a process pool and the LLM
+    enhancement in a thread pool of the same size, so gateway waits overlap the
+    CPU work of other leads. Reads and all DB writes stay in this process.
+    """
+    options = {"force": force, "model": model, "prompt_version": prompt_version}
+    if workers <= 1:
+        for lead in leads:
+            try:
+                yield lead, run_report_and_score_for_lead(lead, **options), None
+            except Exception as exc:
+                yield lead, None, exc
+        return
+
+    # Workers are spawned, not forked: this process already runs threads (the enhance pool,
+    # PageSpeed refreshes) whose locks a fork could copy mid-hold. Closing the DB connections
+    # first keeps their sockets out of the children either way; the next query reconnects.
+    connections.close_all()
+    with (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_django_worker,
+        ) as processes,
+        ThreadPoolExecutor(max_workers=workers) as threads,
+    ):
+        # Each build is submitted as soon as its inputs are read, so the pools start
+        # on the first lead while the rest are still being prepared.
+        prepared: list[tuple[Lead, ReportInputs | None, Exception | None, dict[str, float]]] = []
+        payloads: dict[int, Future] = {}
+        for index, lead in enumerate(leads):
+            with timing_scope(record=False) as durations:
+                try:
+                    inputs = prepare_report_inputs(lead, **options)
+                except Exception as exc:
+                    prepared.append((lead, None, exc, durations))
+                    continue
+            prepared.append((lead, inputs, None, durations))
+            if inputs.memoized_report is None:
+                build = processes.submit(_build_report_in_worker, lead, inputs.evidence)
+                payloads[index] = threads.submit(_enhance_when_built, build, inputs)
+
+        for index, (lead, inputs, error, prepare_durations) in enumerate(prepared):
+            if inputs is None:
+                yield lead, None, error
+                continue
+            try:
+                with timing_scope() as durations:
+                    merge_durations(durations, prepare_durations)
+                    report_payload = None
+                    if index in payloads:
+                        report_payload, worker_durations = payloads[index].result()
+                        merge_durations(durations, worker_durations)
+                        report_payload = with_stage_timings(report_payload, durations_ms(durations))
+                    result = persist_report_and_score(inputs, report_payload, **options)
+            except Exception as exc:
+                yield lead, None, exc
+                continue
+            yield lead, result, None
+
+
 def run_report_score_and_outreach_for_lead(
     lead: Lead,
     *,
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import zlib
+from datetime import datetime, timezone as dt_timezone
+from typing import Any
+from urllib.parse import urlparse
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+MAX_SITEMAP_DOCUMENTS = 6
+MAX_SITEMAP_DOCUMENT_BYTES = 5_000_000
+MAX_HOST_MISMATCH_SAMPLES = 5
+GZIP_MAGIC = b"\x1f\x8b"
+URL_SET_HASH_MODULUS = 2**256
+LASTMOD_BUCKETS = (
+    ("last_30_days", 30),
+    ("last_90_days", 90),
+    ("last_365_days", 365),
+)
+# Fields that identify sitemap content for dedupe; lastmod data is excluded so
+# timestamp churn alone does not create new evidence rows.
+SUMMARY_DEDUPE_FIELDS = (
+    "root_type",
+    "url_count",
+    "url_set_hash",
+    "host_mismatch_count",
+    "documents_parsed",
+    "parse_error",
+)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _site_host(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _parse_lastmod(value: str) -> datetime | None:
+    text = (value or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_timezone.utc)
+    return parsed
+
+
+class SitemapSummary:
+    """
+    Constant-memory accumulator over every `<url>` seen across a sitemap and its
+    followed `<sitemapindex>` children.
+
+    The URL set hash is the sum of per-URL SHA-256 values mod 2**256, so it is
+    independent of order and document boundaries without keeping the URLs.
+    """
+
+    def __init__(self, *, site_url: str, now: datetime | None = None):
+        self.site_host = _site_host(site_url)
+        self.now = now or datetime.now(dt_timezone.utc)
+        self.root_type = ""
+        self.url_count = 0
+        self.host_mismatch_count = 0
+        self.host_mismatch_samples: list[str] = []
+        self.lastmod_buckets = {name: 0 for name, _days in LASTMOD_BUCKETS}
+        self.lastmod_buckets.update({"older": 0, "missing": 0, "invalid": 0})
+        self.newest_lastmod: datetime | None = None
+        self.oldest_lastmod: datetime | None = None
+        self.child_sitemaps: list[str] = []
+        self.child_sitemaps_skipped = 0
+        self.child_fetch_errors = 0
+        self.documents_parsed = 0
+        self.truncated = False
+        self.parse_error = ""
+        self._url_set_sum = 0
+
+    def add_url(self, loc: str, lastmod: str) -> None:
+        loc = (loc or "").strip()
+        if not loc:
+            return
+        self.url_count += 1
+        self._url_set_sum = (
+            self._url_set_sum + int.from_bytes(hashlib.sha256(loc.encode("utf-8")).digest(), "big")
+        ) % URL_SET_HASH_MODULUS
+        if self.site_host and _site_host(loc) != self.site_host:
+            self.host_mismatch_count += 1
+            if len(self.host_mismatch_samples) < MAX_HOST_MISMATCH_SAMPLES:
+                self.host_mismatch_samples.append(loc)
+        self._add_lastmod(lastmod)
+
+    def _add_lastmod(self, lastmod: str) -> None:
+        if not (lastmod or "").strip():
+            self.lastmod_buckets["missing"] += 1
+            return
+        parsed = _parse_lastmod(lastmod)
+        if parsed is None:
+            self.lastmod_buckets["invalid"] += 1
+            return
+        if self.newest_lastmod is None or parsed > self.newest_lastmod:
+            self.newest_lastmod = parsed
+        if self.oldest_lastmod is None or parsed < self.oldest_lastmod:
+            self.oldest_lastmod = parsed
+        age_days = (self.now - parsed).days
+        for name, days in LASTMOD_BUCKETS:
+            if age_days <= days:
+                self.lastmod_buckets[name] += 1
+                return
+        self.lastmod_buckets["older"] += 1
+
+    def add_child_sitemap(self, loc: str) -> None:
+        loc = (loc or "").strip()
+        if not loc:
+            return
+        # +1 for the document currently being parsed.
+        if self.documents_parsed + 1 + len(self.child_sitemaps) < MAX_SITEMAP_DOCUMENTS:
+            self.child_sitemaps.append(loc)
+        else:
+            self.child_sitemaps_skipped += 1
+            self.truncated = True
+
+    def pop_child_sitemap(self) -> str | None:
+        return self.child_sitemaps.pop(0) if self.child_sitemaps else None
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "root_type": self.root_type,
+            "url_count": self.url_count,
+            "url_set_hash": f"{self._url_set_sum:064x}"[:32],
+            "host_mismatch_count": self.host_mismatch_count,
+            "host_mismatch_samples": list(self.host_mismatch_samples),
+            "lastmod_distribution": dict(self.lastmod_buckets),
+            "newest_lastmod": self.newest_lastmod.isoformat() if self.newest_lastmod else None,
+            "oldest_lastmod": self.oldest_lastmod.isoformat() if self.oldest_lastmod else None,
+            "documents_parsed": self.documents_parsed,
+            "child_sitemaps_skipped": self.child_sitemaps_skipped,
+            "child_fetch_errors": self.child_fetch_errors,
+            "truncated": self.truncated,
+            "parse_error": self.parse_error,
+        }
+
+
+class SitemapDocumentParser:
+    """
+    Incremental (pull) parser for one sitemap document, fed raw response chunks.
+
+    Handles gzip-compressed sitemaps, clears parsed elements as it goes so memory
+    stays flat, and stops at `MAX_SITEMAP_DOCUMENT_BYTES` of decompressed XML.
+    """
+
+    def __init__(self, summary: SitemapSummary, *, is_root: bool):
+        self.summary = summary
+        self.is_root = is_root
+        self.bytes_parsed = 0
+        self.done = False
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._root = None
+        self._decompressor: Any = None
+        self._sniffed = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume one chunk; returns True once parsing finished or the budget is reached."""
+        if self.done or not chunk:
+            return self.done
+        if not self._sniffed:
+            self._sniffed = True
+            if chunk.startswith(GZIP_MAGIC):
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        data = chunk
+        if self._decompressor is not None:
+            try:
+                data = self._decompressor.decompress(chunk, MAX_SITEMAP_DOCUMENT_BYTES - self.bytes_parsed + 1)
+            except zlib.error as exc:
+                return self._fail(f"gzip_error: {exc}")
+        remaining = MAX_SITEMAP_DOCUMENT_BYTES - self.bytes_parsed
+        if len(data) > remaining:
+            data = data[:remaining]
+            self.summary.truncated = True
+            self.done = True
+        self.bytes_parsed += len(data)
+        try:
+            self._parser.feed(data)
+            self._drain()
+        except ParseError as exc:
+            return self._fail(f"xml_parse_error: {exc}")
+        return self.done
+
+    def close(self) -> None:
+        if not self.done:
+            try:
+                self._parser.close()
+                self._drain()
+            except ParseError as exc:
+                self._fail(f"xml_parse_error: {exc}")
+        self.done = True
+        self.summary.documents_parsed += 1
+
+    def _fail(self, error: str) -> bool:
+        if not self.summary.parse_error:
+            self.summary.parse_error = error
+        self.done = True
+        return True
+
+    def _drain(self) -> None:
+        for event, element in self._parser.read_events():
+            name = _local_name(element.tag)
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                    if self.is_root:
+                        self.summary.root_type = name
+                continue
+            if name == "url":
+                self.summary.add_url(self._child_text(element, "loc"), self._child_text(element, "lastmod"))
+            elif name == "sitemap":
+                self.summary.add_child_sitemap(self._child_text(element, "loc"))
+            else:
+                continue
+            # Drop finished entries so the partial tree never grows.
+            if self._root is not None:
+                self._root.clear()
+
+    @staticmethod
+    def _child_text(element: Any, name: str) -> str:
+        for child in element:
+            if _local_name(child.tag) == name:
+                return child.text or ""
+        return ""
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Mapping
+
+DEFAULT_WINDOW = 1024
+
+_current_durations: ContextVar[dict[str, float] | None] = ContextVar("growth_stage_durations", default=None)
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    # Nearest-rank percentile.
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StageTimings:
+    """Thread-safe rolling window of the last `window` durations per stage, for one process."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(stage, deque(maxlen=self._window)).append(seconds)
+
+    def record_many(self, durations: Mapping[str, float]) -> None:
+        for stage, seconds in durations.items():
+            self.record(stage, seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """`{stage: {"count", "p50_ms", "p95_ms", "max_ms"}}`, stages sorted by name."""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items() if values}
+        return {
+            stage: {
+                "count": len(values),
+                "p50_ms": round(_percentile(values, 50) * 1000, 1),
+                "p95_ms": round(_percentile(values, 95) * 1000, 1),
+                "max_ms": round(values[-1] * 1000, 1),
+            }
+            for stage, values in sorted(samples.items())
+        }
+
+
+stage_timings = StageTimings()
+
+
+def stage_timing_lines() -> list[str]:
+    """One `stage[name]: count=... p50_ms=...` line per stage in `stage_timings`, for command output."""
+    return [
+        f"stage[{stage}]: count={metrics['count']} p50_ms={metrics['p50_ms']} "
+        f"p95_ms={metrics['p95_ms']} max_ms={metrics['max_ms']}"
+        for stage, metrics in stage_timings.snapshot().items()
+    ]
+
+
+@contextmanager
+def timing_scope(*, record: bool = True) -> Iterator[dict[str, float]]:
+    """
+    Collect the `stage_timer` durations of one unit of work (e.g. one lead) into a dict.
+
+    On exit the durations go into `stage_timings` unless `record=False`, which
+    pool workers use to hand their durations back to the parent process instead.
+    """
+    durations: dict[str, float] = {}
+    token = _current_durations.set(durations)
+    try:
+        yield durations
+    finally:
+        _current_durations.reset(token)
+        if record:
+            stage_timings.record_many(durations)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Add the wall time of the block to `stage` in the current `timing_scope` (no-op outside one)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        durations = _current_durations.get()
+        if durations is not None:
+            durations[stage] = durations.get(stage, 0.0) + time.perf_counter() - started
+
+
+def merge_durations(target: dict[str, float], source: Mapping[str, float]) -> dict[str, float]:
+    """Add `source` durations (e.g. returned by a pool worker) into `target`."""
+    for stage, seconds in source.items():
+        target[stage] = target.get(stage, 0.0) + seconds
+    return target
+
+
+def durations_ms(durations: Mapping[str, float]) -> dict[str, float]:
+    return {stage: round(seconds * 1000, 1) for stage, seconds in sorted(durations.items())}
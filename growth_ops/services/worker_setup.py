@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import django
+from django.apps import apps
+
+
+def setup_django_worker() -> None:
+    """
+    Process-pool initializer that configures Django in a spawned worker.
+
+    Spawned workers start bare and unpickle their initializer before anything
+    else, so this module must not import models (directly or through services).
+    """
+    if not apps.ready:
+        django.setup()
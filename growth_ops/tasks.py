@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from .services.evidence_retention import compact_evidence
+
+
+@shared_task
+def compact_evidence_task(keep_latest: int | None = None):
+    return compact_evidence(keep_latest=keep_latest)
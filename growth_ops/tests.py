@@ -1,33 +1,111 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
 import os
+import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import StringIO
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
+import httpx
 from django.core.management import call_command
-from django.test import SimpleTestCase, override_settings
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db.models.functions import Lower
 from django.utils import timezone
 from rest_framework.test import APITestCase
 
+from growth_ops.management.commands.benchmark_cta_depth import synthetic_link_heavy_page
 from growth_ops.models import (
     ContentItem,
+    EvidenceChangeLog,
     InboxMessage,
     Lead,
+    LeadFeatures,
     LeadScore,
     OutboundDraft,
     OutboundSend,
+    PageSpeedCacheEntry,
     Sequence,
     WebsiteEvidence,
     WebsiteReport,
 )
+from growth_ops.services.circuit_breaker import HostCircuitBreaker, circuit_breaker
 from growth_ops.services.evidence_checker import check_proof_points
 from growth_ops.services.contact_enrichment import upsert_contacts_for_lead
 from growth_ops.services.contact_finder import extract_contact_candidates
+from growth_ops.services.evidence_fetcher import (
+    collect_evidence_batch,
+    fetch_pagespeed,
+    fetch_url,
+    plan_evidence_batch,
+)
+from growth_ops.services import evidence_ingest
+from growth_ops.services.evidence_changes import leads_changed_since
+from growth_ops.services.evidence_ingest import (
+    CONDITIONAL_FETCH_EVIDENCE_TYPES,
+    fetch_validators_for_lead,
+    persist_evidence_items,
+    resolve_leads_for_evidence,
+)
+from growth_ops.services.evidence_retention import compact_evidence
+from growth_ops.services.html_signals import (
+    build_depth_index,
+    dom_depth_until,
+    homepage_signals_from_regex_passes,
+    parse_homepage_signals,
+)
+from growth_ops.services.lead_ingest import find_existing_lead, find_lead_by_website
+from growth_ops.services.google_places import search_places
+from growth_ops.services.http_session import close_sessions, get_session, pipeline_session_scope
 from growth_ops.services.llm_gateway import LLMGatewayClient, LLMGatewayError
-from growth_ops.services.reporting import build_report_payload
+from growth_ops.services.keyword_matcher import keyword_matcher
+from growth_ops.services.lead_features import build_lead_features
+from growth_ops.services.reporting import (
+    CTA_KEYWORDS,
+    _derive_cta_signals,
+    build_report_payload,
+    enhance_report_with_llm,
+    get_latest_evidence_for_lead,
+    upsert_report,
+)
 from growth_ops.services.outreach_readiness import classify_draft_readiness
-from growth_ops.services.scoring import compute_lead_score
-from growth_ops.services.scoring_pipeline import run_outreach_for_lead, run_report_and_score_for_lead
+from growth_ops.services.pagespeed_cache import pagespeed_cache_stats
+from growth_ops.services.rate_limiter import (
+    DEFAULT_MAX_ATTEMPTS,
+    QuotaBucket,
+    QuotaExhaustedError,
+    call_with_quota,
+    get_bucket,
+    parse_retry_after,
+    reset_buckets,
+)
+from growth_ops.services.batch_scoring import compute_lead_scores, score_features_batch
+from growth_ops.services.scoring import (
+    LeadScoreFeatures,
+    compute_lead_score,
+    extract_score_features,
+    reload_scoring_config,
+    score_from_features,
+    scoring_config,
+)
+from growth_ops.services.scoring_pipeline import (
+    bulk_upsert_lead_scores,
+    prepare_report_inputs,
+    run_outreach_for_lead,
+    run_report_and_score_batch,
+    run_report_and_score_for_lead,
+    upsert_lead_score,
+)
+from growth_ops.services.sitemap_parser import SitemapSummary
+from growth_ops.services.stage_timing import StageTimings, merge_durations, stage_timer, timing_scope
+from portfolio.scripts.auditor import SiteAuditor
 
 
 @override_settings(
@@ -92,6 +170,133 @@ class GrowthOpsAPITests(APITestCase):
         self.assertEqual(response_2.data["reused_count"], 2)
         self.assertEqual(WebsiteEvidence.objects.filter(lead=lead).count(), 2)
 
+    def test_bulk_evidence_ingest_reports_per_group_results_with_flat_query_count(self):
+        leads = [
+            Lead.objects.create(company_name=f"Bulk {index}", website_url=f"https://bulk{index}.example")
+            for index in range(6)
+        ]
+        existing = WebsiteEvidence.objects.create(
+            lead=leads[0],
+            evidence_type="homepage_headers",
+            url="https://bulk0.example",
+            tool="http_head",
+            payload={"server": "nginx"},
+            fingerprint=evidence_ingest.evidence_fingerprint("homepage_headers", {"server": "nginx"}),
+        )
+
+        def group(lead: Lead) -> dict:
+            return {
+                "lead_id": lead.id,
+                "items": [
+                    {
+                        "evidence_type": "homepage_headers",
+                        "url": lead.website_url,
+                        "tool": "http_head",
+                        "payload": {"server": "nginx"},
+                    },
+                    {
+                        "evidence_type": "tech_fingerprint",
+                        "url": lead.website_url,
+                        "tool": "fingerprint",
+                        "payload": {"cms": "wordpress"},
+                    },
+                ],
+            }
+
+        payload = {
+            "groups": [
+                group(leads[0]),
+                {"website_url": "https://bulk1.example", "items": group(leads[1])["items"] * 2},
+                {"lead_id": 999999, "items": group(leads[2])["items"]},
+                {"lead_id": leads[3].id},
+            ]
+        }
+        response = self.client.post("/api/growth/evidence/bulk", data=payload, format="json", **self.headers)
+        self.assertEqual(response.status_code, 201)
+        results = response.data["results"]
+        self.assertEqual((response.data["groups_succeeded"], response.data["groups_failed"]), (2, 2))
+        self.assertEqual((results[0]["created_count"], results[0]["reused_count"]), (1, 1))
+        self.assertIn(existing.id, results[0]["evidence_ids"])
+        self.assertEqual(results[1]["lead_id"], leads[1].id)
+        self.assertEqual((results[1]["created_count"], results[1]["reused_count"]), (2, 2))
+        self.assertEqual(results[2]["error"], "lead_id_not_found")
+        self.assertEqual(results[3]["error"], "invalid_group")
+        self.assertEqual(WebsiteEvidence.objects.filter(lead=leads[1]).count(), 2)
+        leads[1].refresh_from_db()
+        self.assertEqual(leads[1].status, "evidence_collected")
+
+        query_counts = []
+        for lead_slice in (leads[2:4], leads[2:6]):
+            with CaptureQueriesContext(connection) as queries:
+                self.client.post(
+                    "/api/growth/evidence/bulk",
+                    data={"groups": [group(lead) for lead in lead_slice]},
+                    format="json",
+                    **self.headers,
+                )
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    @override_settings(GROWTH_EVIDENCE_CHANGES_COMMIT_LAG_SECONDS=0)
+    def test_evidence_change_feed_records_new_rows_and_pages_by_cursor(self):
+        lead = Lead.objects.create(company_name="Feed Co", website_url="https://feed.example")
+        other = Lead.objects.create(company_name="Quiet Co", website_url="https://quiet.example")
+
+        def item(body: str, evidence_type: str = "homepage_html_snippet") -> dict:
+            return {
+                "evidence_type": evidence_type,
+                "url": "https://feed.example",
+                "tool": "requests",
+                "payload": {"exists": True, "body": body},
+            }
+
+        persist_evidence_items(lead=lead, items=[item("v1"), item("v1", "robots_txt")])
+        persist_evidence_items(lead=lead, items=[item("v1")])  # reused: no entry
+        persist_evidence_items(lead=lead, items=[item("v2")])
+        evidence_ingest.persist_evidence_batch([{"lead_id": other.id, "items": [item("quiet")]}])
+
+        first_page = self.client.get("/api/growth/evidence/changes?limit=2", **self.headers)
+        self.assertEqual(first_page.status_code, 200)
+        body = first_page.json()
+        self.assertTrue(body["has_more"])
+        self.assertEqual([entry["evidence_type"] for entry in body["results"]], ["homepage_html_snippet", "robots_txt"])
+        self.assertTrue(all(entry["fingerprint_changed"] for entry in body["results"]))
+
+        second_page = self.client.get(
+            f"/api/growth/evidence/changes?cursor={body['next_cursor']}&evidence_type=homepage_html_snippet",
+            **self.headers,
+        ).json()
+        self.assertFalse(second_page["has_more"])
+        self.assertEqual([entry["lead_id"] for entry in second_page["results"]], [lead.id, other.id])
+        self.assertEqual(second_page["results"][0]["previous_fingerprint"], body["results"][0]["fingerprint"])
+
+        cursor_before_v2 = body["next_cursor"]
+        self.assertEqual(leads_changed_since(cursor_before_v2), ([lead.id, other.id], second_page["next_cursor"]))
+        self.assertEqual(leads_changed_since(cursor_before_v2, limit=1), ([lead.id], second_page["results"][0]["cursor"]))
+        self.assertEqual(leads_changed_since(second_page["next_cursor"]), ([], second_page["next_cursor"]))
+
+        bad_cursor = self.client.get("/api/growth/evidence/changes?cursor=abc", **self.headers)
+        self.assertEqual(bad_cursor.status_code, 400)
+
+    def test_evidence_change_feed_holds_back_entries_inside_the_commit_lag(self):
+        lead = Lead.objects.create(company_name="Lag Co", website_url="https://lag.example")
+        item = {"evidence_type": "homepage_html_snippet", "url": "https://lag.example", "tool": "requests"}
+        persist_evidence_items(lead=lead, items=[{**item, "payload": {"exists": True, "body": "v1"}}])
+        persist_evidence_items(lead=lead, items=[{**item, "payload": {"exists": True, "body": "v2"}}])
+        older, newer = EvidenceChangeLog.objects.order_by("pk")
+
+        # Both entries are too young: nothing is handed out and the cursor stays put.
+        body = self.client.get("/api/growth/evidence/changes", **self.headers).json()
+        self.assertEqual((body["results"], body["next_cursor"]), ([], 0))
+        self.assertEqual(leads_changed_since(0), ([], 0))
+
+        # An old entry behind a young one (a late commit on PostgreSQL) is held back too.
+        EvidenceChangeLog.objects.filter(pk=newer.pk).update(created_at=timezone.now() - timedelta(minutes=5))
+        self.assertEqual(leads_changed_since(0), ([], 0))
+
+        EvidenceChangeLog.objects.filter(pk=older.pk).update(created_at=timezone.now() - timedelta(minutes=5))
+        self.assertEqual(leads_changed_since(0), ([lead.id], newer.pk))
+
     def test_report_persistence(self):
         lead = Lead.objects.create(company_name="Report Co", website_url="https://report.example")
         ev1 = WebsiteEvidence.objects.create(
@@ -806,6 +1011,144 @@ class GrowthOpsAPITests(APITestCase):
         self.assertTrue(second["report_reused"])
         self.assertEqual(WebsiteReport.objects.filter(lead=lead).count(), 1)
 
+    @patch("growth_ops.services.scoring_pipeline.build_report_payload", wraps=build_report_payload)
+    @patch("growth_ops.services.reporting.LLMGatewayClient.report")
+    def test_v2_report_memo_skips_rebuild_and_llm_until_inputs_change(self, mock_report, mock_build):
+        lead = Lead.objects.create(
+            company_name="Report Memo Co",
+            website_url="https://report-memo.example",
+            status="evidence_collected",
+        )
+        WebsiteEvidence.objects.create(
+            lead=lead,
+            evidence_type="homepage_html_snippet",
+            url=lead.website_url,
+            tool="python_requests",
+            fingerprint="a" * 64,
+            payload={"exists": True, "status_code": 200, "requested_url": lead.website_url, "body": "<h1>Memo</h1>"},
+        )
+        mock_report.return_value = {
+            "executive_summary": "Memo summary output.",
+            "findings": [],
+            "prompt_name": "website_reporter",
+            "prompt_version": "2026-04-17.1",
+        }
+
+        first = run_report_and_score_for_lead(lead, force=False)
+        second = run_report_and_score_for_lead(lead, force=False)
+        self.assertTrue(first["report_created"])
+        self.assertFalse(first["report_memoized"])
+        self.assertTrue(second["report_memoized"])
+        self.assertEqual(second["report_id"], first["report_id"])
+        self.assertEqual((mock_build.call_count, mock_report.call_count), (1, 1))
+
+        forced = run_report_and_score_for_lead(lead, force=True)
+        self.assertFalse(forced["report_memoized"])
+        self.assertEqual((mock_build.call_count, mock_report.call_count), (2, 2))
+
+        lead.industry = "fitness"
+        lead.save(update_fields=["industry"])
+        changed = run_report_and_score_for_lead(lead, force=False)
+        self.assertFalse(changed["report_memoized"])
+        self.assertEqual(mock_report.call_count, 3)
+
+        mock_report.side_effect = LLMGatewayError("llm_gateway_request_failed:/v1/report")
+        WebsiteEvidence.objects.filter(lead=lead).update(fingerprint="b" * 64)
+        run_report_and_score_for_lead(lead, force=False)
+        run_report_and_score_for_lead(lead, force=False)
+        self.assertEqual(mock_report.call_count, 5)
+
+    @patch("growth_ops.services.reporting.LLMGatewayClient.report")
+    def test_run_growth_v2_workers_matches_serial_reports_and_counters(self, mock_report):
+        mock_report.return_value = {"executive_summary": "Parallel summary.", "findings": []}
+        leads = []
+        for index in range(3):
+            lead = Lead.objects.create(
+                company_name=f"Parallel Gym {index}",
+                website_url=f"https://parallel-{index}.example",
+                status="evidence_collected",
+            )
+            WebsiteEvidence.objects.create(
+                lead=lead,
+                evidence_type="homepage_html_snippet",
+                url=lead.website_url,
+                tool="python_requests",
+                fingerprint=f"{index}" * 64,
+                payload={
+                    "exists": True,
+                    "status_code": 200,
+                    "requested_url": lead.website_url,
+                    "body": f"<h1>Gym {index}</h1><a class='btn' href='/join'>Join now</a>" * (index + 1),
+                },
+            )
+            leads.append(lead)
+
+        out = StringIO()
+        call_command("run_growth_v2", "--workers", "2", stdout=out)
+        output = out.getvalue()
+        self.assertIn("reports_created: 3", output)
+        self.assertIn("scores_created: 3", output)
+        self.assertIn("failures: 0", output)
+        self.assertRegex(output, r"stage\[llm_gateway\]: count=3 p50_ms=[\d.]+ p95_ms=[\d.]+")
+        self.assertEqual(mock_report.call_count, 3)
+        for lead in leads:
+            evidence = get_latest_evidence_for_lead(lead)
+            expected = enhance_report_with_llm(
+                lead=lead,
+                evidence=evidence,
+                deterministic_report=build_report_payload(lead=lead, evidence=evidence),
+            )
+            stored = lead.website_reports.get().report
+            self.assertIn("report_build", stored["_provenance"].pop("stage_timings_ms"))
+            self.assertEqual(stored, expected)
+
+        gateway_calls = mock_report.call_count
+        Lead.objects.filter(pk__in=[lead.pk for lead in leads]).update(status="evidence_collected")
+        out = StringIO()
+        call_command("run_growth_v2", "--workers", "2", stdout=out)
+        self.assertIn("reports_memoized: 3", out.getvalue())
+        self.assertEqual(mock_report.call_count, gateway_calls)
+
+    @patch("growth_ops.services.reporting.LLMGatewayClient.report")
+    def test_report_batch_submits_each_build_before_preparing_the_next_lead(self, mock_report):
+        mock_report.return_value = {"executive_summary": "Pipelined summary.", "findings": []}
+        leads = [
+            Lead.objects.create(company_name=f"Pipelined Gym {index}", website_url=f"https://pipelined-{index}.example")
+            for index in range(3)
+        ]
+        for lead in leads:
+            WebsiteEvidence.objects.create(
+                lead=lead,
+                evidence_type="homepage_html_snippet",
+                url=lead.website_url,
+                tool="python_requests",
+                payload={"exists": True, "status_code": 200, "body": f"<h1>{lead.company_name}</h1>"},
+            )
+        events = []
+
+        def recording_prepare(lead, **options):
+            events.append(("prepare", lead.id))
+            return prepare_report_inputs(lead, **options)
+
+        class RecordingPool(ThreadPoolExecutor):
+            # Threads stand in for processes so the submit order can be observed.
+            def __init__(self, *args, mp_context=None, **kwargs):
+                super().__init__(*args, **kwargs)
+
+            def submit(self, fn, lead, *args):
+                events.append(("build", lead.id))
+                return super().submit(fn, lead, *args)
+
+        with (
+            patch("growth_ops.services.scoring_pipeline.prepare_report_inputs", side_effect=recording_prepare),
+            patch("growth_ops.services.scoring_pipeline.ProcessPoolExecutor", RecordingPool),
+        ):
+            results = list(run_report_and_score_batch(leads, workers=2))
+
+        self.assertEqual(events, [(step, lead.id) for lead in leads for step in ("prepare", "build")])
+        self.assertEqual([lead for lead, _result, _error in results], leads)
+        self.assertTrue(all(error is None and result for _lead, result, error in results))
+
     @patch("growth_ops.services.email_builder.LLMGatewayClient.check_email")
     @patch("growth_ops.services.email_builder.LLMGatewayClient.draft_email")
     def test_v3_draft_dedupe_reuses_when_llm_output_unchanged(self, mock_draft_email, mock_check_email):
@@ -1798,3 +2141,1152 @@ class LLMGatewayClientTests(SimpleTestCase):
             headers={"X-LLM-GATEWAY-KEY": "test-gateway-key"},
             timeout=5,
         )
+
+
+class EvidenceBatchCollectorTests(TestCase):
+    @override_settings(PAGESPEED_API_KEY="test-pagespeed-key")
+    def test_batch_collector_returns_persistable_items_in_input_order(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "www.googleapis.com":
+                return httpx.Response(
+                    200,
+                    json={
+                        "lighthouseResult": {
+                            "categories": {"performance": {"score": 0.42}},
+                            "audits": {"largest-contentful-paint": {"numericValue": 3100}},
+                        }
+                    },
+                )
+            if request.url.path == "/sitemap.xml":
+                return httpx.Response(404, text="missing")
+            return httpx.Response(200, text=f"body for {request.url}", headers={"ETag": '"v1"'})
+
+        batches = collect_evidence_batch(
+            ["https://one.example", "", "https://two.example/"],
+            transport=httpx.MockTransport(handler),
+        )
+
+        self.assertEqual(len(batches), 3)
+        first = {item["evidence_type"]: item for item in batches[0]}
+        self.assertEqual(
+            set(first),
+            {"homepage_html_snippet", "robots_txt", "sitemap_xml", "pagespeed_json"},
+        )
+        self.assertEqual(first["homepage_html_snippet"]["tool"], "python_requests")
+        self.assertTrue(first["homepage_html_snippet"]["payload"]["exists"])
+        self.assertEqual(first["homepage_html_snippet"]["payload"]["headers"]["ETag"], '"v1"')
+        self.assertEqual(first["robots_txt"]["url"], "https://one.example/robots.txt")
+        self.assertFalse(first["sitemap_xml"]["payload"]["exists"])
+        self.assertEqual(first["sitemap_xml"]["payload"]["status_code"], 404)
+        self.assertEqual(first["pagespeed_json"]["tool"], "pagespeed_api")
+        self.assertEqual(first["pagespeed_json"]["payload"]["performance_score"], 42)
+        self.assertEqual(first["pagespeed_json"]["payload"]["lcp_ms"], 3100)
+
+        invalid = {item["evidence_type"]: item for item in batches[1]}
+        self.assertEqual(invalid["homepage_html_snippet"]["payload"]["error"], "invalid_website_url")
+        self.assertEqual(invalid["pagespeed_json"]["payload"]["error"], "invalid_website_url")
+
+        third = {item["evidence_type"]: item for item in batches[2]}
+        self.assertEqual(third["homepage_html_snippet"]["url"], "https://two.example")
+
+    def test_batch_collector_respects_global_and_per_host_caps(self):
+        in_flight: dict[str, int] = {}
+        peaks = {"global": 0, "host": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peaks["host"] = max(peaks["host"], in_flight[host])
+            peaks["global"] = max(peaks["global"], sum(in_flight.values()))
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, text="ok")
+
+        urls = [f"https://site{index}.example" for index in range(6)]
+        batches = collect_evidence_batch(
+            urls,
+            max_concurrency=4,
+            per_host_limit=1,
+            include_pagespeed=False,
+            transport=httpx.MockTransport(handler),
+        )
+
+        self.assertEqual(len(batches), 6)
+        self.assertTrue(all(len(items) == 3 for items in batches))
+        self.assertLessEqual(peaks["global"], 4)
+        self.assertEqual(peaks["host"], 1)
+
+    @override_settings(PAGESPEED_API_KEY="test-pagespeed-key", GROWTH_PAGESPEED_QPS=1000)
+    def test_batch_collector_pagespeed_calls_skip_the_per_host_cap(self):
+        self.addCleanup(reset_buckets)
+        reset_buckets()
+        in_flight = {"pagespeed": 0}
+        peaks = {"pagespeed": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host != "www.googleapis.com":
+                return httpx.Response(200, text="ok")
+            in_flight["pagespeed"] += 1
+            peaks["pagespeed"] = max(peaks["pagespeed"], in_flight["pagespeed"])
+            await asyncio.sleep(0.01)
+            in_flight["pagespeed"] -= 1
+            return httpx.Response(200, json={"lighthouseResult": {"categories": {"performance": {"score": 0.5}}}})
+
+        collect_evidence_batch(
+            [f"https://speed{index}.example" for index in range(4)],
+            max_concurrency=8,
+            per_host_limit=1,
+            transport=httpx.MockTransport(handler),
+        )
+
+        self.assertGreater(peaks["pagespeed"], 1)
+
+    def test_batch_collector_fetches_shared_origins_once_and_fans_out(self):
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(200, text=f"body for {request.url.path}")
+
+        urls = ["https://chain.example", "https://chain.example/", "https://chain.example/galway"]
+        plan = plan_evidence_batch(urls, include_pagespeed=False)
+        batches = collect_evidence_batch(urls, include_pagespeed=False, transport=httpx.MockTransport(handler))
+
+        self.assertEqual((plan.fetches_requested, plan.fetches_planned, plan.fetches_saved), (9, 4, 5))
+        self.assertEqual(len(requested), 4)
+        self.assertEqual(batches[0], batches[1])
+        self.assertIsNot(batches[0][0]["payload"], batches[1][0]["payload"])
+        self.assertIsNot(batches[0][0]["payload"]["headers"], batches[1][0]["payload"]["headers"])
+        self.assertEqual(batches[2][0]["payload"]["body"], "body for /galway")
+        self.assertEqual(batches[2][1]["payload"], batches[0][1]["payload"])
+
+
+class PooledHTTPSessionTests(SimpleTestCase):
+    def test_fetch_url_reuses_keep_alive_connection_within_pipeline_scope(self):
+        class KeepAliveHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = b"<html><body>ok</body></html>"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                return
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        origin = f"http://127.0.0.1:{server.server_address[1]}"
+
+        with pipeline_session_scope() as stats:
+            results = [
+                fetch_url(f"{origin}/", accept="text/html"),
+                fetch_url(f"{origin}/robots.txt", accept="text/plain"),
+                fetch_url(f"{origin}/contact", accept="text/html"),
+            ]
+            snapshot = stats.snapshot()
+
+        self.assertTrue(all(result["exists"] for result in results))
+        self.assertEqual(snapshot, {"requests": 3, "new_connections": 1, "reused_connections": 2})
+
+    def test_worker_thread_sessions_close_when_the_thread_exits(self):
+        self.addCleanup(close_sessions)
+        sessions = []
+
+        def worker():
+            session = get_session()
+            session.close = Mock()
+            sessions.append((session, get_session(), get_session(retries=False)))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        session, same_thread, quota_session = sessions[0]
+        self.assertIs(session, same_thread)
+        self.assertIsNot(session, quota_session)
+        self.assertIsNot(session, get_session())
+        session.close.assert_called_once_with()
+
+        main_session = get_session()
+        close_sessions()
+        self.assertIsNot(get_session(), main_session)
+
+
+class EvidenceRevalidationTests(TestCase):
+    def test_not_modified_refetch_reuses_stored_rows(self):
+        lead = Lead.objects.create(company_name="Keepalive Gym", website_url="https://gym.example")
+        first_run = collect_evidence_batch(
+            [lead.website_url],
+            include_pagespeed=False,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200,
+                    text=f"<html>{request.url.path}</html>",
+                    headers={"ETag": f'"{request.url.path}-v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+                )
+            ),
+        )[0]
+        first_summary = persist_evidence_items(lead=lead, items=first_run)
+        self.assertEqual(first_summary["created_count"], 3)
+
+        validators = fetch_validators_for_lead(lead)
+        self.assertEqual(validators["robots_txt"]["etag"], '"/robots.txt-v1"')
+
+        sent_headers: list[tuple[str, str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent_headers.append((request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")))
+            return httpx.Response(304)
+
+        second_run = collect_evidence_batch(
+            [lead.website_url],
+            include_pagespeed=False,
+            transport=httpx.MockTransport(handler),
+            validators=[validators],
+        )[0]
+        with patch("growth_ops.services.evidence_ingest.canonicalize_evidence_payload") as canonicalize:
+            second_summary = persist_evidence_items(lead=lead, items=second_run)
+
+        canonicalize.assert_not_called()
+        self.assertIn(('"/-v1"', "Wed, 01 Jan 2025 00:00:00 GMT"), sent_headers)
+        self.assertEqual(second_summary["created_count"], 0)
+        self.assertEqual(second_summary["not_modified_count"], 3)
+        self.assertEqual(sorted(second_summary["evidence_ids"]), sorted(first_summary["evidence_ids"]))
+        self.assertEqual(WebsiteEvidence.objects.filter(lead=lead).count(), 3)
+
+    def test_not_modified_marker_without_a_stored_row_is_never_persisted(self):
+        lead = Lead.objects.create(company_name="Pruned Gym", website_url="https://pruned-gym.example")
+        etag = {"etag": '"gone-v1"'}
+        markers = collect_evidence_batch(
+            [lead.website_url],
+            include_pagespeed=False,
+            transport=httpx.MockTransport(lambda request: httpx.Response(304)),
+            validators=[{evidence_type: etag for evidence_type in CONDITIONAL_FETCH_EVIDENCE_TYPES}],
+        )[0]
+        self.assertTrue(all(item["payload"]["not_modified"] for item in markers))
+
+        summary = persist_evidence_items(lead=lead, items=markers)
+        (batch_summary,) = evidence_ingest.persist_evidence_batch([{"lead_id": lead.id, "items": markers}])
+
+        for result in (summary, batch_summary):
+            self.assertEqual((result["created_count"], result["not_modified_count"]), (0, 0))
+            self.assertEqual(result["revalidation_miss_count"], 3)
+            self.assertEqual(result["evidence_ids"], [])
+        self.assertFalse(WebsiteEvidence.objects.filter(lead=lead).exists())
+        lead.refresh_from_db()
+        self.assertEqual(lead.status, "new")
+
+
+class StreamingBodyReadTests(SimpleTestCase):
+    def test_streamed_fetch_stops_at_body_budget_and_sniffs_charset(self):
+        chunks_sent = {"count": 0}
+
+        async def oversized_body():
+            yield b'<html><head><meta charset="windows-1252"></head><body>caf\xe9 '
+            for _ in range(2_000):
+                chunks_sent["count"] += 1
+                yield b"x" * 1_024
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/":
+                return httpx.Response(
+                    200,
+                    headers={"Content-Type": "text/html", "Content-Length": str(2_000 * 1_024 + 59)},
+                    content=oversized_body(),
+                )
+            return httpx.Response(200, text="small")
+
+        items = collect_evidence_batch(
+            ["https://big.example"],
+            include_pagespeed=False,
+            transport=httpx.MockTransport(handler),
+        )[0]
+        homepage = items[0]["payload"]
+        robots = items[1]["payload"]
+
+        self.assertIn("café", homepage["body"])
+        self.assertEqual(len(homepage["body"]), 20_000)
+        self.assertTrue(homepage["truncated"])
+        self.assertEqual(homepage["content_length"], 2_000 * 1_024 + 59)
+        self.assertLess(homepage["bytes_read"], 100_000)
+        self.assertLess(chunks_sent["count"], 100)
+        self.assertEqual(robots["body"], "small")
+        self.assertNotIn("truncated", robots)
+
+
+@override_settings(PAGESPEED_API_KEY="test-pagespeed-key")
+class PageSpeedCacheTests(TestCase):
+    def _pagespeed_response(self, score: float) -> Mock:
+        response = Mock(status_code=200)
+        response.json.return_value = {
+            "loadingExperience": {"overall_category": "AVERAGE"},
+            "lighthouseResult": {
+                "categories": {
+                    "performance": {"score": score},
+                    "accessibility": {"score": 0.9},
+                    "seo": {"score": 0.8},
+                },
+                "audits": {"largest-contentful-paint": {"numericValue": 2500}},
+            },
+        }
+        return response
+
+    @patch("growth_ops.services.evidence_fetcher.get_session")
+    def test_pagespeed_results_are_cached_per_normalized_url_with_stale_refresh(self, get_session):
+        get_session.return_value.get.side_effect = [self._pagespeed_response(0.5), self._pagespeed_response(0.7)]
+        pagespeed_cache_stats.reset()
+
+        first = fetch_pagespeed("https://cached.example/#top")
+        second = fetch_pagespeed("https://cached.example")
+        self.assertEqual(first, second)
+        self.assertEqual(first["performance_score"], 50)
+        self.assertEqual(get_session.return_value.get.call_count, 1)
+        self.assertEqual(pagespeed_cache_stats.snapshot()["hits"], 1)
+        self.assertEqual(pagespeed_cache_stats.snapshot()["misses"], 1)
+
+        with patch.dict(os.environ, {"GOOGLE_PAGESPEED_KEY": "legacy-key"}):
+            legacy = SiteAuditor("https://cached.example").run_lighthouse()
+        self.assertEqual(
+            legacy,
+            {"performance_score": 50, "accessibility_score": 90, "seo_score": 80, "core_web_vitals": "AVERAGE"},
+        )
+
+        PageSpeedCacheEntry.objects.update(fetched_at=timezone.now() - timedelta(days=2))
+        with patch("growth_ops.services.pagespeed_cache.schedule_refresh") as schedule_refresh:
+            stale = fetch_pagespeed("https://cached.example")
+        self.assertEqual(stale["performance_score"], 50)
+        schedule_refresh.assert_called_once()
+        schedule_refresh.call_args.args[2]()
+        self.assertEqual(fetch_pagespeed("https://cached.example")["performance_score"], 70)
+
+        get_session.return_value.get.side_effect = [self._pagespeed_response(0.9)]
+        forced = fetch_pagespeed("https://cached.example", force_refresh=True)
+        self.assertEqual(forced["performance_score"], 90)
+        self.assertEqual(PageSpeedCacheEntry.objects.count(), 1)
+
+
+class QuotaRateLimiterTests(SimpleTestCase):
+    def test_bucket_spaces_reservations_and_enforces_process_budget(self):
+        now = {"value": 100.0}
+        bucket = QuotaBucket(per_second=2, process_budget=3, clock=lambda: now["value"])
+
+        self.assertEqual([bucket.reserve(), bucket.reserve(), bucket.reserve()], [0.0, 0.5, 1.0])
+        with self.assertRaises(QuotaExhaustedError):
+            bucket.reserve()
+        self.assertEqual(bucket.snapshot()["max_wait_seconds"], 1.0)
+
+    @patch("growth_ops.services.rate_limiter.time.sleep")
+    def test_call_with_quota_retries_retryable_statuses_and_honours_retry_after(self, sleep):
+        bucket = QuotaBucket(per_second=1000)
+        responses = [
+            Mock(status_code=429, headers={"Retry-After": "7"}),
+            Mock(status_code=503, headers={}),
+            Mock(status_code=200, headers={}),
+        ]
+
+        result = call_with_quota(bucket, lambda: responses.pop(0))
+
+        self.assertEqual(result.status_code, 200)
+        waits = [call.args[0] for call in sleep.call_args_list]
+        self.assertTrue(any(6.9 <= wait <= 7.0 for wait in waits))
+        self.assertTrue(any(1.0 <= wait <= 2.0 for wait in waits))
+        metrics = bucket.snapshot()
+        self.assertEqual((metrics["requests"], metrics["retries"], metrics["throttled"]), (3, 2, 1))
+        self.assertEqual(parse_retry_after("Wed, 01 Jan 2025 00:01:00 GMT", now=1735689600.0), 60.0)
+
+    @override_settings(GOOGLE_PLACES_KEY="places-quota-key")
+    @patch("growth_ops.services.rate_limiter.time.sleep")
+    @patch("growth_ops.services.google_places.requests.get")
+    def test_places_over_query_limit_is_deferred_like_a_429(self, get, sleep):
+        self.addCleanup(reset_buckets)
+        reset_buckets()
+        over_limit = Mock(status_code=200, headers={})
+        over_limit.json.return_value = {"status": "OVER_QUERY_LIMIT", "error_message": "slow down"}
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"status": "OK", "results": [{"place_id": "p1"}]}
+        get.side_effect = [over_limit, ok]
+
+        self.assertEqual(search_places(keyword="gym", location="Galway", limit=5), [{"place_id": "p1"}])
+
+        self.assertEqual(get.call_count, 2)
+        metrics = get_bucket("google_places", "places-quota-key").snapshot()
+        self.assertEqual((metrics["retries"], metrics["throttled"]), (1, 1))
+        self.assertGreater(metrics["total_wait_seconds"], 0)
+
+    @patch("growth_ops.services.rate_limiter.time.sleep")
+    def test_pagespeed_quota_attempts_are_the_only_http_retries(self, sleep):
+        attempts = []
+
+        class UnavailableHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                attempts.append(self.path)
+                body = b'{"error": {"code": 503}}'
+                self.send_response(503)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                return
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), UnavailableHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(reset_buckets)
+        reset_buckets()
+
+        with patch(
+            "growth_ops.services.evidence_fetcher.PAGESPEED_API_URL",
+            f"http://127.0.0.1:{server.server_address[1]}/pagespeedonline",
+        ), pipeline_session_scope():
+            result = fetch_pagespeed("https://quota.example", force_refresh=True, api_key="quota-test-key")
+
+        self.assertEqual(result["error"], "pagespeed_http_error")
+        self.assertEqual(len(attempts), DEFAULT_MAX_ATTEMPTS)
+        self.assertEqual(get_bucket("pagespeed", "quota-test-key").snapshot()["requests"], DEFAULT_MAX_ATTEMPTS)
+
+
+class SitemapParserTests(TestCase):
+    def test_sitemap_index_children_are_stream_parsed_into_a_summary(self):
+        namespace = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        recent = (timezone.now() - timedelta(days=3)).date().isoformat()
+        documents = {
+            "/sitemap.xml": (
+                f"<?xml version='1.0'?><sitemapindex {namespace}>"
+                "<sitemap><loc>https://shop.example/pages.xml</loc></sitemap>"
+                "<sitemap><loc>https://shop.example/posts.xml.gz</loc></sitemap>"
+                "</sitemapindex>"
+            ).encode(),
+            "/pages.xml": (
+                f"<urlset {namespace}>"
+                f"<url><loc>https://shop.example/</loc><lastmod>{recent}</lastmod></url>"
+                "<url><loc>https://www.shop.example/about</loc><lastmod>2019-01-01</lastmod></url>"
+                "</urlset>"
+            ).encode(),
+            "/posts.xml.gz": gzip.compress(
+                f"<urlset {namespace}><url><loc>https://cdn.other.example/post</loc></url></urlset>".encode()
+            ),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = documents.get(request.url.path)
+            return httpx.Response(200, content=body) if body is not None else httpx.Response(404)
+
+        items = collect_evidence_batch(
+            ["https://shop.example"],
+            include_pagespeed=False,
+            transport=httpx.MockTransport(handler),
+        )[0]
+        payload = items[2]["payload"]
+        summary = payload["summary"]
+
+        self.assertTrue(payload["exists"])
+        self.assertEqual(payload["body"], "")
+        self.assertEqual(summary["root_type"], "sitemapindex")
+        self.assertEqual(summary["documents_parsed"], 3)
+        self.assertEqual(summary["url_count"], 3)
+        self.assertEqual(summary["host_mismatch_count"], 1)
+        self.assertEqual(summary["host_mismatch_samples"], ["https://cdn.other.example/post"])
+        self.assertEqual(summary["lastmod_distribution"]["last_30_days"], 1)
+        self.assertEqual(summary["lastmod_distribution"]["older"], 1)
+        self.assertEqual(summary["lastmod_distribution"]["missing"], 1)
+        self.assertEqual(summary["parse_error"], "")
+
+        reordered = SitemapSummary(site_url="https://shop.example")
+        for loc in ("https://cdn.other.example/post", "https://www.shop.example/about", "https://shop.example/"):
+            reordered.add_url(loc, "")
+        self.assertEqual(reordered.to_payload()["url_set_hash"], summary["url_set_hash"])
+
+        lead = Lead.objects.create(company_name="Shop", website_url="https://shop.example")
+        persist_evidence_items(lead=lead, items=[items[2]])
+        churned = {**payload, "summary": {**summary, "newest_lastmod": "2030-01-01T00:00:00+00:00"}}
+        repeat = persist_evidence_items(lead=lead, items=[{**items[2], "payload": churned}])
+        self.assertEqual(repeat["reused_count"], 1)
+
+    def test_batch_sitemap_summary_is_scoped_to_the_site_origin(self):
+        site_urls = []
+
+        def recording_summary(*, site_url, **kwargs):
+            site_urls.append(site_url)
+            return SitemapSummary(site_url=site_url, **kwargs)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"<urlset><url><loc>https://shop.example/</loc></url></urlset>")
+
+        with patch("growth_ops.services.evidence_fetcher.SitemapSummary", side_effect=recording_summary):
+            collect_evidence_batch(
+                ["https://shop.example/products/widget"],
+                include_pagespeed=False,
+                transport=httpx.MockTransport(handler),
+            )
+
+        self.assertEqual(site_urls, ["https://shop.example"])
+
+
+class HostCircuitBreakerTests(TestCase):
+    def setUp(self):
+        circuit_breaker.reset()
+
+    def tearDown(self):
+        circuit_breaker.reset()
+
+    @override_settings(GROWTH_CIRCUIT_FAILURE_THRESHOLD=3)
+    def test_dead_host_fails_fast_after_threshold_without_stalling_batch(self):
+        dead_requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "dead.example":
+                dead_requests.append(str(request.url))
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, text="<html>ok</html>")
+
+        batches = collect_evidence_batch(
+            ["https://dead.example/a", "https://dead.example/b", "https://dead.example/c", "https://alive.example"],
+            include_pagespeed=False,
+            per_host_limit=1,
+            transport=httpx.MockTransport(handler),
+        )
+
+        dead_payloads = [item["payload"] for items in batches[:3] for item in items]
+        errors = [payload["error"] for payload in dead_payloads]
+        self.assertEqual(len(dead_requests), 3)
+        self.assertEqual(errors.count("circuit_open"), 2)
+        self.assertTrue(
+            all(payload["circuit_host"] == "dead.example" for payload in dead_payloads if payload["error"] == "circuit_open")
+        )
+        self.assertTrue(all(item["payload"]["exists"] for item in batches[3]))
+
+        state = circuit_breaker.snapshot()
+        self.assertEqual(state["dead.example"]["state"], "open")
+        self.assertEqual(state["dead.example"]["rejected"], 2)
+        self.assertNotIn("alive.example", state)
+
+    def test_half_open_trial_closes_or_reopens_circuit(self):
+        now = [0.0]
+        breaker = HostCircuitBreaker(failure_threshold=2, reset_seconds=30, clock=lambda: now[0])
+        url = "https://flaky.example/page"
+        breaker.record_exception(url, httpx.ConnectTimeout("timed out"))
+        breaker.record_exception(url, httpx.ReadTimeout("timed out"))
+        self.assertFalse(breaker.allow(url))
+
+        now[0] = 31.0
+        self.assertTrue(breaker.allow(url))
+        self.assertFalse(breaker.allow(url))
+        breaker.record_failure(url)
+        self.assertEqual(breaker.snapshot()["flaky.example"]["state"], "open")
+
+        now[0] = 62.0
+        self.assertTrue(breaker.allow(url))
+        breaker.record_success(url)
+        self.assertTrue(breaker.allow("https://FLAKY.example/other"))
+        self.assertEqual(breaker.snapshot()["flaky.example"]["state"], "closed")
+
+    @override_settings(GROWTH_CIRCUIT_FAILURE_THRESHOLD=1)
+    def test_site_auditor_skips_links_on_an_open_circuit_instead_of_reporting_them_broken(self):
+        circuit_breaker.record_exception("https://down.example/", httpx.ConnectError("connection refused"))
+        homepage = Mock(content=b'<html><a href="/about">About</a><a href="/contact">Contact</a></html>')
+
+        with patch("portfolio.scripts.auditor.requests.get", return_value=homepage), patch(
+            "portfolio.scripts.auditor.requests.head"
+        ) as head:
+            health = SiteAuditor("https://down.example").check_page_health()
+
+        head.assert_not_called()
+        self.assertEqual(health["broken_links_found"], 0)
+        self.assertEqual(health["broken_link_examples"], [])
+        self.assertEqual(health["links_skipped_circuit_open"], 2)
+
+
+class EvidenceFingerprintTests(TestCase):
+    def test_backfilled_fingerprint_turns_dedupe_into_single_indexed_lookup(self):
+        lead = Lead.objects.create(company_name="Fingerprint Cafe", website_url="https://cafe.example")
+        for index in range(30):
+            WebsiteEvidence.objects.create(
+                lead=lead,
+                evidence_type="homepage_html_snippet",
+                url="https://cafe.example",
+                tool="python_requests",
+                payload={"exists": True, "status_code": 200, "body": f"<html>version {index}</html>"},
+            )
+        legacy = WebsiteEvidence.objects.filter(lead=lead).order_by("id").first()
+
+        out = StringIO()
+        call_command("backfill_evidence_fingerprints", "--batch-size", "7", stdout=out)
+        self.assertIn("rows_updated: 30", out.getvalue())
+        self.assertFalse(WebsiteEvidence.objects.filter(fingerprint="").exists())
+
+        item = {
+            "evidence_type": "homepage_html_snippet",
+            "url": "https://cafe.example",
+            "tool": "python_requests",
+            "payload": {"exists": True, "status_code": 200, "body": "  <html>version \n 0</html>\n"},
+        }
+        with patch.object(
+            evidence_ingest,
+            "canonicalize_evidence_payload",
+            wraps=evidence_ingest.canonicalize_evidence_payload,
+        ) as canonicalize:
+            summary = persist_evidence_items(lead=lead, items=[item])
+
+        self.assertEqual(canonicalize.call_count, 1)
+        self.assertEqual(summary["evidence_ids"], [legacy.id])
+
+        created = persist_evidence_items(lead=lead, items=[{**item, "payload": {"exists": True, "body": "new"}}])
+        record = WebsiteEvidence.objects.get(pk=created["evidence_ids"][0])
+        self.assertEqual(created["created_count"], 1)
+        self.assertEqual(len(record.fingerprint), 64)
+
+
+class HomepageCanonicalizerTests(TestCase):
+    def test_single_pass_matches_sequential_passes_and_benchmark_gate_runs(self):
+        corpus = [
+            "<html>\n<head><SCRIPT type='text/javascript'>var a = '<b>';</SCRIPT>\n<title>Gym</title></head>",
+            "<body><!-- hero --><noscript><img src='p.gif'></noscript>  <p>Open\t7 days</p>\xa0</body>",
+            "<scripts>kept</scripts><script>unterminated",
+            "<!--[if lt IE 9]><script src='html5.js'></script><![endif]--><p>legacy</p>",
+            "<!-- a <script>b --> c</script> d",
+            "<noscript><script>'</noscript>'</script></noscript>tail",
+            "<\u017fcript>folded</script><p>x</p>",
+            "",
+        ]
+        for html in corpus:
+            with self.subTest(html=html):
+                self.assertEqual(
+                    evidence_ingest._normalize_homepage_html_for_dedupe(html),
+                    evidence_ingest._normalize_homepage_html_sequential(html),
+                )
+        self.assertIsNotNone(evidence_ingest._strip_homepage_html_single_pass(corpus[1]))
+        self.assertIsNone(evidence_ingest._strip_homepage_html_single_pass(corpus[4]))
+
+        lead = Lead.objects.create(company_name="Bench Co", website_url="https://bench.example")
+        for index, html in enumerate(corpus[:4]):
+            WebsiteEvidence.objects.create(
+                lead=lead,
+                evidence_type="homepage_html_snippet",
+                url=f"https://bench.example/{index}",
+                tool="python_requests",
+                payload={"body": html},
+            )
+        out = StringIO()
+        call_command("benchmark_homepage_canonicalizer", "--repeat", "1", stdout=out)
+        self.assertIn("documents: 4", out.getvalue())
+        self.assertIn("speedup:", out.getvalue())
+
+
+class EvidenceCompactionTests(TestCase):
+    def test_compaction_keeps_latest_and_referenced_rows_and_reports_bytes(self):
+        lead = Lead.objects.create(company_name="Retention Bakery", website_url="https://bakery.example")
+        rows = []
+        for index in range(5):
+            rows.append(
+                WebsiteEvidence.objects.create(
+                    lead=lead,
+                    evidence_type="homepage_html_snippet",
+                    url="https://bakery.example",
+                    tool="python_requests",
+                    payload={"exists": True, "status_code": 200, "body": f"<p>{index}</p>" + "x" * 2000},
+                )
+            )
+            WebsiteEvidence.objects.filter(pk=rows[-1].pk).update(
+                created_at=timezone.now() - timedelta(days=10 - index)
+            )
+        WebsiteReport.objects.create(
+            lead=lead, model="m", prompt_version="v1", evidence_ids=[str(rows[0].id), "not-an-id"], report={}
+        )
+
+        out = StringIO()
+        call_command("compact_evidence", "--keep-latest", "2", "--dry-run", stdout=out)
+        self.assertIn("rows_compacted: 2", out.getvalue())
+        self.assertFalse(WebsiteEvidence.objects.filter(compacted_at__isnull=False).exists())
+
+        totals = compact_evidence(keep_latest=2)
+        self.assertEqual(totals["rows_compacted"], 2)
+        self.assertGreater(totals["bytes_reclaimed"], 3500)
+        compacted = {record.id: record for record in WebsiteEvidence.objects.filter(compacted_at__isnull=False)}
+        self.assertEqual(set(compacted), {rows[1].id, rows[2].id})
+        stub = compacted[rows[1].id].payload
+        self.assertEqual(stub["fingerprint"], compacted[rows[1].id].fingerprint)
+        self.assertEqual((stub["compacted"], stub["exists"], stub["status_code"]), (True, True, 200))
+        self.assertNotIn("body", stub)
+
+        repeat = persist_evidence_items(
+            lead=lead,
+            items=[
+                {
+                    "evidence_type": "homepage_html_snippet",
+                    "url": "https://bakery.example",
+                    "tool": "python_requests",
+                    "payload": {"exists": True, "status_code": 200, "body": "<p>1</p>" + "x" * 2000},
+                }
+            ],
+        )
+        self.assertEqual(repeat["created_count"], 1)
+        self.assertEqual(compact_evidence(keep_latest=2)["rows_compacted"], 1)
+
+    def test_compaction_does_not_change_lead_scores(self):
+        lead = Lead.objects.create(company_name="Retention Gym", website_url="https://retention-gym.example")
+        fingerprints = [["react"], {"cms": "WordPress"}, {"platform": "custom"}, {"cms": "custom"}, {"cms": "custom"}]
+        for payload in fingerprints:
+            WebsiteEvidence.objects.create(lead=lead, evidence_type="tech_fingerprint", tool="wappalyzer", payload=payload)
+        WebsiteEvidence.objects.create(
+            lead=lead,
+            evidence_type="pagespeed_json",
+            tool="pagespeed",
+            payload={
+                "lighthouseResult": {
+                    "categories": {"performance": {"score": 0.31}},
+                    "audits": {"largest-contentful-paint": {"numericValue": 5200}, "other": {"x": 1}},
+                },
+                "loadingExperience": {"metrics": {"big": "x" * 2000}},
+            },
+        )
+        for index in range(2):
+            WebsiteEvidence.objects.create(
+                lead=lead, evidence_type="pagespeed_json", tool="pagespeed", payload={"strategy": "mobile", "run": index}
+            )
+
+        before = compute_lead_score(lead=lead)
+        self.assertIn("TEMPLATE_CMS_LIMITATION_SIGNAL", before.reason_codes)
+        self.assertIn("LOW_MOBILE_PERFORMANCE", before.reason_codes)
+
+        self.assertEqual(compact_evidence(keep_latest=1)["rows_compacted"], 6)
+        self.assertEqual(compute_lead_score(lead=lead), before)
+        build_lead_features(lead)
+        self.assertEqual(compute_lead_score(lead=lead), before)
+
+
+class LeadDomainKeyTests(TestCase):
+    def test_domain_key_folds_scheme_www_and_slash_and_lookups_use_indexes(self):
+        lead = Lead.objects.create(company_name="Harbour Cafe", location="Galway", website_url="https://www.Harbour.example/")
+        other = Lead.objects.create(company_name="Harbour Cafe", location="Cork", website_url="https://harbour.example/cork")
+        self.assertEqual(lead.domain_key, "harbour.example")
+
+        self.assertEqual(find_existing_lead({"website_url": "https://www.harbour.example/cork/"}), other)
+        self.assertEqual(find_existing_lead({"website_url": "http://harbour.example"}), lead)
+        self.assertIsNone(find_existing_lead({"website_url": "https://harbour.example/menu"}))
+        self.assertEqual(find_existing_lead({"company_name": "harbour CAFE", "location": "galway"}), lead)
+
+        lead.website_url = "https://harbour-cafe.example"
+        lead.save(update_fields=["website_url"])
+        lead.refresh_from_db()
+        self.assertEqual((lead.domain_key, lead.website_match_key), ("harbour-cafe.example", "harbour-cafe.example"))
+
+        plan = Lead.objects.filter(domain_key="harbour.example").explain()
+        self.assertIn("domain_key", plan)
+        website_plan = Lead.objects.filter(website_match_key="harbour.example/cork").explain()
+        self.assertIn("website_match_key", website_plan)
+        name_plan = (
+            Lead.objects.annotate(company_name_lower=Lower("company_name"))
+            .filter(company_name_lower="harbour cafe")
+            .explain()
+        )
+        self.assertIn("growth_lead_name_loc_lower_idx", name_plan)
+
+    def test_leads_on_a_shared_host_only_match_their_own_page(self):
+        gym = Lead.objects.create(
+            company_name="Gym A",
+            website_url="https://www.facebook.com/gymA",
+            google_place_id="pa",
+        )
+        cafe_data = {"company_name": "Cafe B", "website_url": "https://www.facebook.com/cafeB", "google_place_id": "pb"}
+
+        self.assertEqual(gym.website_match_key, "facebook.com/gyma")
+        with self.assertNumQueries(1):
+            self.assertIsNone(find_lead_by_website(cafe_data["website_url"]))
+        self.assertIsNone(find_existing_lead(cafe_data))
+        self.assertEqual(find_existing_lead({"website_url": "http://facebook.com/gymA/"}), gym)
+
+        cafe, gym_again = resolve_leads_for_evidence(
+            [
+                {"website_url": "https://www.facebook.com/cafeB", "company_name": "Cafe B", "items": []},
+                {"website_url": "https://facebook.com/gymA", "items": []},
+            ]
+        )
+        self.assertNotEqual(cafe.pk, gym.pk)
+        self.assertEqual(cafe.company_name, "Cafe B")
+        self.assertEqual(gym_again, gym)
+        gym.refresh_from_db()
+        self.assertEqual((gym.company_name, gym.google_place_id), ("Gym A", "pa"))
+
+
+class HomepageSignalsTests(SimpleTestCase):
+    CORPUS = [
+        "",
+        "<html><head><TITLE>  Harbour   Cafe </TITLE><meta content='Brunch in Galway' name='description'>"
+        "<link href='https://www.harbour.example/' rel='canonical'></head><body><h1>Hello <b>there</b></h1>"
+        "<H1></H1><section><h2>Menu</h2></section><form action='/book'></form>"
+        "<a href='tel:+35391123456' class='btn'>Call</a><button>Book now</button><br/><br /></body></html>",
+        "<!-- <title>Old</title> <h1>Draft</h1> --><script>if (a<b) { x = '<a href=\"/js\">js</a>'; }</script>"
+        "<style>.x{}</style><noscript><a href='/ns'>ns</a></noscript><p>Visible <a href=\"/contact\">Contact us</a></p>",
+        "<div title=\"<script>x</script>\">attr</div><!-- <script>y</script> -->tail <> a<b <scriptx>not</scriptx>",
+        "<meta name='description' content='a>b'><a href='/a'><a href='/b'>nested</a></a><h1 class=x>Unclosed",
+        "<p>Şİstanbul K <a href='/k'>link</a></p><title>Kelvin</title>",
+    ]
+
+    def test_single_pass_matches_regex_passes_on_fixture_corpus(self):
+        for html in self.CORPUS:
+            with self.subTest(html=html[:40]):
+                fast = parse_homepage_signals(html)
+                reference = homepage_signals_from_regex_passes(html)
+                for name in ("visible_text", "markup_text", "title", "meta_description", "canonical_href",
+                             "h1_texts", "action_blocks", "anchors", "depth_index"):
+                    self.assertEqual(getattr(fast, name), getattr(reference, name), name)
+                self.assertEqual(dict(fast.tag_counts), dict(reference.tag_counts))
+                for offset in range(0, len(html) + 1, 7):
+                    self.assertEqual(fast.visible_text_before(offset), reference.visible_text_before(offset))
+
+        signals = parse_homepage_signals(self.CORPUS[1])
+        self.assertTrue(signals.single_pass)
+        self.assertEqual(signals.title, "Harbour Cafe")
+        self.assertEqual(signals.meta_description, "Brunch in Galway")
+        self.assertEqual(signals.h1_texts, ("Hello there",))
+        self.assertEqual(dict(signals.tag_counts), {"headings": 3, "sections": 1, "forms": 1})
+        self.assertIsNone(parse_homepage_signals(self.CORPUS[3]).text_runs)
+        self.assertFalse(parse_homepage_signals(self.CORPUS[5]).single_pass)
+
+    def test_depth_index_matches_per_cta_retokenization(self):
+        for html in self.CORPUS:
+            index = build_depth_index(html)
+            for position in range(len(html) + 1):
+                self.assertEqual(index.depth_at(position), dom_depth_until(html, position))
+
+        page = synthetic_link_heavy_page(chars=20000, anchors=300)
+        self.assertEqual(len(page), 20000)
+        index = build_depth_index(page)
+        positions = [start for start, _attrs, _body in parse_homepage_signals(page).action_blocks]
+        reference_depths = [dom_depth_until(page, position) for position in positions]
+        self.assertEqual(len(positions), 300)
+        self.assertEqual([index.depth_at(position) for position in positions], reference_depths)
+
+        cta = _derive_cta_signals({"exists": True, "body": page})
+        self.assertEqual(cta["action_elements_count"], 300)
+        self.assertEqual(cta["visual_cta_density"], round(300 / max(sum(reference_depths) / 300, 1.0), 3))
+
+    def test_contact_extraction_reuses_the_cached_parse(self):
+        html = self.CORPUS[2]
+        parse_homepage_signals.cache_clear()
+        build_report_payload(
+            lead=Lead(company_name="Harbour", website_url="https://harbour.example"),
+            evidence=[
+                WebsiteEvidence(
+                    id=1,
+                    evidence_type="homepage_html_snippet",
+                    payload={"exists": True, "body": html},
+                    created_at=timezone.now(),
+                )
+            ],
+        )
+        result = extract_contact_candidates(homepage_html=html, website_url="https://harbour.example")
+        self.assertEqual(parse_homepage_signals.cache_info().hits, 1)
+        self.assertEqual(result["contact_links"], ["https://harbour.example/contact"])
+
+    def test_keyword_matcher_matches_per_keyword_regex_scans(self):
+        keywords = ["book", "book now", "now", "get started", "start", "e-mail", "mail"]
+        text = "book now! get started, start now. e-mail or mail: booking book-now start_up"
+        matcher = keyword_matcher(keywords)
+        expected = {}
+        for keyword in keywords:
+            matches = list(re.finditer(rf"\b{re.escape(keyword)}\b", text))
+            if matches:
+                expected[keyword] = (len(matches), matches[0].start())
+        self.assertEqual(matcher.hits(text), expected)
+        self.assertGreater(len(matcher.scan_patterns), 1)
+        self.assertIs(keyword_matcher(reversed(keywords)), matcher)
+        self.assertEqual(len(keyword_matcher(CTA_KEYWORDS).scan_patterns), 1)
+
+        with override_settings(GROWTH_CTA_KEYWORDS=["Reserve"]):
+            cta = _derive_cta_signals({"exists": True, "body": "<p>Reserve a table</p><a href='/r'>Reserve</a>"})
+        self.assertEqual(cta["keyword_hits"], 2)
+        self.assertEqual(cta["action_elements_count"], 1)
+
+
+class StageTimingTests(SimpleTestCase):
+    def test_scopes_collect_stage_durations_and_report_rolling_percentiles(self):
+        timings = StageTimings(window=100)
+        for milliseconds in range(1, 201):
+            timings.record("report_build", milliseconds / 1000)
+        self.assertEqual(
+            timings.snapshot()["report_build"],
+            {"count": 100, "p50_ms": 150.0, "p95_ms": 195.0, "max_ms": 200.0},
+        )
+
+        with stage_timer("outside_scope"):
+            pass
+        with timing_scope(record=False) as outer:
+            with stage_timer("llm_gateway"):
+                pass
+            with stage_timer("llm_gateway"):
+                pass
+            with timing_scope(record=False) as inner:
+                with stage_timer("report_build"):
+                    pass
+        self.assertEqual(list(outer), ["llm_gateway"])
+        self.assertEqual(list(inner), ["report_build"])
+        self.assertEqual(set(merge_durations(outer, inner)), {"llm_gateway", "report_build"})
+
+
+class BatchScoringTests(TestCase):
+    @staticmethod
+    def _random_features(rng: random.Random) -> LeadScoreFeatures:
+        return LeadScoreFeatures(
+            has_website=rng.random() < 0.7,
+            has_contact_email=rng.random() < 0.5,
+            industry=rng.choice(["", "legal services", "gym", "saas", "real estate agent"]),
+            site_type=rng.choice(["local", "chain", "institutional", "unknown"]),
+            perf_score=rng.choice([None, 0.0, 69.9, 70, 89.99, 90, 100, float("nan"), rng.uniform(0, 100)]),
+            lcp_ms=rng.choice([None, 1499, 1500, 3000, 3000.5, float("nan"), rng.uniform(0, 6000)]),
+            cms_value=rng.choice(["", "wordpress 6.4", "custom", "wix"]),
+            has_sitemap_evidence=rng.random() < 0.5,
+            sitemap_marked_missing=rng.random() < 0.3,
+            cta_clarity=rng.choice(["", "clear", "moderate", "weak", "missing", "unclear", "poor"]),
+            has_contact_method=rng.choice([None, True, False]),
+            has_https=rng.choice([None, True, False]),
+            trust_rating=rng.choice(["weak", "moderate", "strong"]),
+        )
+
+    def test_vectorized_scores_match_scalar_scores_on_randomized_features(self):
+        rng = random.Random(22)
+        for overrides in ({}, {"LEAD_SCORE_LIGHTHOUSE_THRESHOLD": 95, "LEAD_SCORE_LCP_THRESHOLD_MS": 1000}):
+            with self.subTest(**overrides), override_settings(**overrides):
+                features = [self._random_features(rng) for _ in range(2000)]
+                self.assertEqual(score_features_batch(features), [score_from_features(item) for item in features])
+
+    def test_scoring_config_is_built_once_versioned_and_reloaded(self):
+        config = reload_scoring_config()
+        features = self._random_features(random.Random(25))
+        with patch.dict(os.environ, {"LEAD_SCORE_LIGHTHOUSE_THRESHOLD": "95"}):
+            # Environment changes are only picked up on an explicit reload.
+            self.assertIs(scoring_config(), config)
+            self.assertEqual(reload_scoring_config().performance_threshold, 95)
+            self.assertNotEqual(scoring_config().version, config.version)
+        self.assertEqual(reload_scoring_config(), config)
+
+        with override_settings(LEAD_SCORE_LCP_THRESHOLD_MS=1000):
+            overridden = scoring_config()
+            self.assertEqual(overridden.lcp_threshold_ms, 1000)
+            self.assertEqual(score_from_features(features).recommendation["scoring_config_version"], overridden.version)
+            self.assertEqual(
+                score_features_batch([features])[0].recommendation["scoring_config_version"],
+                overridden.version,
+            )
+        self.assertEqual(scoring_config(), config)
+        self.assertEqual(score_from_features(features).recommendation["scoring_config_version"], config.version)
+
+    def test_compute_lead_scores_matches_compute_lead_score_with_constant_queries(self):
+        pairs = []
+        for index, (website_url, cms) in enumerate(
+            [("https://batch-a.example", "wordpress"), ("http://batch-b.example", ""), ("", "wix")]
+        ):
+            lead = Lead.objects.create(company_name=f"Batch {index}", website_url=website_url, industry="legal")
+            WebsiteEvidence.objects.create(
+                lead=lead,
+                evidence_type="pagespeed_json",
+                payload={"performance_score": 0.4 + index * 0.25, "lcp_ms": 1200 + index * 1500},
+            )
+            WebsiteEvidence.objects.create(lead=lead, evidence_type="tech_fingerprint", payload={"cms": cms})
+            if index != 1:
+                WebsiteEvidence.objects.create(lead=lead, evidence_type="sitemap_xml", payload={"exists": index == 0})
+                lead.contacts.create(email=f"owner{index}@batch.example")
+            report = WebsiteReport.objects.create(
+                lead=lead,
+                model="rules",
+                prompt_version="v1",
+                report={"cta_clarity": ["clear", "weak", "missing"][index], "site_type": "chain"},
+            )
+            pairs.append((lead, report if index != 2 else None))
+
+        expected = [compute_lead_score(lead=lead, report_obj=report) for lead, report in pairs]
+        with CaptureQueriesContext(connection) as queries:
+            results = compute_lead_scores(pairs)
+        self.assertEqual(results, expected)
+        self.assertEqual(len(queries), 3)
+
+        # Once materialized, the evidence payloads are not read at all.
+        for lead, _report in pairs:
+            build_lead_features(lead)
+        self.assertEqual([compute_lead_score(lead=lead, report_obj=report) for lead, report in pairs], expected)
+        with CaptureQueriesContext(connection) as queries:
+            results = compute_lead_scores(pairs)
+        self.assertEqual(results, expected)
+        self.assertEqual(len(queries), 2)
+
+    def _scored_lead_fixture(self, index):
+        lead = Lead.objects.create(
+            company_name=f"Bulk {index}",
+            website_url=f"https://bulk-{index}.example",
+            industry=["legal", "dentist", "retail"][index % 3],
+            status="reported",
+        )
+        persist_evidence_items(
+            lead=lead,
+            items=[
+                {"evidence_type": "pagespeed_json", "payload": {"performance_score": (index % 10) / 10}},
+                {"evidence_type": "tech_fingerprint", "payload": {"cms": ["wix", "custom"][index % 2]}},
+            ],
+        )
+        if index % 2:
+            lead.contacts.create(email=f"owner@bulk-{index}.example")
+        report_payload = {"cta_clarity": ["clear", "weak", "moderate"][index % 3]}
+        if index % 4 == 3:
+            # Reports written outside upsert_report are found through the newest-report fallback.
+            return lead, WebsiteReport.objects.create(lead=lead, model="rules", prompt_version="v1", report=report_payload)
+        report, _created = upsert_report(
+            lead=lead,
+            report_payload=report_payload,
+            evidence_ids=[],
+            model="rules",
+            prompt_version="v1",
+        )
+        return lead, report
+
+    def test_bulk_upsert_lead_scores_matches_upsert_with_constant_queries(self):
+        fixtures = [self._scored_lead_fixture(index) for index in range(12)]
+        expected = {lead.pk: compute_lead_score(lead=lead, report_obj=report) for lead, report in fixtures}
+        small = Lead.objects.filter(pk__in=[lead.pk for lead, _report in fixtures[:4]]).order_by("pk")
+        large = Lead.objects.filter(pk__in=[lead.pk for lead, _report in fixtures[4:]]).order_by("pk")
+
+        with self.assertNumQueries(9):
+            small_outcomes = bulk_upsert_lead_scores(small)
+        with self.assertNumQueries(9):
+            large_outcomes = bulk_upsert_lead_scores(large)
+
+        outcomes = small_outcomes + large_outcomes
+        self.assertEqual([lead.pk for lead, _score, _created in outcomes], [lead.pk for lead, _report in fixtures])
+        for lead, score_record, created in outcomes:
+            self.assertTrue(created)
+            result = expected[lead.pk]
+            self.assertEqual(
+                (score_record.score, score_record.bucket, score_record.reason_codes, score_record.recommendation),
+                (result.score, result.bucket, result.reason_codes, result.recommendation),
+            )
+        self.assertEqual(Lead.objects.filter(status="scored").count(), 12)
+
+        out = StringIO()
+        call_command("rescore_leads", "--chunk-size", "5", stdout=out)
+        self.assertIn("scores_reused: 12", out.getvalue())
+        self.assertRegex(out.getvalue(), r"stage\[bulk_score_compute\]: count=3 p50_ms=[\d.]+")
+        rerun = bulk_upsert_lead_scores(Lead.objects.order_by("pk"))
+        self.assertEqual(LeadScore.objects.count(), 12)
+        self.assertFalse(any(created for _lead, _score, created in rerun))
+        for (lead, report), (_lead, score_record, _created) in zip(fixtures, rerun):
+            self.assertEqual(upsert_lead_score(lead=lead, report_obj=report), (score_record, False))
+
+
+class LeadFeaturesTests(TestCase):
+    def _feature_values(self, features):
+        return {
+            field.name: getattr(features, field.attname)
+            for field in LeadFeatures._meta.concrete_fields
+            if field.name not in {"id", "updated_at"}
+        }
+
+    def test_incremental_features_match_rebuild_and_json_scoring(self):
+        lead = Lead.objects.create(
+            company_name="Features Dental",
+            website_url="https://features-dental.example",
+            industry="dentist",
+        )
+        persist_evidence_items(
+            lead=lead,
+            items=[
+                {"evidence_type": "pagespeed_json", "payload": {"performance_score": 0.55, "lcp_ms": 3400}},
+                {"evidence_type": "tech_fingerprint", "payload": {"cms": "WordPress"}},
+                {"evidence_type": "sitemap_xml", "payload": {"exists": False, "status_code": 404}},
+            ],
+        )
+        persist_evidence_items(
+            lead=lead,
+            items=[
+                {"evidence_type": "pagespeed_json", "payload": {"performance_score": 0.92}},
+                {"evidence_type": "tech_fingerprint", "payload": {"cms": "wix"}},
+            ],
+        )
+        report, _created = upsert_report(
+            lead=lead,
+            report_payload={
+                "site_type": "chain",
+                "cta_clarity": "weak",
+                "trust": {"rating": "strong"},
+                "performance": {"score": 80},
+            },
+            evidence_ids=list(lead.website_evidence.values_list("id", flat=True)),
+            model="rules",
+            prompt_version="v1",
+        )
+
+        features = LeadFeatures.objects.get(lead=lead)
+        self.assertEqual(features.perf_score, 92.0)
+        self.assertEqual(features.lcp_ms, 3400.0)
+        self.assertEqual(features.cms_value, "wordpress")
+        self.assertTrue(features.sitemap_marked_missing)
+        self.assertEqual(features.report_id, report.id)
+        self.assertEqual((features.site_type, features.cta_clarity, features.trust_rating), ("chain", "weak", "strong"))
+        self.assertEqual(
+            list(Lead.objects.filter(features__site_type="chain", features__perf_score__gte=90)),
+            [lead],
+        )
+
+        incremental = self._feature_values(features)
+        self.assertEqual(self._feature_values(build_lead_features(lead)), incremental)
+
+        with CaptureQueriesContext(connection) as queries:
+            result = compute_lead_score(lead=lead, report_obj=report)
+        self.assertFalse(any("growth_ops_websiteevidence" in query["sql"] for query in queries))
+        json_features = extract_score_features(
+            lead=lead,
+            report_obj=report,
+            evidence=lead.website_evidence.order_by("-created_at", "-id"),
+            has_contact_email=False,
+        )
+        self.assertEqual(result, score_from_features(json_features))
+
+    def test_run_growth_v3_takes_report_from_features_or_newest_report(self):
+        featured = Lead.objects.create(company_name="Featured Gym", website_url="https://featured-gym.example")
+        unmaterialized = Lead.objects.create(company_name="Legacy Gym", website_url="https://legacy-gym.example")
+        report, _created = upsert_report(
+            lead=featured,
+            report_payload={"cta_clarity": "weak"},
+            evidence_ids=[],
+            model="rules",
+            prompt_version="v1",
+        )
+        # Written behind the features' back: the features row still points at `report`.
+        WebsiteReport.objects.create(lead=featured, model="rules", prompt_version="v1", report={"stale": True})
+        WebsiteReport.objects.create(lead=unmaterialized, model="rules", prompt_version="v1", report={})
+        legacy_report = WebsiteReport.objects.create(lead=unmaterialized, model="rules", prompt_version="v2", report={})
+        LeadScore.objects.create(lead=featured, score=90, bucket="A")
+        LeadScore.objects.create(lead=unmaterialized, score=80, bucket="A")
+
+        outreach_result = {"decision": {"priority": "high"}, "draft_created": False, "draft_reused": False}
+
+        def timed_outreach(lead, **options):
+            with stage_timer("email_build"):
+                return outreach_result
+
+        out = StringIO()
+        with patch(
+            "growth_ops.management.commands.run_growth_v3.run_outreach_for_lead",
+            side_effect=timed_outreach,
+        ) as run_outreach:
+            call_command("run_growth_v3", stdout=out)
+
+        self.assertEqual(
+            run_outreach.call_args_list,
+            [
+                call(featured, force=False, report_obj=report),
+                call(unmaterialized, force=False, report_obj=legacy_report),
+            ],
+        )
+        self.assertRegex(out.getvalue(), r"stage\[email_build\]: count=2 p50_ms=[\d.]+")
@@ -5,6 +5,8 @@ from .views import (
     DraftCreateView,
     DraftApproveView,
     DraftRejectView,
+    EvidenceBulkIngestView,
+    EvidenceChangesView,
     EvidenceIngestView,
     LeadUpsertView,
     OutboundQueueView,
@@ -19,6 +21,8 @@ app_name = "growth_ops"
 urlpatterns = [
     path("leads/upsert", LeadUpsertView.as_view(), name="leads-upsert"),
     path("evidence", EvidenceIngestView.as_view(), name="evidence-ingest"),
+    path("evidence/bulk", EvidenceBulkIngestView.as_view(), name="evidence-bulk-ingest"),
+    path("evidence/changes", EvidenceChangesView.as_view(), name="evidence-changes"),
     path("reports", ReportPersistView.as_view(), name="reports-persist"),
     path("scores", ScorePersistView.as_view(), name="scores-persist"),
     path("drafts", DraftCreateView.as_view(), name="drafts-create"),
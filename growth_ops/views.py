@@ -12,6 +12,8 @@ from .models import Contact, ContentItem, InboxMessage, Lead, OutboundDraft, Web
 from .serializers import (
     ContentQueueSerializer,
     DraftCreateRequestSerializer,
+    EvidenceBulkIngestRequestSerializer,
+    EvidenceChangeLogSerializer,
     EvidenceIngestRequestSerializer,
     LeadScoreSerializer,
     LeadSerializer,
@@ -27,7 +29,9 @@ from .serializers import (
 from .services.llm_gateway import LLMGatewayError
 from .services.outreach import LeadNotDraftableError, OutreachDraftingError, create_outbound_draft
 from .services.sending import DraftSendError, send_approved_draft
+from .services.evidence_changes import evidence_changes_since
 from .services.evidence_ingest import (
+    persist_evidence_batch,
     persist_evidence_items,
     resolve_lead_for_evidence,
     technical_data_to_evidence_items,
@@ -119,6 +123,76 @@ class EvidenceIngestView(N8NProtectedAPIView):
         )
 
 
+class EvidenceBulkIngestView(N8NProtectedAPIView):
+    def post(self, request):
+        serializer = EvidenceBulkIngestRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = []
+        valid_groups = []
+        for index, group in enumerate(serializer.validated_data["groups"]):
+            group_serializer = EvidenceIngestRequestSerializer(data=group)
+            if group_serializer.is_valid():
+                valid_groups.append((index, dict(group_serializer.validated_data)))
+                results.append(None)
+            else:
+                results.append({"index": index, "error": "invalid_group", "details": group_serializer.errors})
+
+        if valid_groups:
+            batch_results = persist_evidence_batch([group for _index, group in valid_groups])
+            for (index, _group), result in zip(valid_groups, batch_results):
+                results[index] = {**result, "index": index}
+
+        failed = [result for result in results if result and "error" in result]
+        created_count = sum(int(result.get("created_count", 0)) for result in results if result)
+        response_payload = {
+            "groups_received": len(results),
+            "groups_succeeded": len(results) - len(failed),
+            "groups_failed": len(failed),
+            "created_count": created_count,
+            "reused_count": sum(int(result.get("reused_count", 0)) for result in results if result),
+            "results": results,
+        }
+        if len(failed) == len(results):
+            return Response(response_payload, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            response_payload,
+            status=status.HTTP_201_CREATED if created_count else status.HTTP_200_OK,
+        )
+
+
+class EvidenceChangesView(N8NProtectedAPIView):
+    """Cursor-paginated evidence change feed: pass the returned `next_cursor` back as `cursor`."""
+
+    def get(self, request):
+        raw_cursor = request.query_params.get("cursor", "0")
+        try:
+            cursor = int(raw_cursor)
+        except ValueError:
+            return Response({"error": "invalid_cursor"}, status=status.HTTP_400_BAD_REQUEST)
+        if cursor < 0:
+            return Response({"error": "invalid_cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        limit = _limit_from_request(request, default=100)
+        evidence_types = [value for value in request.query_params.getlist("evidence_type") if value]
+        changed_only = request.query_params.get("changed_only", "").lower() in {"1", "true", "yes"}
+        queryset = evidence_changes_since(cursor, evidence_types=evidence_types, changed_only=changed_only)
+        # One extra row tells whether another page exists without a COUNT query.
+        entries = list(queryset[: limit + 1])
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        return Response(
+            {
+                "cursor": cursor,
+                "next_cursor": entries[-1].id if entries else cursor,
+                "has_more": has_more,
+                "limit": limit,
+                "results": EvidenceChangeLogSerializer(entries, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class ReportPersistView(N8NProtectedAPIView):
     @transaction.atomic
     def post(self, request):
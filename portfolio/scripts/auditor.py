@@ -37,6 +37,19 @@ def _ollama_timeout():
         return 120
 
 
+def _host_circuit_breaker():
+    """Shared growth_ops per-host circuit breaker, or None when running standalone."""
+    try:
+        from django.apps import apps
+
+        if not apps.ready:
+            return None
+        from growth_ops.services.circuit_breaker import circuit_breaker
+    except ImportError:
+        return None
+    return circuit_breaker
+
+
 class SiteAuditor:
     def __init__(self, url):
         self.url = url
@@ -60,12 +73,16 @@ class SiteAuditor:
         except Exception as exc:
             return {"error": str(exc), "status": "Error"}
 
-    def run_lighthouse(self):
+    def run_lighthouse(self, force_refresh=False):
         """Runs audit via Google PageSpeed Insights API."""
         api_key = os.getenv("GOOGLE_PAGESPEED_KEY")
         if not api_key:
             return {"error": "Missing GOOGLE_PAGESPEED_KEY in environment"}
 
+        cached_result = self._run_lighthouse_cached(api_key, force_refresh)
+        if cached_result is not None:
+            return cached_result
+
         endpoint = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
         params = {
             "url": self.url,
@@ -92,6 +109,36 @@ class SiteAuditor:
         except Exception as exc:
             return {"error": f"Audit failed: {exc}"}
 
+    def _run_lighthouse_cached(self, api_key, force_refresh):
+        """
+        Serve PageSpeed data through the shared growth_ops cache when Django is set up.
+        Returns None when running standalone so the direct API call is used instead.
+        """
+        try:
+            from django.apps import apps
+
+            if not apps.ready:
+                return None
+            from growth_ops.services.evidence_fetcher import fetch_pagespeed
+        except ImportError:
+            return None
+
+        payload = fetch_pagespeed(self.url, force_refresh=force_refresh, api_key=api_key, timeout=120)
+        error = payload.get("error")
+        if error == "pagespeed_http_error":
+            return {"error": f"Google API failed: {payload.get('status_code')}"}
+        if error:
+            return {"error": f"Audit failed: {payload.get('error_detail') or error}"}
+
+        raw = payload.get("raw") or {}
+        categories = (raw.get("lighthouseResult") or {}).get("categories") or {}
+        return {
+            "performance_score": int(((categories.get("performance") or {}).get("score") or 0) * 100),
+            "accessibility_score": int(((categories.get("accessibility") or {}).get("score") or 0) * 100),
+            "seo_score": int(((categories.get("seo") or {}).get("score") or 0) * 100),
+            "core_web_vitals": (raw.get("loadingExperience") or {}).get("overall_category") or "Unavailable",
+        }
+
     def check_page_health(self):
         """Scrapes homepage for broken links and key metadata."""
         try:
@@ -113,10 +160,13 @@ class SiteAuditor:
                     internal_links.append(full_url)
 
             broken_links = []
+            unchecked_links = 0
             with ThreadPoolExecutor(max_workers=8) as executor:
                 results = executor.map(self._check_link_status, internal_links[:20])
                 for link, status in results:
-                    if status >= 400:
+                    if status is None:
+                        unchecked_links += 1
+                    elif status >= 400:
                         broken_links.append(link)
 
             return {
@@ -126,16 +176,25 @@ class SiteAuditor:
                 "mobile_viewport": "Missing (Critical for Mobile)" if not viewport else "Good",
                 "broken_links_found": len(broken_links),
                 "broken_link_examples": broken_links[:3],
+                "links_skipped_circuit_open": unchecked_links,
             }
         except Exception as exc:
             return {"error": f"Crawl failed: {exc}"}
 
     def _check_link_status(self, url):
+        """Return `(url, status)`; status is None when the host's circuit is open and no request was sent."""
+        breaker = _host_circuit_breaker()
+        if breaker is not None and not breaker.allow(url):
+            return url, None
         try:
             response = requests.head(url, headers=HEADERS, timeout=5, allow_redirects=True)
-            return url, response.status_code
-        except Exception:
+        except Exception as exc:
+            if breaker is not None:
+                breaker.record_exception(url, exc)
             return url, 500
+        if breaker is not None:
+            breaker.record_success(url)
+        return url, response.status_code
 
     def _generate_with_ollama(self, prompt):
         payload = {